@@ -0,0 +1,111 @@
+"""
+Measure the memory used by the crawlers created by a glob.
+
+By default the crawlers are created in memory (as a glob would do) under a directory
+crawler without touching the file system for each frame. Use --onDisk to create
+the files and run a real glob instead (recommended for a smaller number of crawlers).
+
+Usage:
+    upython benchmarks/crawlerMemoryBenchmark.py --crawlers 1000000
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+
+# Add centipede source code to python path
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "src", "lib"))
+
+from centipede.Crawler.Fs import FsPath  # noqa: E402
+
+def createCrawlers(rootPath, total, framesPerSequence):
+    """
+    Create the frame crawlers under a directory crawler per sequence.
+    """
+    rootCrawler = FsPath.createFromPath(rootPath)
+    rootCrawler.setVar('job', 'RND', True)
+
+    result = []
+    for index in range(0, total, framesPerSequence):
+        sequenceName = "SHT{:06d}".format(index // framesPerSequence)
+        sequencePath = os.path.join(rootPath, sequenceName)
+        sequenceCrawler = FsPath.createFromPath(sequencePath, 'directory', rootCrawler)
+        result.append(sequenceCrawler)
+
+        for frame in range(1001, 1001 + min(framesPerSequence, total - index)):
+            filePath = os.path.join(sequencePath, "{}_plate.{}.exr".format(sequenceName, frame))
+            result.append(FsPath.createFromPath(filePath, 'exr', sequenceCrawler))
+
+    return result
+
+def createFiles(rootPath, total, framesPerSequence):
+    """
+    Create the frame files on disk.
+    """
+    for index in range(0, total, framesPerSequence):
+        sequenceName = "SHT{:06d}".format(index // framesPerSequence)
+        sequencePath = os.path.join(rootPath, sequenceName)
+        os.makedirs(sequencePath)
+
+        for frame in range(1001, 1001 + min(framesPerSequence, total - index)):
+            open(os.path.join(sequencePath, "{}_plate.{}.exr".format(sequenceName, frame)), 'a').close()
+
+
+# command-line interface
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    '--crawlers',
+    type=int,
+    default=1000000,
+    help='number of frame crawlers'
+)
+
+parser.add_argument(
+    '--frames',
+    type=int,
+    default=1000,
+    help='number of frames per sequence directory'
+)
+
+parser.add_argument(
+    '--onDisk',
+    action='store_true',
+    help='create the files and glob them from disk'
+)
+
+# executing it
+if __name__ == "__main__":
+    args = parser.parse_args()
+    rootPath = tempfile.mkdtemp()
+
+    try:
+        if args.onDisk:
+            createFiles(rootPath, args.crawlers, args.frames)
+
+        tracemalloc.start()
+        startTime = time.time()
+
+        if args.onDisk:
+            crawlers = FsPath.createFromPath(rootPath).glob()
+        else:
+            crawlers = createCrawlers(rootPath, args.crawlers, args.frames)
+
+        elapsedTime = time.time() - startTime
+        currentMemory, peakMemory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        sys.stdout.write(
+            "crawlers: {}\ntime: {:.3f}s\nmemory: {:.1f}MB (peak {:.1f}MB)\nbytes per crawler: {:.0f}\n".format(
+                len(crawlers),
+                elapsedTime,
+                currentMemory / (1024.0 * 1024.0),
+                peakMemory / (1024.0 * 1024.0),
+                float(currentMemory) / max(len(crawlers), 1)
+            )
+        )
+    finally:
+        shutil.rmtree(rootPath)
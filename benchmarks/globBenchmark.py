@@ -0,0 +1,114 @@
+"""
+Compare the crawler walker against the recursive glob on a synthetic tree.
+
+Usage:
+    upython benchmarks/globBenchmark.py --shots 50 --frames 200 --workers 1 8 16
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add centipede source code to python path
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "src", "lib"))
+
+from centipede.Crawler import Crawler, CrawlerWalker  # noqa: E402
+from centipede.Crawler.Fs import FsPath  # noqa: E402
+from centipede.PathHolder import PathHolder  # noqa: E402
+
+def createSyntheticTree(rootPath, shots, frames):
+    """
+    Create a synthetic plate/render tree containing empty frame files.
+    """
+    for shotIndex in range(shots):
+        shot = "SHT{:04d}".format(shotIndex)
+        for element in ["plate", "render", "comp"]:
+            elementPath = os.path.join(rootPath, shot, element, "1920x1080")
+            os.makedirs(elementPath)
+            for frame in range(1001, 1001 + frames):
+                open(os.path.join(elementPath, "{}_{}.{}.exr".format(shot, element, frame)), 'a').close()
+
+def recursiveGlob(crawler):
+    """
+    Collect the crawlers recursively by listing each directory through os.listdir (previous implementation).
+    """
+    result = [crawler]
+    if not crawler.isLeaf():
+        currentPath = crawler.pathHolder().path()
+        for childFile in os.listdir(currentPath):
+            childCrawler = Crawler.create(PathHolder(os.path.join(currentPath, childFile)), crawler)
+            result += recursiveGlob(childCrawler)
+
+    return result
+
+def timeIt(label, callable):
+    """
+    Run the callable printing how long it took.
+    """
+    startTime = time.time()
+    result = callable()
+    sys.stdout.write("{:<30} {:>8.3f}s ({} crawlers)\n".format(label, time.time() - startTime, len(result)))
+
+    return result
+
+
+# command-line interface
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    '--shots',
+    type=int,
+    default=20,
+    help='number of shots in the synthetic tree'
+)
+
+parser.add_argument(
+    '--frames',
+    type=int,
+    default=100,
+    help='number of frames per element'
+)
+
+parser.add_argument(
+    '--workers',
+    type=int,
+    nargs='+',
+    default=[1, 4, 8, 16],
+    help='number of workers used by the crawler walker'
+)
+
+parser.add_argument(
+    '--path',
+    type=str,
+    default='',
+    help='existing directory used instead of a synthetic tree (for instance a nfs mount)'
+)
+
+# executing it
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    rootPath = args.path
+    if not rootPath:
+        rootPath = tempfile.mkdtemp()
+        createSyntheticTree(rootPath, args.shots, args.frames)
+
+    try:
+        expected = timeIt(
+            "recursive (listdir)",
+            lambda: recursiveGlob(FsPath.createFromPath(rootPath))
+        )
+
+        for workers in args.workers:
+            result = timeIt(
+                "walker ({} workers)".format(workers),
+                lambda: list(CrawlerWalker(workers).walk(FsPath.createFromPath(rootPath)))
+            )
+
+            assert sorted(map(lambda x: x.var('filePath'), result)) == \
+                sorted(map(lambda x: x.var('filePath'), expected)), "Walker result does not match!"
+    finally:
+        if not args.path:
+            shutil.rmtree(rootPath)
@@ -0,0 +1,130 @@
+"""
+Measure the time spent resolving target templates for frame crawlers.
+
+The crawlers are created in memory (as a glob would do) under a directory
+crawler without touching the file system for each frame. The compiled template
+engine is compared against the previous implementation (reproduced here) that
+parsed the input string on every call, and against the batch evaluation
+(Template.valuesFromCrawlers).
+
+Usage:
+    upython benchmarks/templateBenchmark.py --crawlers 100000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add centipede source code to python path
+sys.path.insert(1, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "src", "lib"))
+
+from centipede.Crawler.Fs import FsPath  # noqa: E402
+from centipede.Template import Template  # noqa: E402
+from centipede.TemplateProcedure import TemplateProcedure  # noqa: E402
+
+def createCrawlers(rootPath, total, framesPerSequence):
+    """
+    Create the frame crawlers under a directory crawler per sequence.
+    """
+    rootCrawler = FsPath.createFromPath(rootPath)
+    rootCrawler.setVar('job', 'RND', True)
+
+    result = []
+    for index in range(0, total, framesPerSequence):
+        sequenceName = "SHT{:06d}".format(index // framesPerSequence)
+        sequencePath = os.path.join(rootPath, sequenceName)
+        sequenceCrawler = FsPath.createFromPath(sequencePath, 'directory', rootCrawler)
+
+        for frame in range(1001, 1001 + min(framesPerSequence, total - index)):
+            filePath = os.path.join(sequencePath, "{}_plate.{}.exr".format(sequenceName, frame))
+            result.append(FsPath.createFromPath(filePath, 'exr', sequenceCrawler))
+
+    return result
+
+def legacyValue(inputString, vars, procedureValueCache):
+    """
+    Resolve the template by parsing the input string (previous implementation without escaping).
+    """
+    resolvedTemplate = inputString
+    for varName, varValue in vars.items():
+        resolvedTemplate = resolvedTemplate.replace('{' + varName + '}', varValue)
+
+    finalResolvedTemplate = ""
+    for templatePart in resolvedTemplate.split("("):
+        endIndex = templatePart.find(')')
+        if endIndex != -1:
+            rawTemplateProcedure = templatePart[:endIndex].replace(
+                "<parent>",
+                finalResolvedTemplate.replace("/!", "/")
+            )
+            if rawTemplateProcedure not in procedureValueCache:
+                procedureValueCache[rawTemplateProcedure] = TemplateProcedure.parseRun(rawTemplateProcedure)
+
+            finalResolvedTemplate += procedureValueCache[rawTemplateProcedure] + templatePart[endIndex + 1:]
+        else:
+            finalResolvedTemplate += templatePart
+
+    return finalResolvedTemplate
+
+def timeIt(label, callable):
+    """
+    Run the callable printing how long it took.
+    """
+    startTime = time.time()
+    result = callable()
+    sys.stdout.write("{:<30} {:>8.3f}s ({} values)\n".format(label, time.time() - startTime, len(result)))
+
+    return result
+
+
+# command-line interface
+parser = argparse.ArgumentParser()
+
+parser.add_argument(
+    '--crawlers',
+    type=int,
+    default=100000,
+    help='number of frame crawlers'
+)
+
+parser.add_argument(
+    '--frames',
+    type=int,
+    default=1000,
+    help='number of frames per sequence directory'
+)
+
+parser.add_argument(
+    '--template',
+    type=str,
+    default='/jobs/{job}/(dirname {filePath})/render/{name}.(pad {frame} 6).{ext}',
+    help='target template resolved for each crawler'
+)
+
+# executing it
+if __name__ == "__main__":
+    args = parser.parse_args()
+    crawlers = createCrawlers(tempfile.gettempdir(), args.crawlers, args.frames)
+    template = Template(args.template)
+
+    def runLegacy():
+        """
+        Resolve the template for all crawlers through the previous implementation.
+        """
+        procedureValueCache = {}
+        result = []
+        for crawler in crawlers:
+            vars = {}
+            for varName in template.varNames():
+                vars[varName] = str(crawler.var(varName))
+            result.append(legacyValue(args.template, vars, procedureValueCache))
+
+        return result
+
+    expected = timeIt("legacy", runLegacy)
+    result = timeIt("compiled", lambda: list(map(template.valueFromCrawler, crawlers)))
+    assert result == expected, "Compiled result does not match!"
+
+    result = timeIt("compiled (batch)", lambda: template.valuesFromCrawlers(crawlers))
+    assert result == expected, "Batch result does not match!"
@@ -8,6 +8,7 @@ import subprocess
 import centipede
 from centipede.Dispatcher import Dispatcher
 from centipede.Crawler import Crawler
+from centipede.CrawlerQueryPlanner import CrawlerQueryPlanner
 from collections import OrderedDict
 from PySide2 import QtCore, QtGui, QtWidgets
 
@@ -23,6 +24,7 @@ class CentipedeApp(QtWidgets.QApplication):
 
     __viewModes = ["group", "flat"]
     __runOnTheFarm = os.environ.get('CENTIPEDEAPP_RUN_FARM', '0')
+    __useCrawlIndex = os.environ.get('CENTIPEDEAPP_CRAWL_INDEX', '0')
 
     def __init__(self, argv, **kwargs):
         """
@@ -31,6 +33,13 @@ class CentipedeApp(QtWidgets.QApplication):
         super(CentipedeApp, self).__init__(argv, **kwargs)
 
         self.__configurationDirectory = ""
+
+        # opt-in persistent index used to restore the directories that have
+        # not been modified since the last time they were crawled
+        self.__crawlIndex = None
+        if self.__useCrawlIndex.lower() in ["true", "1"]:
+            self.__crawlIndex = centipede.Crawler.Fs.CrawlIndex()
+
         self.__applyStyleSheet()
         self.__uiHintSourceColumns = []
         self.__buildWidgets()
@@ -187,11 +196,17 @@ class CentipedeApp(QtWidgets.QApplication):
         crawlerList = []
         for pathItem in path.split(';'):
             crawler = centipede.Crawler.Fs.FsPath.createFromPath(pathItem)
-            crawlerList += crawler.glob(filterTypes)
 
-        # in centipede interface we don't care about directory crawlers
-        # TODO: we need to have a better way to get rid of directory crawlers
-        crawlerList = list(filter(lambda x: not isinstance(x, centipede.Crawler.Fs.Directory), crawlerList))
+            if self.__crawlIndex is not None:
+                childCrawlers = self.__crawlIndex.iglob(crawler, filterTypes)
+            else:
+                childCrawlers = crawler.iglob(filterTypes)
+
+            # in centipede interface we don't care about directory crawlers
+            # TODO: we need to have a better way to get rid of directory crawlers
+            for childCrawler in childCrawlers:
+                if not isinstance(childCrawler, centipede.Crawler.Fs.Directory):
+                    crawlerList.append(childCrawler)
 
         # sorting result by name
         crawlerList.sort(key=lambda x: x.var('name').lower())
@@ -313,10 +328,16 @@ class CentipedeApp(QtWidgets.QApplication):
 
         self.__targetTree.clear()
 
-        for taskHolder in self.__taskHolders:
+        # matching the crawlers for all task holders in a single pass
+        crawlerQueryPlanner = CrawlerQueryPlanner(
+            map(lambda x: x.crawlerMatcher(), self.__taskHolders)
+        )
+        candidateCrawlers = crawlerQueryPlanner.plan(visibleCrawlers)
+
+        for taskHolder, taskHolderCrawlers in zip(self.__taskHolders, candidateCrawlers):
 
             try:
-                matchedCrawlers = taskHolder.query(visibleCrawlers)
+                matchedCrawlers = taskHolder.query(taskHolderCrawlers)
             except Exception as error:
                 QtWidgets.QMessageBox.critical(
                     self.__main,
@@ -768,9 +789,18 @@ class CentipedeApp(QtWidgets.QApplication):
                     for varName, varValue in overrides[filePath].items():
                         crawler.setVar(varName, varValue)
 
+        crawlerQueryPlanner = CrawlerQueryPlanner(
+            map(lambda x: x.crawlerMatcher(), self.__taskHolders)
+        )
+
         try:
             for crawlersGroup in Crawler.group(visibleCrawlers):
-                for taskHolder in self.__taskHolders:
+                candidateCrawlers = crawlerQueryPlanner.plan(crawlersGroup)
+                for taskHolder, taskHolderCrawlers in zip(self.__taskHolders, candidateCrawlers):
+
+                    # nothing to be executed by the task holder
+                    if not taskHolderCrawlers:
+                        continue
 
                     # run on the farm
                     if self.__runOnTheFarmCheckbox.checkState() == QtCore.Qt.Checked:
@@ -783,12 +813,12 @@ class CentipedeApp(QtWidgets.QApplication):
                         label += ": "
                         label += crawlersGroup[0].tag('group') if 'group' in crawlersGroup[0].tagNames() else crawlersGroup[0].var('baseName')
                         renderFarmDispatcher.setOption('label', label)
-                        renderFarmDispatcher.dispatch(taskHolder, crawlersGroup)
+                        renderFarmDispatcher.dispatch(taskHolder, taskHolderCrawlers)
 
                     # run locally
                     else:
                         localDispatcher = Dispatcher.create('local')
-                        localDispatcher.dispatch(taskHolder, crawlersGroup)
+                        localDispatcher.dispatch(taskHolder, taskHolderCrawlers)
 
         except Exception as err:
             QtWidgets.QMessageBox.critical(
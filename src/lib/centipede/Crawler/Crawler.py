@@ -1,6 +1,12 @@
 import os
+import copy
 import json
+import threading
 from collections import OrderedDict
+from .CrawlerWalker import CrawlerWalker
+from .CrawlerGroup import CrawlerGroup
+from ..PathHolder import PathHolder
+from ..FrameRanges import FrameRanges
 
 # compatibility with python 2/3
 try:
@@ -8,6 +14,11 @@ try:
 except NameError:
     basestring = str
 
+try:
+    from sys import intern
+except ImportError:
+    pass
+
 class InvalidVarError(Exception):
     """Invalid Var Error."""
 
@@ -24,26 +35,47 @@ class CreateCrawlerError(Exception):
 class Crawler(object):
     """
     Abstracted Crawler.
+
+    The variables are stored in two layers: the variables assigned directly
+    to the crawler and the variables inherited from the parent crawler. The
+    inherited layer is a read-only snapshot that gets shared by all the children
+    of the same parent (copy-on-write), rather than being copied to each child.
     """
 
+    __slots__ = (
+        '__vars',
+        '__inheritedVars',
+        '__varsSnapshot',
+        '__tags',
+        '__contextVarNames',
+        '__globCache'
+    )
+
     __registeredTypes = OrderedDict()
+    __registryVersion = 0
+    __dispatchCache = {}
+    __dispatchStats = {}
+    __dispatchStatsLock = threading.Lock()
+
+    # shared by the crawlers without a parent (it should never be modified)
+    __noVars = {}
 
     def __init__(self, name, parentCrawler=None):
         """
         Create a crawler.
         """
         self.__vars = {}
-        self.__tags = {}
-        self.__contextVarNames = set()
+        self.__varsSnapshot = None
+        self.__tags = None
+        self.__globCache = None
 
         # passing variables
         if parentCrawler:
             assert isinstance(parentCrawler, Crawler), \
                 "Invalid crawler type!"
 
-            for varName in parentCrawler.varNames():
-                isContextVar = (varName in parentCrawler.contextVarNames())
-                self.setVar(varName, parentCrawler.var(varName), isContextVar)
+            self.__inheritedVars = parentCrawler.__snapshotVars()
+            self.__contextVarNames = parentCrawler.__contextVarNames
 
             self.setVar(
                 'fullPath',
@@ -53,10 +85,11 @@ class Crawler(object):
                 )
             )
         else:
+            self.__inheritedVars = self.__noVars
+            self.__contextVarNames = frozenset()
             self.setVar('fullPath', '/')
 
         self.setVar('name', name)
-        self.__globCache = None
 
     def isLeaf(self):
         """
@@ -81,7 +114,12 @@ class Crawler(object):
         """
         Return a list of variable names assigned to the crawler.
         """
-        return list(self.__vars.keys())
+        if not self.__inheritedVars:
+            return list(self.__vars.keys())
+
+        return list(self.__inheritedVars.keys()) + [
+            x for x in self.__vars.keys() if x not in self.__inheritedVars
+        ]
 
     def contextVarNames(self):
         """
@@ -93,41 +131,56 @@ class Crawler(object):
         """
         Set a value for a variable.
         """
+        if type(name) is str:
+            name = intern(name)
+
+        # the context var names are shared with the children (copy-on-write)
         if isContextVar:
-            self.__contextVarNames.add(name)
+            if name not in self.__contextVarNames:
+                self.__contextVarNames = self.__contextVarNames.union((name,))
         elif name in self.__contextVarNames:
-            self.__contextVarNames.remove(name)
+            self.__contextVarNames = self.__contextVarNames.difference((name,))
 
         self.__vars[name] = value
+        self.__varsSnapshot = None
 
     def var(self, name):
         """
         Return the value for a variable.
         """
-        if name not in self.__vars:
-            raise InvalidVarError(
-                'Variable not found "{0}"'.format(name)
-            )
+        if name in self.__vars:
+            return self.__vars[name]
+
+        if name in self.__inheritedVars:
+            return self.__inheritedVars[name]
 
-        return self.__vars[name]
+        raise InvalidVarError(
+            'Variable not found "{0}"'.format(name)
+        )
 
     def tagNames(self):
         """
         Return a list of tag names assigned to the crawler.
         """
-        return self.__tags.keys()
+        if self.__tags is None:
+            return []
+
+        return list(self.__tags.keys())
 
     def setTag(self, name, value):
         """
         Set a value for a tag.
         """
+        if self.__tags is None:
+            self.__tags = {}
+
         self.__tags[name] = value
 
     def tag(self, name):
         """
         Return the value for a tagiable.
         """
-        if name not in self.__tags:
+        if self.__tags is None or name not in self.__tags:
             raise InvalidTagError(
                 'Tag not found "{0}"'.format(name)
             )
@@ -137,8 +190,26 @@ class Crawler(object):
     def clone(self):
         """
         Return a cloned instance about the current crawler.
+
+        The clone is done in memory: the variables are shared with the current
+        crawler (copy-on-write) except for the list and dict values that are
+        deep copied, so they can be modified safely by the clone.
         """
-        return Crawler.createFromJson(self.toJson())
+        result = copy.copy(self)
+
+        snapshotVars = self.__snapshotVars()
+        result.__inheritedVars = snapshotVars
+        result.__varsSnapshot = None
+        result.__globCache = None
+        result.__vars = {}
+        for varName, varValue in snapshotVars.items():
+            if isinstance(varValue, (list, dict)):
+                result.__vars[varName] = copy.deepcopy(varValue)
+
+        if self.__tags is not None:
+            result.__tags = copy.deepcopy(self.__tags)
+
+        return result
 
     def toJson(self):
         """
@@ -170,21 +241,33 @@ class Crawler(object):
         Return a list of all crawlers found recursively under this path.
 
         Filter result list by crawler type (str) or class type (both include derived classes).
+        The crawlers are listed in depth-first order (for more details take a look
+        at CrawlerWalker).
         """
         if self.__globCache is None or not useCache:
             # Recursively collect all crawlers for this path
-            self.__globCache = Crawler.__collectCrawlers(self)
+            self.__globCache = list(self.iglob())
 
         if not filterTypes:
             return self.__globCache
 
-        filteredCrawlers = set()
-        for filterType in filterTypes:
-            subClasses = tuple(Crawler.registeredSubclasses(filterType))
-            filteredCrawlers.update(
-                filter(lambda x: isinstance(x, subClasses), self.__globCache)
-            )
-        return list(filteredCrawlers)
+        subClasses = Crawler.__filterTypeClasses(filterTypes)
+        return list(filter(lambda x: isinstance(x, subClasses), self.__globCache))
+
+    def iglob(self, filterTypes=[]):
+        """
+        Return a generator that yields the crawlers found recursively under this path.
+
+        Differently from glob the crawlers are yielded as soon as they are found
+        (the result is not cached), therefore the iteration can be interrupted
+        at any point without walking the rest of the hierarchy. The filter
+        works the same way as in glob.
+        """
+        subClasses = Crawler.__filterTypeClasses(filterTypes)
+
+        for crawler in CrawlerWalker().walk(self):
+            if not subClasses or isinstance(crawler, subClasses):
+                yield crawler
 
     @classmethod
     def test(cls, data, parentCrawler=None):
@@ -196,14 +279,31 @@ class Crawler(object):
         """
         raise NotImplementedError
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        For re-implementation: Return the keys about the data the crawler can handle (or None).
+
+        The keys are used by Crawler.create to only test the crawlers that can
+        possibly handle the data. Each key is a tuple (kind, ext) describing
+        path holders, where kind is either "directory" or "file" and ext is the
+        lowercase extension, "*" can be used as wildcard for both. None (default)
+        means the crawler is tested against any data.
+
+        The keys are only taken into account when they are declared by the same
+        class that implements the test (or by a derived class), otherwise a class
+        overriding the test could handle data that is not described by the keys
+        inherited from the base class.
+        """
+        return None
+
     @staticmethod
     def create(data, parentCrawler=None):
         """
         Create a crawler for the input data.
         """
         result = None
-        for registeredName in reversed(Crawler.__registeredTypes.keys()):
-            crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+        for registeredName, crawlerTypeClass in Crawler.__dispatchCandidates(data):
             passedTest = False
 
             # testing crawler
@@ -217,9 +317,12 @@ class Crawler(object):
                         str(err)
                     )
                 )
+            finally:
+                Crawler.__updateDispatchStats(registeredName, 'tests')
 
             # creating crawler
             if passedTest:
+                Crawler.__updateDispatchStats(registeredName, 'matches')
                 try:
                     result = crawlerTypeClass(data, parentCrawler)
                 except Exception as err:
@@ -239,6 +342,29 @@ class Crawler(object):
 
         return result
 
+    @staticmethod
+    def dispatchStats():
+        """
+        Return a dict with the number of tests and matches performed by Crawler.create per registered type.
+
+        Example: {'exr': {'tests': 1200, 'matches': 1000}, ...}
+        """
+        with Crawler.__dispatchStatsLock:
+            return dict(
+                map(
+                    lambda x: (x[0], dict(x[1])),
+                    Crawler.__dispatchStats.items()
+                )
+            )
+
+    @staticmethod
+    def resetDispatchStats():
+        """
+        Reset the counters returned by dispatchStats.
+        """
+        with Crawler.__dispatchStatsLock:
+            Crawler.__dispatchStats.clear()
+
     @staticmethod
     def register(name, crawlerClass):
         """
@@ -253,6 +379,19 @@ class Crawler(object):
             "Invalid crawler class!"
 
         Crawler.__registeredTypes[name] = crawlerClass
+        Crawler.__registryVersion += 1
+
+        # the candidates need to be computed again to include the new type
+        Crawler.__dispatchCache = {}
+
+    @staticmethod
+    def registryVersion():
+        """
+        Return a number that changes every time a crawler type gets registered.
+
+        It can be used to invalidate information computed from the registered types.
+        """
+        return Crawler.__registryVersion
 
     @staticmethod
     def registeredType(name):
@@ -299,51 +438,171 @@ class Crawler(object):
         Create a crawler based on the jsonContents (serialized via toJson).
         """
         contents = json.loads(jsonContents)
-        crawlerType = contents["vars"]["type"]
-        fullPath = contents["vars"]["fullPath"]
 
-        # creating crawler
-        crawler = Crawler.__registeredTypes[crawlerType](fullPath)
+        return Crawler.__createFromContents(
+            contents["vars"],
+            contents["contextVarNames"],
+            contents["tags"]
+        )
 
-        # setting vars
-        for varName, varValue in contents["vars"].items():
-            isContextVar = (varName in contents["contextVarNames"])
-            crawler.setVar(varName, varValue, isContextVar)
+    @staticmethod
+    def serializeBatch(crawlers):
+        """
+        Serialize a list of crawlers to a compact json compatible structure (it can be recovered later using createFromBatch).
 
-        # setting tags
-        for tagName, tagValue in contents["tags"].items():
-            crawler.setTag(tagName, tagValue)
+        The strings used by the crawlers (variable names, tag names and string values)
+        are stored only once in a string table shared by all crawlers. Therefore, the
+        result is considerably smaller and faster to parse than serializing each
+        crawler through toJson (most of the strings are the same across the
+        crawlers, for instance all the frames of an image sequence).
 
-        return crawler
+        Each crawler is stored as a list [vars, contextVarNames, tags], where vars and
+        tags are flat lists alternating the index of the name and the value. The string
+        values are stored as an index of the string table, while any other value is
+        stored wrapped in a list.
+        """
+        stringTable = []
+        stringIndices = {}
+
+        def __stringIndex(value):
+            if value not in stringIndices:
+                stringIndices[value] = len(stringTable)
+                stringTable.append(value)
+            return stringIndices[value]
+
+        def __encodeValue(value):
+            if isinstance(value, basestring):
+                return __stringIndex(value)
+            return [value]
+
+        serializedCrawlers = []
+        for crawler in crawlers:
+            serializedVars = []
+            for varName in crawler.varNames():
+                serializedVars.append(__stringIndex(varName))
+                serializedVars.append(__encodeValue(crawler.var(varName)))
+
+            serializedTags = []
+            for tagName in crawler.tagNames():
+                serializedTags.append(__stringIndex(tagName))
+                serializedTags.append(__encodeValue(crawler.tag(tagName)))
+
+            serializedCrawlers.append([
+                serializedVars,
+                list(map(__stringIndex, crawler.contextVarNames())),
+                serializedTags
+            ])
+
+        return {
+            "strings": stringTable,
+            "crawlers": serializedCrawlers
+        }
+
+    @staticmethod
+    def createFromBatch(batchContents):
+        """
+        Return a list of crawlers based on the batchContents (serialized via serializeBatch).
+
+        For backwards compatibility, a list of crawlers serialized through toJson is
+        also accepted.
+        """
+        if isinstance(batchContents, list):
+            return list(map(Crawler.createFromJson, batchContents))
+
+        stringTable = batchContents["strings"]
+
+        def __decodeItems(serializedItems):
+            result = OrderedDict()
+            for index in range(0, len(serializedItems), 2):
+                value = serializedItems[index + 1]
+                if isinstance(value, list):
+                    value = value[0]
+                else:
+                    value = stringTable[value]
+
+                result[stringTable[serializedItems[index]]] = value
+            return result
+
+        result = []
+        for serializedVars, serializedContextVarNames, serializedTags in batchContents["crawlers"]:
+            result.append(
+                Crawler.__createFromContents(
+                    __decodeItems(serializedVars),
+                    list(map(lambda x: stringTable[x], serializedContextVarNames)),
+                    __decodeItems(serializedTags)
+                )
+            )
+
+        return result
 
     @staticmethod
     def group(crawlers, tag='group'):
         """
         Return the crawlers grouped by the input tag.
 
-        The result is a 2D array where each group of the result is a list of crawlers
-        that contain the same tag value. The crawlers inside of the group are
-        sorted alphabetically using the path by default. If you want to do a custom
+        The result is a list of groups (CrawlerGroup) where each group contains
+        the crawlers that have the same tag value, followed by a group per crawler
+        without the tag. The crawlers inside of the group are sorted by the
+        "frame" variable when available (so sequences with inconsistent padding
+        are sorted properly), otherwise by the path. If you want to do a custom
         sorting, take a look at: Crawler.sortGroup
+
+        The crawlers are grouped in a single pass and sorted once, the groups are
+        views about a list shared by all of them (rather than copies). The frames
+        found in each group are available as a by-product through
+        CrawlerGroup.frameRanges (use CrawlerGroup.gaps to detect missing frames).
         """
-        groupedCrawlers = OrderedDict()
+        groupIndexes = {}
+        groupSizes = []
+        sortEntries = []
         uniqueCrawlers = []
         for crawler in crawlers:
-            if tag in crawler.tagNames():
+            try:
                 groupName = crawler.tag(tag)
-                if groupName not in groupedCrawlers:
-                    groupedCrawlers[groupName] = []
-                groupedCrawlers[groupName].append(crawler)
+            except InvalidTagError:
+                uniqueCrawlers.append(crawler)
+                continue
+
+            groupIndex = groupIndexes.get(groupName)
+            if groupIndex is None:
+                groupIndex = len(groupSizes)
+                groupIndexes[groupName] = groupIndex
+                groupSizes.append(0)
+            groupSizes[groupIndex] += 1
+
+            try:
+                frame = crawler.var('frame')
+            except InvalidVarError:
+                frame = None
+
+            if frame is None:
+                sortKey = (groupIndex, 1, 0, crawler.var('fullPath'))
             else:
-                uniqueCrawlers.append([crawler])
+                sortKey = (groupIndex, 0, frame, crawler.var('fullPath'))
+            sortEntries.append((sortKey, frame, crawler))
 
-        # sorting crawlers
-        groupedSorted = Crawler.sortGroup(
-            groupedCrawlers.values(),
-            key=lambda x: x.var('fullPath')
-        )
+        # sorting all the grouped crawlers at once (the groups end up contiguous)
+        sortEntries.sort(key=lambda x: x[0])
+        sortedCrawlers = list(map(lambda x: x[2], sortEntries))
+
+        result = []
+        start = 0
+        for groupSize in groupSizes:
+            frameRanges = FrameRanges()
+            for index in range(start, start + groupSize):
+                frame = sortEntries[index][1]
+                if frame is not None:
+                    frameRanges.add(frame)
+
+            result.append(
+                CrawlerGroup(sortedCrawlers, start, start + groupSize, frameRanges)
+            )
+            start += groupSize
 
-        return groupedSorted + uniqueCrawlers
+        for crawler in uniqueCrawlers:
+            result.append(CrawlerGroup([crawler]))
+
+        return result
 
     @staticmethod
     def sortGroup(crawlers, key=None, reverse=False):
@@ -355,19 +614,119 @@ class Crawler(object):
             result.append(list(sorted(group, key=key, reverse=reverse)))
         return result
 
+    def __snapshotVars(self):
+        """
+        Return a read-only dict containing all the variables of the crawler.
+
+        The snapshot is shared by the children as their inherited variables, therefore
+        it is never modified: assigning a variable invalidates the snapshot so a new
+        one gets created next time.
+        """
+        if self.__varsSnapshot is None:
+            if not self.__vars:
+                self.__varsSnapshot = self.__inheritedVars
+            else:
+                snapshot = dict(self.__inheritedVars)
+                snapshot.update(self.__vars)
+                self.__varsSnapshot = snapshot
+
+        return self.__varsSnapshot
+
     @staticmethod
-    def __collectCrawlers(crawler):
+    def __createFromContents(vars, contextVarNames, tags):
         """
-        Resursively collect crawlers.
+        Create a crawler based on the deserialized contents.
         """
-        result = []
-        result.append(crawler)
+        crawlerType = vars["type"]
+        fullPath = vars["fullPath"]
+        contextVarNames = set(contextVarNames)
 
-        if not crawler.isLeaf():
-            for childCrawler in crawler.children():
-                result += Crawler.__collectCrawlers(childCrawler)
+        # creating crawler
+        crawler = Crawler.__registeredTypes[crawlerType](fullPath)
 
-        return result
+        # setting vars
+        for varName, varValue in vars.items():
+            isContextVar = (varName in contextVarNames)
+            crawler.setVar(varName, varValue, isContextVar)
+
+        # setting tags
+        for tagName, tagValue in tags.items():
+            crawler.setTag(tagName, tagValue)
+
+        return crawler
+
+    @staticmethod
+    def __dispatchCandidates(data):
+        """
+        Return a list of (registered name, crawler class) that can possibly handle the data.
+
+        The candidates are returned in the same order they should be tested
+        (latest registrations first) and they are cached per dispatch key.
+        """
+        dispatchKey = None
+        if isinstance(data, PathHolder):
+            dispatchKey = (
+                'directory' if data.isDirectory() else 'file',
+                data.ext()
+            )
+
+        dispatchCache = Crawler.__dispatchCache
+        if dispatchKey not in dispatchCache:
+            result = []
+            for registeredName in reversed(Crawler.__registeredTypes.keys()):
+                crawlerTypeClass = Crawler.__registeredTypes[registeredName]
+                crawlerDispatchKeys = Crawler.__crawlerDispatchKeys(crawlerTypeClass)
+
+                if crawlerDispatchKeys is None or (dispatchKey is not None and any(
+                        kind in ('*', dispatchKey[0]) and ext in ('*', dispatchKey[1])
+                        for kind, ext in crawlerDispatchKeys)):
+                    result.append((registeredName, crawlerTypeClass))
+
+            dispatchCache[dispatchKey] = result
+
+        return dispatchCache[dispatchKey]
+
+    @staticmethod
+    def __crawlerDispatchKeys(crawlerClass):
+        """
+        Return the dispatch keys for the crawler class (None when the keys can't be trusted).
+        """
+        testClass = None
+        keysClass = None
+        for baseClass in crawlerClass.__mro__:
+            if testClass is None and 'test' in baseClass.__dict__:
+                testClass = baseClass
+            if keysClass is None and 'dispatchKeys' in baseClass.__dict__:
+                keysClass = baseClass
+
+        if keysClass is None or testClass is None or not issubclass(keysClass, testClass):
+            return None
+
+        return crawlerClass.dispatchKeys()
+
+    @staticmethod
+    def __updateDispatchStats(registeredName, counterName):
+        """
+        Increment the dispatch counter for the registered type.
+        """
+        with Crawler.__dispatchStatsLock:
+            if registeredName not in Crawler.__dispatchStats:
+                Crawler.__dispatchStats[registeredName] = {
+                    'tests': 0,
+                    'matches': 0
+                }
+            Crawler.__dispatchStats[registeredName][counterName] += 1
+
+    @staticmethod
+    def __filterTypeClasses(filterTypes):
+        """
+        Return a tuple containing the registered classes (including derived ones) for the filter types.
+        """
+        subClasses = set()
+        for filterType in filterTypes:
+            subClasses.update(Crawler.registeredSubclasses(filterType))
+
+        return tuple(subClasses)
 
     @staticmethod
     def __baseClass(baseClassOrTypeName):
@@ -0,0 +1,106 @@
+from ..FrameRanges import FrameRanges
+
+# compatibility with python 2/3
+try:
+    from collections.abc import Sequence
+except ImportError:
+    from collections import Sequence
+
+class CrawlerGroup(Sequence):
+    """
+    Read-only view about a group of crawlers (created by Crawler.group).
+
+    Rather than copying the crawlers, the view references a range of a list
+    that can be shared by several groups. The view supports the same read
+    operations of a list (len, indexing, slicing and iteration).
+
+    The frames of the group (crawlers containing the "frame" variable) are
+    available through frameRanges, which can be used to detect the frames
+    missing in a sequence (gaps).
+    """
+
+    def __init__(self, crawlers, start=0, end=None, frameRanges=None):
+        """
+        Create a crawler group view.
+
+        The frame ranges can be passed when they are already known, otherwise
+        they are computed on demand.
+        """
+        if end is None:
+            end = len(crawlers)
+
+        self.__crawlers = crawlers
+        self.__start = start
+        self.__end = end
+        self.__frameRanges = frameRanges
+
+    def frameRanges(self):
+        """
+        Return the frames (FrameRanges) of the crawlers in the group.
+        """
+        if self.__frameRanges is None:
+            frameRanges = FrameRanges()
+            for crawler in self:
+                if 'frame' in crawler.varNames():
+                    frameRanges.add(crawler.var('frame'))
+            self.__frameRanges = frameRanges
+
+        return self.__frameRanges
+
+    def gaps(self):
+        """
+        Return a list of (start, end) tuples (inclusive) about the frames missing in the group.
+        """
+        return self.frameRanges().gaps()
+
+    def __len__(self):
+        """
+        Return the number of crawlers in the group.
+        """
+        return self.__end - self.__start
+
+    def __getitem__(self, index):
+        """
+        Return the crawler at the index (or a list of crawlers for slices).
+        """
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError('CrawlerGroup index out of range')
+
+        return self.__crawlers[self.__start + index]
+
+    def __iter__(self):
+        """
+        Yield the crawlers in the group.
+        """
+        crawlers = self.__crawlers
+        for index in range(self.__start, self.__end):
+            yield crawlers[index]
+
+    def __eq__(self, other):
+        """
+        Return a boolean telling if the group contains the same crawlers of the other sequence.
+        """
+        if not isinstance(other, (Sequence, list)):
+            return False
+
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        """
+        Return a boolean telling if the group contains different crawlers from the other sequence.
+        """
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """
+        Return the representation of the group.
+        """
+        return 'CrawlerGroup({})'.format(list(self))
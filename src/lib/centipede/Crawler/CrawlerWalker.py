@@ -0,0 +1,120 @@
+import os
+from multiprocessing.pool import ThreadPool
+
+class CrawlerWalker(object):
+    """
+    Walks all crawlers found recursively under a crawler.
+
+    The children of the non-leaf crawlers (for instance directories) are computed
+    ahead of time through a bounded pool of worker threads, so the listing of
+    sibling crawlers happens concurrently. Regardless of the number of workers,
+    the crawlers are always returned in the same depth-first order: a crawler
+    comes right before its children.
+    """
+
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_CRAWLER_WALKER_WORKERS', 8))
+
+    # limits how many non-leaf crawlers can be computed ahead of time
+    # per worker (keeping the memory bounded on huge hierarchies)
+    __prefetchPerWorker = 4
+
+    def __init__(self, workers=None, childrenCallable=None):
+        """
+        Create a crawler walker object.
+
+        In case the number of workers is not specified it is driven by the
+        environment variable "CENTIPEDE_CRAWLER_WALKER_WORKERS" (default 8). Using
+        a single worker computes the children serially.
+
+        The children are computed through crawler.children() by default, a custom
+        callable can be provided to resolve them instead (for instance a CrawlIndex).
+        The callable receives the crawler and must return the list of its children.
+        """
+        if workers is None:
+            workers = self.__defaultWorkers
+
+        if childrenCallable is None:
+            childrenCallable = self.__crawlerChildren
+
+        self.__workers = max(int(workers), 1)
+        self.__childrenCallable = childrenCallable
+
+    def workers(self):
+        """
+        Return the number of workers used to compute the children.
+        """
+        return self.__workers
+
+    def walk(self, crawler):
+        """
+        Return a generator that yields the input crawler followed by all crawlers found recursively under it.
+        """
+        if self.workers() == 1:
+            return self.__serialWalk(crawler)
+
+        return self.__parallelWalk(crawler)
+
+    def __serialWalk(self, rootCrawler):
+        """
+        Yield the crawlers computing the children serially.
+        """
+        stack = [rootCrawler]
+        while stack:
+            crawler = stack.pop()
+            yield crawler
+
+            if not crawler.isLeaf():
+                stack.extend(reversed(self.__childrenCallable(crawler)))
+
+    def __parallelWalk(self, rootCrawler):
+        """
+        Yield the crawlers computing the children of the upcoming non-leaf crawlers in parallel.
+        """
+        pool = ThreadPool(self.workers())
+        maxPrefetched = self.workers() * self.__prefetchPerWorker
+        prefetched = {}
+
+        try:
+            stack = [rootCrawler]
+
+            # non-leaf crawlers in the same order they are going to be visited
+            # (the next one is always at the end of the list)
+            upcoming = []
+
+            while stack:
+                crawler = stack.pop()
+                yield crawler
+
+                if crawler.isLeaf():
+                    continue
+
+                if upcoming and upcoming[-1] is crawler:
+                    upcoming.pop()
+
+                if crawler in prefetched:
+                    children = prefetched.pop(crawler).get()
+                else:
+                    children = self.__childrenCallable(crawler)
+
+                stack.extend(reversed(children))
+                upcoming.extend(reversed([x for x in children if not x.isLeaf()]))
+
+                # computing the children of the next non-leaf crawlers ahead of time
+                for upcomingCrawler in reversed(upcoming):
+                    if len(prefetched) >= maxPrefetched:
+                        break
+
+                    if upcomingCrawler not in prefetched:
+                        prefetched[upcomingCrawler] = pool.apply_async(
+                            self.__childrenCallable,
+                            (upcomingCrawler,)
+                        )
+        finally:
+            pool.terminate()
+
+    @staticmethod
+    def __crawlerChildren(crawler):
+        """
+        Return the children computed by the crawler itself.
+        """
+        return crawler.children()
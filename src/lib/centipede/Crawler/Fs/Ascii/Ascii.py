@@ -5,6 +5,8 @@ class Ascii(File):
     Abstracted ascii crawler.
     """
 
+    __slots__ = ('__parsedContents',)
+
     def __init__(self, *args, **kwargs):
         """
         Create a ascii crawler.
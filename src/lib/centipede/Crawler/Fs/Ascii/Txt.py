@@ -5,6 +5,15 @@ class Txt(Ascii):
     Txt crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a txt file.
+        """
+        return [('file', 'txt')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -10,6 +10,8 @@ class Xml(Ascii):
     Xml crawler.
     """
 
+    __slots__ = ('__cache',)
+
     def __init__(self, *args, **kwargs):
         """
         Constructor.
@@ -28,6 +30,13 @@ class Xml(Ascii):
         """
         return self.__runQueryTag(tag, ignoreNameSpace)
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a xml file.
+        """
+        return [('*', 'xml')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
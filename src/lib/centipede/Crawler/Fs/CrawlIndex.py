@@ -0,0 +1,237 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from ..Crawler import Crawler
+from ..CrawlerWalker import CrawlerWalker
+from .Directory import Directory
+
+class CrawlIndex(object):
+    """
+    Persistent index about the crawlers found under directories.
+
+    The index stores the serialized children (type, vars and tags) of each
+    directory crawler alongside the modification time of the directory. When
+    the same hierarchy is crawled again only the directories that have been
+    modified since the last crawl are listed from the file system again, the
+    children of the remaining directories are restored from the index.
+
+    The index is stored in a sqlite database, the location is driven by the
+    environment variable "CENTIPEDE_CRAWLINDEX_PATH" (default:
+    ~/.cache/centipede/crawlIndex.sqlite).
+
+    The index is opt-in: the crawlers only go through it when globbed by the
+    index (for instance the centipede gui uses it when the environment variable
+    "CENTIPEDEAPP_CRAWL_INDEX" is enabled).
+
+    Keep in mind the modification time of a directory only changes when entries
+    get added, removed or renamed. Therefore, crawlers that are based on the
+    contents of the files (rather than their names) are not refreshed when a
+    file gets overwritten in place, use clear in case that is necessary.
+
+    Example:
+        crawlIndex = CrawlIndex()
+        crawlers = crawlIndex.glob(FsPath.createFromPath('/shots/SHT0010'), ['exr'])
+
+    """
+
+    __defaultIndexPath = os.environ.get(
+        'CENTIPEDE_CRAWLINDEX_PATH',
+        os.path.join(os.path.expanduser('~'), '.cache', 'centipede', 'crawlIndex.sqlite')
+    )
+
+    # directories modified within this interval (in seconds) are not stored in
+    # the index, since further modifications in the same interval may not
+    # be detected by the modification time (file systems with low resolution)
+    __racyInterval = 2.0
+
+    def __init__(self, indexPath=None):
+        """
+        Create a crawl index object.
+        """
+        if indexPath is None:
+            indexPath = self.__defaultIndexPath
+
+        self.__indexPath = indexPath
+        self.__lock = threading.RLock()
+        self.__stats = {
+            'restored': 0,
+            'listed': 0
+        }
+        self.__connection = None
+        self.__registrySignature = None
+
+    def indexPath(self):
+        """
+        Return the path for the index file.
+        """
+        return self.__indexPath
+
+    def glob(self, crawler, filterTypes=[]):
+        """
+        Return a list of all crawlers found recursively under the crawler (including itself).
+
+        The filter works the same way as in Crawler.glob.
+        """
+        return list(self.iglob(crawler, filterTypes))
+
+    def iglob(self, crawler, filterTypes=[]):
+        """
+        Return a generator that yields the crawlers found recursively under the crawler (including itself).
+
+        The filter works the same way as in Crawler.iglob.
+        """
+        subClasses = set()
+        for filterType in filterTypes:
+            subClasses.update(Crawler.registeredSubclasses(filterType))
+        subClasses = tuple(subClasses)
+
+        # crawler types may have been registered since the last glob
+        self.__registrySignature = self.__computeRegistrySignature()
+
+        try:
+            for childCrawler in CrawlerWalker(childrenCallable=self.children).walk(crawler):
+                if not subClasses or isinstance(childCrawler, subClasses):
+                    yield childCrawler
+        finally:
+            self.__commit()
+
+    def children(self, crawler):
+        """
+        Return the children of the crawler restoring them from the index when possible.
+
+        Only the children of directories are stored in the index, any other crawler
+        computes the children through crawler.children().
+        """
+        if not isinstance(crawler, Directory):
+            return crawler.children()
+
+        if self.__registrySignature is None:
+            self.__registrySignature = self.__computeRegistrySignature()
+
+        directoryPath = crawler.var('filePath')
+        signature = self.__crawlerSignature(crawler)
+        mtime = os.stat(directoryPath).st_mtime
+
+        with self.__lock:
+            row = self.__query().execute(
+                'SELECT signature, mtime, children FROM directories WHERE path = ?',
+                (directoryPath,)
+            ).fetchone()
+
+        if row is not None and row[0] == signature and row[1] == mtime:
+            result = Crawler.createFromBatch(json.loads(row[2]))
+
+            # passing the frame sequences setting to the sub directories (the
+            # same way as Directory does when computing the children)
+            if crawler.frameSequences():
+                for childCrawler in result:
+                    if isinstance(childCrawler, Directory):
+                        childCrawler.setFrameSequences(True)
+
+            with self.__lock:
+                self.__stats['restored'] += 1
+
+            return result
+
+        result = crawler.children()
+        with self.__lock:
+            self.__stats['listed'] += 1
+
+            if time.time() - mtime > self.__racyInterval:
+                self.__query().execute(
+                    'INSERT OR REPLACE INTO directories (path, signature, mtime, children) VALUES (?, ?, ?, ?)',
+                    (
+                        directoryPath,
+                        signature,
+                        mtime,
+                        json.dumps(Crawler.serializeBatch(result))
+                    )
+                )
+
+        return result
+
+    def stats(self):
+        """
+        Return a dict with the number of directories restored from the index and listed from the file system.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def clear(self):
+        """
+        Remove all the entries from the index.
+        """
+        with self.__lock:
+            self.__query().execute('DELETE FROM directories')
+            self.__commit()
+
+    def __commit(self):
+        """
+        Commit the pending modifications to the index file.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.commit()
+
+    def __query(self):
+        """
+        Return the connection to the index file (created on demand).
+        """
+        if self.__connection is None:
+            indexDirectory = os.path.dirname(self.indexPath())
+            if indexDirectory and not os.path.exists(indexDirectory):
+                os.makedirs(indexDirectory)
+
+            # the connection is shared by the workers of the crawler walker,
+            # the access to it is serialized through the lock
+            self.__connection = sqlite3.connect(
+                self.indexPath(),
+                timeout=60.0,
+                check_same_thread=False
+            )
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS directories ('
+                'path TEXT PRIMARY KEY, '
+                'signature TEXT NOT NULL, '
+                'mtime REAL NOT NULL, '
+                'children TEXT NOT NULL)'
+            )
+
+        return self.__connection
+
+    def __crawlerSignature(self, crawler):
+        """
+        Return a signature about the directory crawler.
+
+        The children inherit the variables from the directory crawler, therefore
+        the stored children are only valid for a crawler with the same contents
+        (and for the same registered crawler types). The frame sequences setting
+        is part of the signature, since it changes the kind of the children.
+        """
+        contents = json.dumps(
+            [json.loads(crawler.toJson()), crawler.frameSequences()],
+            sort_keys=True
+        )
+
+        return hashlib.sha1(
+            (self.__registrySignature + contents).encode('utf-8')
+        ).hexdigest()
+
+    @staticmethod
+    def __computeRegistrySignature():
+        """
+        Return a signature about the registered crawler types.
+        """
+        return ';'.join(
+            map(
+                lambda x: '{}={}.{}'.format(
+                    x,
+                    Crawler.registeredType(x).__module__,
+                    Crawler.registeredType(x).__name__
+                ),
+                Crawler.registeredNames()
+            )
+        )
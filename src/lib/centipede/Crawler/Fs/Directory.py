@@ -5,11 +5,27 @@ from .FsPath import FsPath
 from ...PathHolder import PathHolder
 from ..Crawler import Crawler
 
+# compatibility with python 2/3
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
 class Directory(FsPath):
     """
     Directory crawler.
+
+    By default each frame of an image sequence becomes a crawler. When frame
+    sequences are enabled (setFrameSequences) each image sequence found under
+    the directory becomes a single FrameSequence crawler instead, the setting is
+    passed to the sub directories. The default is driven by the environment
+    variable "CENTIPEDE_DIRECTORY_FRAME_SEQUENCES" (default: 0).
     """
 
+    __slots__ = ('__frameSequences',)
+
+    __defaultFrameSequences = os.environ.get('CENTIPEDE_DIRECTORY_FRAME_SEQUENCES', '0') == '1'
+
     # checking for digits as prefix separated by x or X and finishing with digits as suffix
     __resolutionRegex = '^[0-9]+[x|X][0-9]+$'
 
@@ -22,6 +38,8 @@ class Directory(FsPath):
         """
         super(Directory, self).__init__(*args, **kwargs)
 
+        self.__frameSequences = self.__defaultFrameSequences
+
         # in case the directory has a name "<width>x<height>" lets extract
         # this information and assign that to variables
         if re.match(self.__resolutionRegex, self.var('name')):
@@ -39,16 +57,73 @@ class Directory(FsPath):
         """
         return False
 
+    def frameSequences(self):
+        """
+        Return a boolean telling if image sequences are represented by a single crawler.
+        """
+        return self.__frameSequences
+
+    def setFrameSequences(self, enabled):
+        """
+        Set if image sequences are represented by a single crawler (FrameSequence).
+        """
+        self.__frameSequences = bool(enabled)
+
     def _computeChildren(self):
         """
-        Return the directory contents.
+        Return the directory contents (sorted by name).
+        """
+        childPathHolders = self.__childPathHolders(self.pathHolder().path())
+
+        if not self.frameSequences():
+            result = []
+            for childPathHolder in childPathHolders:
+                childCrawler = Crawler.create(childPathHolder, self)
+                result.append(childCrawler)
+
+            return result
+
+        result = Crawler.registeredType('frameSequence').createFromPathHolders(
+            childPathHolders,
+            self
+        )
+
+        # passing the setting to the sub directories
+        for childCrawler in result:
+            if isinstance(childCrawler, Directory):
+                childCrawler.setFrameSequences(True)
+
+        return result
+
+    @classmethod
+    def __childPathHolders(cls, currentPath):
+        """
+        Return a list of path holders about the entries found under the path.
+
+        When available the entries are listed through os.scandir, so the
+        path holders can reuse the information provided by the listing rather
+        than querying the file system again for each entry.
         """
+        if scandir is None:
+            entries = [
+                (childFile, PathHolder(os.path.join(currentPath, childFile)))
+                for childFile in os.listdir(currentPath)
+            ]
+        else:
+            entries = [
+                (dirEntry.name, PathHolder.createFromDirEntry(dirEntry))
+                for dirEntry in scandir(currentPath)
+            ]
+
+        # the order returned by the file system is arbitrary, sorting
+        # the entries to keep the result deterministic
+        entries.sort(key=lambda x: x[0])
+
         result = []
-        currentPath = self.pathHolder().path()
-        for childFile in os.listdir(currentPath):
+        for childFile, childPathHolder in entries:
 
             # skipping any file with an illegal name
-            if not re.match(self.__invalidFileNameRegex, childFile):
+            if not re.match(cls.__invalidFileNameRegex, childFile):
                 sys.stderr.write(
                     'file ignored: "{}" (invalid characters)\n'.format(
                         os.path.join(currentPath, childFile)
@@ -56,12 +131,17 @@ class Directory(FsPath):
                 )
                 continue
 
-            childPathHolder = PathHolder(os.path.join(currentPath, childFile))
-            childCrawler = Crawler.create(childPathHolder, self)
-            result.append(childCrawler)
+            result.append(childPathHolder)
 
         return result
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a directory.
+        """
+        return [('directory', '*')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
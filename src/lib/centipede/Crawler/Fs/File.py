@@ -6,6 +6,15 @@ class File(FsPath):
     File crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a file.
+        """
+        return [('file', '*')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
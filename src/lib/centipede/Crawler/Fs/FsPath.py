@@ -13,6 +13,8 @@ class FsPath(Crawler):
     Abstracted file system Path.
     """
 
+    __slots__ = ('__pathHolder',)
+
     def __init__(self, filePathOrPathHolder, parentCrawler=None):
         """
         Create a crawler (use the factory function Path.create instead).
@@ -5,6 +5,15 @@ class Dpx(Oiio):
     Dpx crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain an dpx file.
+        """
+        return [('file', 'dpx')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
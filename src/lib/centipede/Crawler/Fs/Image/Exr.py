@@ -5,6 +5,15 @@ class Exr(Oiio):
     Exr crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain an exr file.
+        """
+        return [('file', 'exr')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -0,0 +1,251 @@
+import os
+from collections import OrderedDict
+from ..File import File
+from ..FsPath import FsPath
+from .Image import Image
+from ...Crawler import Crawler
+from ....PathHolder import PathHolder
+from ....FrameRanges import FrameRanges
+
+class FrameSequence(File):
+    """
+    Image sequence represented by a single crawler.
+
+    Rather than holding a crawler per frame, the sequence holds the path
+    using the frame padding notation (for instance "plate.####.exr") and the
+    frames as a compact set of ranges (FrameRanges). The crawlers about the
+    frames are only created on demand through frameCrawlers.
+
+    Sequences are never created by the dispatch (Crawler.create), they are
+    created from the frames found by the directory crawling (take a look at
+    Directory.setFrameSequences) or explicitly through createFromCrawler.
+
+    Vars: imageType ("sequence"), name, padding, ext, frameType (the crawler
+    type of the frames), firstFrame, lastFrame and frameRanges (for instance
+    "1001-1100,1102").
+    """
+
+    __slots__ = (
+        '__frameRanges',
+        '__parentCrawler'
+    )
+
+    def __init__(self, filePathOrPathHolder, parentCrawler=None):
+        """
+        Create a frame sequence crawler.
+        """
+        super(FrameSequence, self).__init__(filePathOrPathHolder, parentCrawler)
+
+        self.__frameRanges = None
+
+        # used as parent of the frame crawlers
+        self.__parentCrawler = parentCrawler
+
+        self.setVar('category', 'image')
+        self.setVar('imageType', 'sequence')
+
+    def frameRanges(self):
+        """
+        Return the frames of the sequence (FrameRanges).
+        """
+        if self.__frameRanges is None:
+            rangesString = ''
+            if 'frameRanges' in self.varNames():
+                rangesString = self.var('frameRanges')
+            self.__frameRanges = FrameRanges.createFromString(rangesString)
+
+        return self.__frameRanges
+
+    def setFrameRanges(self, frameRanges):
+        """
+        Set the frames of the sequence (FrameRanges).
+        """
+        assert isinstance(frameRanges, FrameRanges), \
+            "Invalid FrameRanges type"
+        assert len(frameRanges), "Sequence needs at least one frame"
+
+        self.__frameRanges = frameRanges
+        self.setVar('frameRanges', frameRanges.toString())
+        self.setVar('firstFrame', frameRanges.first())
+        self.setVar('lastFrame', frameRanges.last())
+
+    def frameFilePath(self, frame):
+        """
+        Return the file path about the frame of the sequence.
+        """
+        filePath = self.var('filePath')
+        padding = self.var('padding')
+        paddingToken = '#' * padding
+        index = filePath.rfind(paddingToken)
+
+        return '{}{}{}'.format(
+            filePath[:index],
+            str(frame).zfill(padding),
+            filePath[index + padding:]
+        )
+
+    def frameCrawlers(self):
+        """
+        Return a generator that yields the crawlers about the frames of the sequence.
+
+        The crawlers are created on demand. The context variables assigned to
+        the sequence are assigned to the frames as well.
+        """
+        frameType = self.var('frameType')
+        contextVars = [(x, self.var(x)) for x in self.contextVarNames()]
+
+        for frame in self.frameRanges():
+            crawler = FsPath.createFromPath(
+                self.frameFilePath(frame),
+                frameType,
+                self.__parentCrawler
+            )
+
+            for varName, varValue in contextVars:
+                crawler.setVar(varName, varValue, True)
+
+            yield crawler
+
+    @classmethod
+    def createFromCrawler(cls, frameCrawler, frames, parentCrawler=None):
+        """
+        Create a sequence based on the crawler of one of its frames and a list of frames (integers).
+        """
+        assert isinstance(frameCrawler, Image) and frameCrawler.var('imageType') == 'sequence', \
+            "Crawler is not part of an image sequence"
+
+        prefix, frame, suffix = cls.__parseFrame(frameCrawler.var('baseName'))
+        result = cls(
+            PathHolder(
+                os.path.join(
+                    os.path.dirname(frameCrawler.var('filePath')),
+                    '{}{}{}'.format(prefix, '#' * len(frame), suffix)
+                )
+            ),
+            parentCrawler
+        )
+        result.setVar('type', 'frameSequence')
+        result.setVar('frameType', frameCrawler.var('type'))
+        result.setVar('name', frameCrawler.var('name'))
+        result.setVar('padding', frameCrawler.var('padding'))
+        result.setFrameRanges(FrameRanges(frames))
+        result.setTag('group', frameCrawler.tag('group'))
+
+        return result
+
+    @classmethod
+    def createFromPathHolders(cls, pathHolders, parentCrawler=None):
+        """
+        Return a list of crawlers where the frames of image sequences are represented by a single crawler.
+
+        Only the first frame of each sequence is dispatched (Crawler.create), the
+        remaining frames are detected from their names. The order of the path
+        holders is kept (a sequence takes the position of its first frame).
+        """
+        entries = []
+        sequences = OrderedDict()
+        for pathHolder in pathHolders:
+            parsedFrame = None
+            if not pathHolder.isDirectory():
+                parsedFrame = cls.__parseFrame(pathHolder.baseName())
+
+            if parsedFrame is None:
+                entries.append(pathHolder)
+                continue
+
+            prefix, frame, suffix = parsedFrame
+            sequenceKey = (prefix, len(frame), suffix)
+            if sequenceKey not in sequences:
+                sequences[sequenceKey] = []
+                entries.append(sequenceKey)
+            sequences[sequenceKey].append((int(frame), pathHolder))
+
+        result = []
+        for entry in entries:
+            if isinstance(entry, PathHolder):
+                result.append(Crawler.create(entry, parentCrawler))
+                continue
+
+            sequenceFrames = sequences[entry]
+            frameCrawler = Crawler.create(sequenceFrames[0][1], parentCrawler)
+
+            # the files may look like a sequence without being images
+            if isinstance(frameCrawler, Image) and frameCrawler.var('imageType') == 'sequence':
+                result.append(
+                    cls.createFromCrawler(
+                        frameCrawler,
+                        map(lambda x: x[0], sequenceFrames),
+                        parentCrawler
+                    )
+                )
+            else:
+                result.append(frameCrawler)
+                for frame, pathHolder in sequenceFrames[1:]:
+                    result.append(Crawler.create(pathHolder, parentCrawler))
+
+        return result
+
+    @classmethod
+    def frameRangesFromCrawlers(cls, crawlers):
+        """
+        Return the frames (FrameRanges) about a list of crawlers.
+
+        The list can mix sequences and crawlers about frames (containing the
+        "frame" variable), crawlers without frames are ignored.
+        """
+        result = FrameRanges()
+        for crawler in crawlers:
+            if isinstance(crawler, cls):
+                for frame in crawler.frameRanges():
+                    result.add(frame)
+            elif 'frame' in crawler.varNames():
+                result.add(crawler.var('frame'))
+
+        return result
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return empty dispatch keys, since sequences are never created by the dispatch.
+        """
+        return []
+
+    @classmethod
+    def test(cls, pathHolder, parentCrawler):
+        """
+        Return False, since sequences are never created by the dispatch.
+        """
+        return False
+
+    @staticmethod
+    def __parseFrame(baseName):
+        """
+        Return a tuple (prefix, frame, suffix) about the base name of a frame (or None when it is not a frame).
+
+        It follows the same conventions used by the Image crawler: abc.0001.ext
+        and abc_0001.ext (ambiguous sequences need at least 4 digits).
+        """
+        nameParts = baseName.split('.')
+        if len(nameParts) >= 3 and nameParts[-2].isdigit():
+            return (
+                '.'.join(nameParts[:-2]) + '.',
+                nameParts[-2],
+                '.' + nameParts[-1]
+            )
+
+        parts = nameParts[0].split('_')
+        if len(parts) > 1 and parts[-1].isdigit() and len(parts[-1]) >= 4:
+            return (
+                '_'.join(parts[:-1]) + '_',
+                parts[-1],
+                baseName[len(nameParts[0]):]
+            )
+
+        return None
+
+
+# registration
+Crawler.register(
+    'frameSequence',
+    FrameSequence
+)
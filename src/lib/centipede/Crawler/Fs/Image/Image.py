@@ -5,6 +5,8 @@ class Image(File):
     Abstracted image crawler.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create an image crawler.
@@ -0,0 +1,229 @@
+import os
+import mmap
+import struct
+import threading
+from collections import OrderedDict
+
+class ImageHeader(object):
+    """
+    Reads the resolution from the header of image files without decoding them.
+
+    Supported formats: exr, dpx, png and jpeg. Only the first bytes of the
+    file are read (jpeg files are scanned through mmap, so only the pages
+    holding the markers are loaded). In case the format is not supported or
+    the header cannot be parsed None is returned, so the caller can fall
+    back to a full image library (for instance OpenImageIO).
+
+    The results are cached in a bounded cache keyed by the path and the
+    modification time of the file, the size of the cache is driven by the
+    environment variable "CENTIPEDE_IMAGEHEADER_CACHE_SIZE" (default: 10000).
+
+    Example:
+        ImageHeader.read('/tmp/plate.1001.exr')
+        {'width': 1920, 'height': 1080}
+
+    """
+
+    __headerSize = 4096
+    __maxExrHeaderSize = 1024 * 1024
+
+    # jpeg start of frame markers (excluding DHT, JPG and DAC)
+    __jpegStartOfFrameMarkers = frozenset(
+        [0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF]
+    )
+
+    __cache = OrderedDict()
+    __cacheSize = int(os.environ.get('CENTIPEDE_IMAGEHEADER_CACHE_SIZE', 10000))
+    __cacheLock = threading.Lock()
+    __cacheStats = {
+        'hits': 0,
+        'misses': 0
+    }
+
+    @classmethod
+    def read(cls, filePath):
+        """
+        Return a dict containing the width and height of the image (or None when it cannot be read).
+        """
+        try:
+            fileStat = os.stat(filePath)
+        except OSError:
+            return None
+
+        key = (filePath, fileStat.st_mtime)
+        with cls.__cacheLock:
+            if key in cls.__cache:
+                result = cls.__cache.pop(key)
+                cls.__cache[key] = result
+                cls.__cacheStats['hits'] += 1
+                return dict(result) if result is not None else None
+            cls.__cacheStats['misses'] += 1
+
+        result = cls.__readHeader(filePath)
+
+        with cls.__cacheLock:
+            cls.__cache[key] = result
+            while len(cls.__cache) > cls.__cacheSize:
+                cls.__cache.popitem(last=False)
+
+        return dict(result) if result is not None else None
+
+    @classmethod
+    def cacheStats(cls):
+        """
+        Return a dict with the hits, misses and size of the cache.
+        """
+        with cls.__cacheLock:
+            result = dict(cls.__cacheStats)
+            result['size'] = len(cls.__cache)
+
+        return result
+
+    @classmethod
+    def clearCache(cls):
+        """
+        Remove all the entries from the cache.
+        """
+        with cls.__cacheLock:
+            cls.__cache.clear()
+            cls.__cacheStats['hits'] = 0
+            cls.__cacheStats['misses'] = 0
+
+    @classmethod
+    def __readHeader(cls, filePath):
+        """
+        Return a dict containing the width and height parsed from the header of the file.
+        """
+        try:
+            with open(filePath, 'rb') as imageFile:
+                header = imageFile.read(cls.__headerSize)
+
+                if header.startswith(b'\x76\x2f\x31\x01'):
+                    return cls.__readExr(imageFile, header)
+                elif header[:4] in (b'SDPX', b'XPDS'):
+                    return cls.__readDpx(header)
+                elif header.startswith(b'\x89PNG\r\n\x1a\n'):
+                    return cls.__readPng(header)
+                elif header.startswith(b'\xff\xd8'):
+                    return cls.__readJpeg(imageFile)
+        except (IOError, OSError, ValueError, struct.error):
+            pass
+
+        return None
+
+    @classmethod
+    def __readExr(cls, imageFile, header):
+        """
+        Return the resolution based on the display window of the (first part of the) exr file.
+        """
+        # skipping magic number and version
+        offset = 8
+        while True:
+            nameEnd = header.find(b'\x00', offset)
+            typeEnd = header.find(b'\x00', nameEnd + 1) if nameEnd != -1 else -1
+
+            # reading more data in case the attribute is not fully loaded
+            if nameEnd == -1 or typeEnd == -1 or len(header) < typeEnd + 5:
+                if len(header) >= cls.__maxExrHeaderSize:
+                    return None
+
+                data = imageFile.read(len(header))
+                if not data:
+                    return None
+                header += data
+                continue
+
+            name = header[offset:nameEnd]
+
+            # end of the header
+            if not name:
+                return None
+
+            size = struct.unpack('<i', header[typeEnd + 1:typeEnd + 5])[0]
+            valueOffset = typeEnd + 5
+            if name == b'displayWindow':
+                while len(header) < valueOffset + 16:
+                    data = imageFile.read(cls.__headerSize)
+                    if not data:
+                        return None
+                    header += data
+
+                xMin, yMin, xMax, yMax = struct.unpack('<4i', header[valueOffset:valueOffset + 16])
+                return {
+                    'width': xMax - xMin + 1,
+                    'height': yMax - yMin + 1
+                }
+
+            offset = valueOffset + size
+
+    @staticmethod
+    def __readDpx(header):
+        """
+        Return the resolution from the image information header of the dpx file.
+        """
+        endian = '>' if header[:4] == b'SDPX' else '<'
+        width, height = struct.unpack(endian + '2I', header[772:780])
+
+        return {
+            'width': width,
+            'height': height
+        }
+
+    @staticmethod
+    def __readPng(header):
+        """
+        Return the resolution from the IHDR chunk of the png file.
+        """
+        if header[12:16] != b'IHDR':
+            return None
+
+        width, height = struct.unpack('>2I', header[16:24])
+
+        return {
+            'width': width,
+            'height': height
+        }
+
+    @classmethod
+    def __readJpeg(cls, imageFile):
+        """
+        Return the resolution from the start of frame segment of the jpeg file.
+        """
+        data = mmap.mmap(imageFile.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # skipping the start of image marker
+            offset = 2
+            size = len(data)
+            while offset + 4 <= size:
+                if data[offset:offset + 1] != b'\xff':
+                    return None
+
+                marker = ord(data[offset + 1:offset + 2])
+
+                # fill bytes
+                if marker == 0xFF:
+                    offset += 1
+                    continue
+
+                # markers without a segment
+                if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                    offset += 2
+                    continue
+
+                # start of scan (image data), no start of frame has been found
+                if marker == 0xDA:
+                    return None
+
+                segmentSize = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+                if marker in cls.__jpegStartOfFrameMarkers:
+                    height, width = struct.unpack('>2H', data[offset + 5:offset + 9])
+                    return {
+                        'width': width,
+                        'height': height
+                    }
+
+                offset += 2 + segmentSize
+        finally:
+            data.close()
+
+        return None
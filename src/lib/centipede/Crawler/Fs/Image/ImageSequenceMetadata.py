@@ -0,0 +1,142 @@
+import os
+import threading
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+class ImageSequenceMetadataMismatchError(Exception):
+    """Image Sequence Metadata Mismatch Error."""
+
+class ImageSequenceMetadata(object):
+    """
+    Shares the metadata (width and height) between the frames of image sequences.
+
+    The frames of an image sequence almost always share the same resolution,
+    therefore only the first frame queried from a sequence (based on the
+    "group" tag and the directory of the frame) reads the metadata from the
+    file, the remaining frames reuse it. The sequences are cached alongside
+    the modification time of their directory (frames added or removed
+    invalidate the entry), the size of the cache is driven by the environment
+    variable "CENTIPEDE_IMAGESEQUENCEMETADATA_CACHE_SIZE" (default: 1000).
+
+    Use verify to make sure all the frames of the sequences really share the
+    same metadata (the frames are read in parallel).
+
+    Example:
+        ImageSequenceMetadata.metadata(frameCrawler)
+        ImageSequenceMetadata.verify(frameCrawlers)
+
+    """
+
+    __cache = OrderedDict()
+    __cacheSize = int(os.environ.get('CENTIPEDE_IMAGESEQUENCEMETADATA_CACHE_SIZE', 1000))
+    __cacheLock = threading.Lock()
+    __cacheStats = {
+        'hits': 0,
+        'misses': 0
+    }
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_IMAGESEQUENCEMETADATA_WORKERS', 8))
+
+    @classmethod
+    def metadata(cls, crawler):
+        """
+        Return a dict with the metadata about the image crawler (shared by the frames of a sequence).
+
+        The crawler must implement readMetadata (for instance Oiio).
+        """
+        key = cls.__sequenceKey(crawler)
+        if key is None:
+            return crawler.readMetadata()
+
+        with cls.__cacheLock:
+            if key in cls.__cache:
+                result = cls.__cache.pop(key)
+                cls.__cache[key] = result
+                cls.__cacheStats['hits'] += 1
+                return dict(result)
+            cls.__cacheStats['misses'] += 1
+
+        result = crawler.readMetadata()
+
+        with cls.__cacheLock:
+            cls.__cache[key] = dict(result)
+            while len(cls.__cache) > cls.__cacheSize:
+                cls.__cache.popitem(last=False)
+
+        return result
+
+    @classmethod
+    def verify(cls, crawlers, workers=None):
+        """
+        Make sure the frames of each sequence have the same metadata, otherwise raise an exception.
+
+        The metadata of each frame is read from its file in parallel. In case the
+        number of workers is not specified it is driven by the environment variable
+        "CENTIPEDE_IMAGESEQUENCEMETADATA_WORKERS" (default 8).
+        """
+        crawlers = list(filter(
+            lambda x: hasattr(x, 'readMetadata') and cls.__sequenceKey(x) is not None,
+            crawlers
+        ))
+        if not crawlers:
+            return
+
+        if workers is None:
+            workers = cls.__defaultWorkers
+        workers = min(max(int(workers), 1), len(crawlers))
+
+        pool = ThreadPool(workers)
+        try:
+            frameMetadata = pool.map(lambda x: x.readMetadata(), crawlers)
+        finally:
+            pool.close()
+            pool.join()
+
+        # comparing each frame against the metadata shared by its sequence
+        mismatches = []
+        for crawler, metadata in zip(crawlers, frameMetadata):
+            if metadata != cls.metadata(crawler):
+                mismatches.append(crawler.var('filePath'))
+
+        if mismatches:
+            raise ImageSequenceMetadataMismatchError(
+                'Frames with different metadata from their sequence:\n{}'.format(
+                    '\n'.join(sorted(mismatches))
+                )
+            )
+
+    @classmethod
+    def cacheStats(cls):
+        """
+        Return a dict with the hits, misses and size of the cache.
+        """
+        with cls.__cacheLock:
+            result = dict(cls.__cacheStats)
+            result['size'] = len(cls.__cache)
+
+        return result
+
+    @classmethod
+    def clearCache(cls):
+        """
+        Remove all the entries from the cache.
+        """
+        with cls.__cacheLock:
+            cls.__cache.clear()
+            cls.__cacheStats['hits'] = 0
+            cls.__cacheStats['misses'] = 0
+
+    @staticmethod
+    def __sequenceKey(crawler):
+        """
+        Return the key about the sequence of the crawler (or None when the crawler is not part of a sequence).
+        """
+        if 'group' not in crawler.tagNames() or crawler.var('imageType') != 'sequence':
+            return None
+
+        directory = os.path.dirname(crawler.var('filePath'))
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return None
+
+        return (directory, crawler.tag('group'), mtime)
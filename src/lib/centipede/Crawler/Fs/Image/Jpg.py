@@ -5,6 +5,15 @@ class Jpg(Oiio):
     Jpg crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain an jpg file.
+        """
+        return [('file', 'jpg')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -2,6 +2,8 @@ from .Image import Image
 import subprocess
 import os
 import json
+from .ImageHeader import ImageHeader
+from .ImageSequenceMetadata import ImageSequenceMetadata
 
 try:
     import OpenImageIO
@@ -18,6 +20,8 @@ class Oiio(Image):
     Open image io crawler.
     """
 
+    __slots__ = ()
+
     def var(self, name):
         """
         Return var value using lazy loading implementation for width and height.
@@ -25,31 +29,48 @@ class Oiio(Image):
         if name in ['width', 'height'] and name not in self.varNames():
             # alternatively width and height information could come from the
             # parent directory crawler "1920x1080". For more details take a look
-            # at "Directory" crawler.
-            if hasOpenImageIO:
-                imageInput = OpenImageIO.ImageInput.open(self.pathHolder().path())
-
-                # making sure the image has been successfully loaded
-                if imageInput is None:
-                    raise OiioReadFileError(
-                        "Can't read information from file:\n{}".format(
-                            self.pathHolder().path()
-                        )
+            # at "Directory" crawler. The frames of an image sequence share the
+            # metadata, for more details take a look at "ImageSequenceMetadata".
+            metadata = ImageSequenceMetadata.metadata(self)
+            self.setVar('width', metadata['width'])
+            self.setVar('height', metadata['height'])
+
+        return super(Oiio, self).var(name)
+
+    def readMetadata(self):
+        """
+        Return a dict containing the width and height read from the image file.
+        """
+        result = ImageHeader.read(self.pathHolder().path())
+        if result is not None:
+            return result
+
+        if hasOpenImageIO:
+            imageInput = OpenImageIO.ImageInput.open(self.pathHolder().path())
+
+            # making sure the image has been successfully loaded
+            if imageInput is None:
+                raise OiioReadFileError(
+                    "Can't read information from file:\n{}".format(
+                        self.pathHolder().path()
                     )
+                )
 
-                spec = imageInput.spec()
-                self.setVar('width', spec.full_width)
-                self.setVar('height', spec.full_height)
+            spec = imageInput.spec()
+            result = {
+                'width': spec.full_width,
+                'height': spec.full_height
+            }
 
-                imageInput.close()
-            else:
-                self.__getWidthHeight()
+            imageInput.close()
 
-        return super(Oiio, self).var(name)
+            return result
+
+        return self.__getWidthHeight()
 
     def __getWidthHeight(self):
         """
-        Query width and height using ffprobe and set them as crawler variables.
+        Query width and height using ffprobe.
         """
         # Get width and height from movie using ffprobe
         cmd = 'ffprobe -v quiet -print_format json -show_entries stream=height,width {}'.format(self.var('filePath'))
@@ -66,5 +87,8 @@ class Oiio(Image):
         # capturing the output
         output, error = process.communicate()
         result = json.loads(output.decode("utf-8"))
-        self.setVar('width', result['streams'][0]['width'])
-        self.setVar('height', result['streams'][0]['height'])
+
+        return {
+            'width': result['streams'][0]['width'],
+            'height': result['streams'][0]['height']
+        }
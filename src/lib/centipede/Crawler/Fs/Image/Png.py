@@ -5,6 +5,15 @@ class Png(Oiio):
     Png crawler.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain an png file.
+        """
+        return [('file', 'png')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -1,6 +1,9 @@
 from .Image import Image
+from .ImageHeader import ImageHeader
+from .ImageSequenceMetadata import ImageSequenceMetadata, ImageSequenceMetadataMismatchError
 from .Oiio import Oiio, OiioReadFileError
 from .Exr import Exr
 from .Dpx import Dpx
 from .Jpg import Jpg
 from .Png import Png
+from .FrameSequence import FrameSequence
@@ -5,6 +5,8 @@ class Ccc(Lut):
     Parses a Ccc or a Cc file.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Ccc object.
@@ -13,6 +15,13 @@ class Ccc(Lut):
 
         self.__parseXML()
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a lut file.
+        """
+        return [('*', 'ccc'), ('*', 'cc')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
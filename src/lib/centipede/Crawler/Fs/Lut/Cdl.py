@@ -5,6 +5,8 @@ class Cdl(Lut):
     Parses a cdl file.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Cdl object.
@@ -13,6 +15,13 @@ class Cdl(Lut):
 
         self.__parseXML()
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a cdl file.
+        """
+        return [('*', 'cdl')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
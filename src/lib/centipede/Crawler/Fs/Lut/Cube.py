@@ -8,6 +8,15 @@ class Cube(Lut):
     future releases.
     """
 
+    __slots__ = ()
+
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a lut file.
+        """
+        return list(map(lambda x: ('file', x), ['cube', 'ccc', 'cc', 'cdl']))
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
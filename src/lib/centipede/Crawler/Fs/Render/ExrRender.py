@@ -5,6 +5,8 @@ class ExrRender(Exr):
     Abstracted crawler used to detect renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Render object.
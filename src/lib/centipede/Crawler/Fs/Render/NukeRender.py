@@ -5,6 +5,8 @@ class NukeRender(ExrRender):
     Custom crawler to parse information from a Nuke render.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a NukeRender object.
@@ -29,6 +31,13 @@ class NukeRender(ExrRender):
         isMatte = 'matte' in self.var('output').lower()
         self.setVar('isMatte', int(isMatte))
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a shotgun nuke render.
+        """
+        return [('file', 'exr')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -5,6 +5,8 @@ class ShotRender(ExrRender):
     Custom crawler used to detect renders for shots.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Render object.
@@ -27,6 +29,13 @@ class ShotRender(ExrRender):
             True
         )
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a shot render.
+        """
+        return [('file', 'exr')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
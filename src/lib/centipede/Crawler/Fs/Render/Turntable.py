@@ -5,6 +5,8 @@ class Turntable(ExrRender):
     Custom crawler used to detect turntable renders.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a Turntable object.
@@ -27,6 +29,13 @@ class Turntable(ExrRender):
             True
         )
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a turntable.
+        """
+        return [('file', 'exr')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -5,6 +5,8 @@ class MayaScene(Scene):
     Crawler used to detect maya scenes.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Create a MayaScene object.
@@ -18,6 +20,13 @@ class MayaScene(Scene):
         """
         return ['ma', 'mb']
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a Maya scene.
+        """
+        return list(map(lambda x: ('file', x), cls.extensions()))
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
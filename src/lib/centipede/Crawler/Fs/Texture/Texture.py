@@ -5,6 +5,8 @@ class Texture(Oiio):
     Custom crawler used to detect textures.
     """
 
+    __slots__ = ()
+
     __groupTextures = True
 
     def __init__(self, *args, **kwargs):
@@ -36,6 +38,13 @@ class Texture(Oiio):
         if self.__groupTextures and name in ['assetName', 'variant']:
             self.__updateGroupTag()
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a texture exr or tif file.
+        """
+        return [('file', 'exr'), ('file', 'tif')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
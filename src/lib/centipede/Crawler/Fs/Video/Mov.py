@@ -1,43 +1,29 @@
 from .Video import Video
-import subprocess
-import json
-import os
 
 class Mov(Video):
     """
     Mov crawler.
     """
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ()
+
+    @classmethod
+    def probeVarNames(cls):
         """
-        Create a Mov crawler.
+        Return a list of variable names queried through ffprobe.
         """
-        super(Mov, self).__init__(*args, **kwargs)
+        return super(Mov, cls).probeVarNames() + ['firstFrame', 'lastFrame']
 
-        self.__getFirstLastFrames()
-
-    def __getFirstLastFrames(self):
+    def _setProbeVars(self, probeResult):
         """
-        Query first frame and last frame using ffprobe and set them as crawler variables if available.
+        Set first frame and last frame based on the result of ffprobe as crawler variables if available.
         """
-        cmd = 'ffprobe -v quiet -show_streams -print_format json {}'.format(self.var('filePath'))
-
-        # calling ffprobe
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=os.environ,
-            shell=True
-        )
+        super(Mov, self)._setProbeVars(probeResult)
 
-        # capturing the output
-        output, error = process.communicate()
-        result = json.loads(output.decode("utf-8"))
-        if "streams" not in result:
+        if "streams" not in probeResult:
             return
 
-        tags = result['streams'][0].get("tags")
+        tags = probeResult['streams'][0].get("tags")
         if not tags:
             return
 
@@ -45,8 +31,8 @@ class Mov(Video):
         if not startTimecode:
             return
 
-        nbFrames = int(result['streams'][0]['nb_frames'])-1
-        frameRateStr = result['streams'][0]['avg_frame_rate'].split("/")
+        nbFrames = int(probeResult['streams'][0]['nb_frames'])-1
+        frameRateStr = probeResult['streams'][0]['avg_frame_rate'].split("/")
         frameRate = int(float(frameRateStr[0])/float(frameRateStr[1]))
         firstFrame = 0
         for f, t in zip((3600*frameRate, 60*frameRate, frameRate, 1), startTimecode.split(':')):
@@ -54,6 +40,13 @@ class Mov(Video):
         self.setVar('firstFrame', firstFrame)
         self.setVar('lastFrame', firstFrame+nbFrames)
 
+    @classmethod
+    def dispatchKeys(cls):
+        """
+        Return the dispatch keys about path holders that may contain a mov file.
+        """
+        return [('file', 'mov')]
+
     @classmethod
     def test(cls, pathHolder, parentCrawler):
         """
@@ -1,13 +1,18 @@
-import subprocess
-import os
-import json
 from ..File import File
+from .VideoProbe import VideoProbe
 
 class Video(File):
     """
     Abstracted video crawler.
+
+    The variables queried through ffprobe (see probeVarNames) are loaded
+    lazily. The video is queued to a shared VideoProbe as soon as the crawler
+    gets created, so ffprobe runs in the background while crawling.
     """
 
+    __slots__ = ()
+    __videoProbe = VideoProbe()
+
     def __init__(self, *args, **kwargs):
         """
         Create a video crawler.
@@ -22,27 +27,28 @@ class Video(File):
             self.pathHolder().baseName()
         )
 
-        self.__getWidthHeight()
+        Video.__videoProbe.queue([self.var('filePath')])
 
-    def __getWidthHeight(self):
+    def var(self, name):
         """
-        Query width and height using ffprobe and set them as crawler variables.
+        Return var value using lazy loading implementation for the variables queried through ffprobe.
         """
-        # Get width and height from movie using ffprobe
-        cmd = 'ffprobe -v quiet -print_format json -show_entries stream=height,width {}'.format(self.var('filePath'))
+        if name in self.probeVarNames() and name not in self.varNames():
+            self._setProbeVars(Video.__videoProbe.probe(self.var('filePath')))
 
-        # calling ffmpeg
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=os.environ,
-            shell=True
-        )
+        return super(Video, self).var(name)
+
+    @classmethod
+    def probeVarNames(cls):
+        """
+        Return a list of variable names queried through ffprobe.
+        """
+        return ['width', 'height']
 
-        # capturing the output
-        output, error = process.communicate()
-        result = json.loads(output.decode("utf-8"))
-        if "streams" in result:
-            self.setVar('width', result['streams'][0]['width'])
-            self.setVar('height', result['streams'][0]['height'])
+    def _setProbeVars(self, probeResult):
+        """
+        Set the width and height based on the result of ffprobe as crawler variables.
+        """
+        if "streams" in probeResult:
+            self.setVar('width', probeResult['streams'][0]['width'])
+            self.setVar('height', probeResult['streams'][0]['height'])
@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+import subprocess
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+class VideoProbe(object):
+    """
+    Queries the streams of video files through ffprobe.
+
+    The video files can be queued, so ffprobe runs in the background through
+    a bounded pool of workers (driven by the environment variable
+    "CENTIPEDE_VIDEOPROBE_WORKERS", default 4) while the caller carries on,
+    probe waits for the queued result when necessary.
+
+    The results are stored in a cache keyed by the path, size and modification
+    time of the file, so unchanged videos are not probed again. The cache is
+    stored in a sqlite database, the location is driven by the environment
+    variable "CENTIPEDE_VIDEOPROBE_CACHE_PATH" (default:
+    ~/.cache/centipede/videoProbe.sqlite). In case the cache cannot be used (for
+    instance a read-only home or a locked database on a shared file system) the
+    files are probed without the cache.
+
+    Example:
+        videoProbe = VideoProbe()
+        videoProbe.queue(movFilePaths)
+        streams = videoProbe.probe(movFilePaths[0])['streams']
+
+    """
+
+    __defaultCachePath = os.environ.get(
+        'CENTIPEDE_VIDEOPROBE_CACHE_PATH',
+        os.path.join(os.path.expanduser('~'), '.cache', 'centipede', 'videoProbe.sqlite')
+    )
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_VIDEOPROBE_WORKERS', 4))
+
+    # number of results kept in memory
+    __resultsSize = 1000
+
+    # files modified within this interval (in seconds) are not stored in
+    # the cache, since further modifications in the same interval may not
+    # be detected by the modification time (file systems with low resolution)
+    __racyInterval = 2.0
+
+    def __init__(self, cachePath=None, workers=None):
+        """
+        Create a video probe object.
+        """
+        if cachePath is None:
+            cachePath = self.__defaultCachePath
+
+        if workers is None:
+            workers = self.__defaultWorkers
+
+        self.__cachePath = cachePath
+        self.__workers = max(int(workers), 1)
+        self.__lock = threading.RLock()
+        self.__connection = None
+        self.__cacheFailed = False
+        self.__pool = None
+        self.__pending = {}
+        self.__results = OrderedDict()
+
+    def cachePath(self):
+        """
+        Return the path for the cache file.
+        """
+        return self.__cachePath
+
+    def workers(self):
+        """
+        Return the number of workers used to probe the queued files.
+        """
+        return self.__workers
+
+    def queue(self, filePaths):
+        """
+        Queue the files to be probed in the background.
+        """
+        for filePath in filePaths:
+            key = self.__fileKey(filePath)
+            if key is None:
+                continue
+
+            with self.__lock:
+                if key in self.__results or key in self.__pending:
+                    continue
+
+                if self.__pool is None:
+                    self.__pool = ThreadPool(self.workers())
+
+                self.__pending[key] = self.__pool.apply_async(self.__probeKey, (key,))
+
+    def probe(self, filePath):
+        """
+        Return a dict containing the ffprobe result about the file, an empty dict when it cannot be probed.
+        """
+        key = self.__fileKey(filePath)
+        if key is None:
+            return {}
+
+        with self.__lock:
+            if key in self.__results:
+                return self.__results[key]
+            pending = self.__pending.get(key)
+
+        if pending is not None:
+            return pending.get()
+
+        return self.__probeKey(key)
+
+    def close(self):
+        """
+        Wait for the queued files and release the workers.
+        """
+        with self.__lock:
+            pool = self.__pool
+            self.__pool = None
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def __probeKey(self, key):
+        """
+        Return the result of ffprobe about the file key (path, size and mtime).
+        """
+        try:
+            result = self.__cachedResult(key)
+            if result is None:
+                result, success = self.__runFFprobe(key[0])
+
+                # only successful probes are stored in the cache
+                if success and time.time() - key[2] > self.__racyInterval:
+                    self.__storeResult(key, result)
+
+            with self.__lock:
+                self.__results[key] = result
+                while len(self.__results) > self.__resultsSize:
+                    self.__results.popitem(last=False)
+        finally:
+            with self.__lock:
+                self.__pending.pop(key, None)
+
+        return result
+
+    def __cachedResult(self, key):
+        """
+        Return the result stored in the cache about the file key (None when not found).
+        """
+        with self.__lock:
+            if self.__cacheFailed:
+                return None
+
+            try:
+                row = self.__query().execute(
+                    'SELECT result FROM probes WHERE path = ? AND size = ? AND mtime = ?',
+                    key
+                ).fetchone()
+            except (sqlite3.Error, OSError) as err:
+                self.__disableCache(err)
+                return None
+
+        if row is None:
+            return None
+
+        return json.loads(row[0])
+
+    def __storeResult(self, key, result):
+        """
+        Store the result about the file key in the cache.
+        """
+        with self.__lock:
+            if self.__cacheFailed:
+                return
+
+            try:
+                self.__query().execute(
+                    'INSERT OR REPLACE INTO probes (path, size, mtime, result) VALUES (?, ?, ?, ?)',
+                    key + (json.dumps(result),)
+                )
+                self.__connection.commit()
+            except (sqlite3.Error, OSError) as err:
+                self.__disableCache(err)
+
+    def __disableCache(self, error):
+        """
+        Stop using the cache (the files get probed without it).
+        """
+        if self.__cacheFailed:
+            return
+
+        self.__cacheFailed = True
+        sys.stderr.write(
+            'video probe cache disabled: "{}" ({})\n'.format(
+                self.cachePath(),
+                str(error)
+            )
+        )
+
+    def __query(self):
+        """
+        Return the connection to the cache file (created on demand).
+        """
+        if self.__connection is None:
+            cacheDirectory = os.path.dirname(self.cachePath())
+            if cacheDirectory and not os.path.exists(cacheDirectory):
+                os.makedirs(cacheDirectory)
+
+            # the connection is shared by the workers, the access to it
+            # is serialized through the lock
+            self.__connection = sqlite3.connect(
+                self.cachePath(),
+                timeout=60.0,
+                check_same_thread=False
+            )
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS probes ('
+                'path TEXT PRIMARY KEY, '
+                'size INTEGER NOT NULL, '
+                'mtime REAL NOT NULL, '
+                'result TEXT NOT NULL)'
+            )
+
+        return self.__connection
+
+    @staticmethod
+    def __runFFprobe(filePath):
+        """
+        Return a tuple containing the result of ffprobe about the streams of the file and a success boolean.
+        """
+        try:
+            process = subprocess.Popen(
+                ['ffprobe', '-v', 'quiet', '-show_streams', '-print_format', 'json', filePath],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=os.environ
+            )
+        except OSError:
+            return {}, False
+
+        # capturing the output
+        output, error = process.communicate()
+        try:
+            result = json.loads(output.decode("utf-8"))
+        except ValueError:
+            return {}, False
+
+        return result, process.returncode == 0
+
+    @staticmethod
+    def __fileKey(filePath):
+        """
+        Return the key (path, size and mtime) about the file (or None when the file does not exist).
+        """
+        try:
+            fileStat = os.stat(filePath)
+        except OSError:
+            return None
+
+        return (os.path.abspath(filePath), fileStat.st_size, fileStat.st_mtime)
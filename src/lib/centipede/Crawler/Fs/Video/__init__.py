@@ -1,2 +1,3 @@
+from .VideoProbe import VideoProbe
 from .Video import Video
 from .Mov import Mov
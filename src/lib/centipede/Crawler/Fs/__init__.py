@@ -1,6 +1,7 @@
 from .FsPath import FsPath
 from .File import File
 from .Directory import Directory
+from .CrawlIndex import CrawlIndex
 
 from . import Image
 from . import Lut
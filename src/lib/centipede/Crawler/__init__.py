@@ -1,3 +1,5 @@
-from .Crawler import Crawler, TestCrawlerError, CreateCrawlerError
+from .Crawler import Crawler, TestCrawlerError, CreateCrawlerError, InvalidVarError
+from .CrawlerWalker import CrawlerWalker
+from .CrawlerGroup import CrawlerGroup
 from . import Fs
 from . import Generic
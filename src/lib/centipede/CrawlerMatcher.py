@@ -1,11 +1,21 @@
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
 from .Crawler import Crawler
 
 class CrawlerMatcher(object):
     """
     Used to check if a crawler meets the specification of the matcher.
+
+    The specification is compiled when the matcher is created: the var
+    patterns are split in exact values (tested through a set) and glob
+    patterns (tested through a single regex per variable). The match types
+    are resolved to the registered type names (including derived types) once,
+    they are only resolved again when new crawler types get registered.
     """
 
+    __globCharacters = re.compile(r'[*?\[]')
+
     def __init__(self, matchTypes=[], matchVars={}):
         """
         Create a crawler matcher object.
@@ -13,6 +23,9 @@ class CrawlerMatcher(object):
         self.__setMatchTypes(matchTypes)
         self.__setMatchVars(matchVars)
 
+        self.__registeredMatchTypes = None
+        self.__registryVersion = None
+
     def matchTypes(self):
         """
         Return a list of crawler types used to match.
@@ -42,36 +55,68 @@ class CrawlerMatcher(object):
         assert isinstance(crawler, Crawler), \
             "Invalid crawler type!"
 
-        crawlerType = crawler.var('type')
-        foundType = not self.matchTypes()
-        for matchType in self.matchTypes():
-            registeredTypes = Crawler.registeredSubTypes(matchType)
-            if crawlerType in registeredTypes:
-                foundType = True
-                break
+        return self.__matchCrawler(crawler, self.registeredMatchTypes())
 
-        if not foundType:
-            return False
+    def matchMany(self, crawlers):
+        """
+        Return a list containing only the crawlers that match.
+        """
+        registeredMatchTypes = self.registeredMatchTypes()
 
-        for varName in self.matchVarNames():
+        result = []
+        for crawler in crawlers:
+            assert isinstance(crawler, Crawler), \
+                "Invalid crawler type!"
 
-            # checking if variable is part of the crawler
-            if varName not in crawler.varNames():
-                return False
+            if self.__matchCrawler(crawler, registeredMatchTypes):
+                result.append(crawler)
 
-            matchVarValue = self.matchVar(varName)
+        return result
 
-            # the value can be a list of possibiblities
-            if not isinstance(matchVarValue, list):
-                matchVarValue = [matchVarValue]
+    def matchCrawlerVars(self, crawler):
+        """
+        Return a boolean telling if the variables of the crawler match (ignoring the match types).
+        """
+        return self.__matchCrawler(crawler, None)
+
+    def registeredMatchTypes(self):
+        """
+        Return a frozenset with the registered type names (including derived types) that match, or None to match any type.
+        """
+        if not self.__matchTypes:
+            return None
 
-            foundValueValue = False
-            for value in matchVarValue:
-                if fnmatch(str(crawler.var(varName)), str(value)):
-                    foundValueValue = True
-                    break
+        if self.__registryVersion != Crawler.registryVersion():
+            registeredMatchTypes = set()
+            for matchType in self.__matchTypes:
+                registeredMatchTypes.update(Crawler.registeredSubTypes(matchType))
 
-            if not foundValueValue:
+            self.__registeredMatchTypes = frozenset(registeredMatchTypes)
+            self.__registryVersion = Crawler.registryVersion()
+
+        return self.__registeredMatchTypes
+
+    def __matchCrawler(self, crawler, registeredMatchTypes):
+        """
+        Return a boolean telling if the crawler matches the compiled specification.
+        """
+        if registeredMatchTypes is not None and crawler.var('type') not in registeredMatchTypes:
+            return False
+
+        if not self.__compiledMatchVars:
+            return True
+
+        # checking the var names first, since querying a missing var may
+        # trigger lazy reads (for instance image headers or ffprobe)
+        crawlerVarNames = set(crawler.varNames())
+        for varName, exactValues, globRegex in self.__compiledMatchVars:
+
+            # checking if variable is part of the crawler
+            if varName not in crawlerVarNames:
+                return False
+
+            value = os.path.normcase(str(crawler.var(varName)))
+            if value not in exactValues and (globRegex is None or globRegex.match(value) is None):
                 return False
 
         return True
@@ -97,3 +142,25 @@ class CrawlerMatcher(object):
             "Invalid dict!"
 
         self.__matchVars = dict(matchVars)
+
+        # compiling the var values, the value can be a list of possibilities
+        self.__compiledMatchVars = []
+        for varName, matchVarValue in self.__matchVars.items():
+            if not isinstance(matchVarValue, list):
+                matchVarValue = [matchVarValue]
+
+            exactValues = set()
+            globPatterns = []
+            for value in map(lambda x: os.path.normcase(str(x)), matchVarValue):
+                if self.__globCharacters.search(value):
+                    globPatterns.append('(?:{})'.format(translate(value)))
+                else:
+                    exactValues.add(value)
+
+            globRegex = None
+            if globPatterns:
+                globRegex = re.compile('|'.join(globPatterns))
+
+            self.__compiledMatchVars.append(
+                (varName, frozenset(exactValues), globRegex)
+            )
@@ -37,16 +37,19 @@ class CrawlerQuery(object):
         """
         Return a dict containg the matched crawler as key and resolved template as value.
         """
-        validCrawlers = {}
-        for crawler in crawlers:
-            if self.crawlerMatcher().match(crawler):
-                filterTemplateValue = self.filterTemplate().valueFromCrawler(crawler, vars)
-
-                # if the value of the filter is 0 or false the crawler is ignored
-                if str(filterTemplateValue).lower() in ['false', '0']:
-                    continue
-
-                validCrawlers[crawler] = self.targetTemplate().valueFromCrawler(crawler, vars)
+        matchedCrawlers = self.crawlerMatcher().matchMany(crawlers)
+
+        # if the value of the filter is 0 or false the crawler is ignored
+        filteredCrawlers = []
+        filterTemplateValues = self.filterTemplate().valuesFromCrawlers(matchedCrawlers, vars)
+        for crawler, filterTemplateValue in zip(matchedCrawlers, filterTemplateValues):
+            if str(filterTemplateValue).lower() not in ['false', '0']:
+                filteredCrawlers.append(crawler)
+
+        validCrawlers = dict(zip(
+            filteredCrawlers,
+            self.targetTemplate().valuesFromCrawlers(filteredCrawlers, vars)
+        ))
 
         # sorting result
         result = OrderedDict()
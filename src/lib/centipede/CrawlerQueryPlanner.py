@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from .Crawler import Crawler
+from .CrawlerMatcher import CrawlerMatcher
+
+class CrawlerQueryPlanner(object):
+    """
+    Plan the crawlers matched by a list of crawler matchers in a single pass.
+
+    Instead of each crawler matcher going through all crawlers (one pass per
+    task holder), the planner goes through the crawlers only once: the crawlers
+    are partitioned by type (the matchers are resolved per crawler type once)
+    and the var specification shared by several matchers is evaluated only once
+    per crawler. The result is the list of crawlers matched by each matcher,
+    that can be passed to the task holders as their candidate crawlers.
+
+    Example:
+        crawlerQueryPlanner = CrawlerQueryPlanner(
+            map(lambda x: x.crawlerMatcher(), taskHolders)
+        )
+        for taskHolder, candidateCrawlers in zip(taskHolders, crawlerQueryPlanner.plan(crawlers)):
+            taskHolder.query(candidateCrawlers)
+
+    """
+
+    def __init__(self, crawlerMatchers=[]):
+        """
+        Create a crawler query planner object.
+        """
+        self.__crawlerMatchers = []
+        for crawlerMatcher in crawlerMatchers:
+            self.addCrawlerMatcher(crawlerMatcher)
+
+    def addCrawlerMatcher(self, crawlerMatcher):
+        """
+        Add a crawler matcher to the planner.
+        """
+        assert isinstance(crawlerMatcher, CrawlerMatcher), \
+            "Invalid crawler matcher type!"
+
+        self.__crawlerMatchers.append(crawlerMatcher)
+
+    def crawlerMatchers(self):
+        """
+        Return a list of crawler matchers associated with the planner.
+        """
+        return list(self.__crawlerMatchers)
+
+    def plan(self, crawlers):
+        """
+        Return a list containing the matched crawlers for each crawler matcher (in the same order of the matchers).
+        """
+        result = list(map(lambda x: [], self.__crawlerMatchers))
+
+        # grouping the matchers that share the same var specification
+        groupedMatchers = OrderedDict()
+        for index, crawlerMatcher in enumerate(self.__crawlerMatchers):
+            signature = self.__matchVarsSignature(crawlerMatcher)
+            if signature not in groupedMatchers:
+                groupedMatchers[signature] = (crawlerMatcher, [])
+            groupedMatchers[signature][1].append(index)
+
+        registeredMatchTypes = list(map(lambda x: x.registeredMatchTypes(), self.__crawlerMatchers))
+
+        # the groups are resolved per crawler type only once
+        groupsByType = {}
+        for crawler in crawlers:
+            assert isinstance(crawler, Crawler), \
+                "Invalid crawler type!"
+
+            crawlerType = crawler.var('type')
+            if crawlerType not in groupsByType:
+                groupsByType[crawlerType] = []
+                for crawlerMatcher, indexes in groupedMatchers.values():
+                    typeIndexes = list(filter(
+                        lambda x: registeredMatchTypes[x] is None or crawlerType in registeredMatchTypes[x],
+                        indexes
+                    ))
+
+                    if typeIndexes:
+                        groupsByType[crawlerType].append((crawlerMatcher, typeIndexes))
+
+            for crawlerMatcher, indexes in groupsByType[crawlerType]:
+                if crawlerMatcher.matchCrawlerVars(crawler):
+                    for index in indexes:
+                        result[index].append(crawler)
+
+        return result
+
+    @staticmethod
+    def __matchVarsSignature(crawlerMatcher):
+        """
+        Return a signature about the var specification of the crawler matcher.
+        """
+        return repr(
+            sorted(
+                map(
+                    lambda x: (x, repr(crawlerMatcher.matchVar(x))),
+                    crawlerMatcher.matchVarNames()
+                )
+            )
+        )
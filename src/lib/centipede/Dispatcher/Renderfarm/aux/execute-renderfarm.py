@@ -65,7 +65,7 @@ def __runCollapsed(data, taskHolder, dataJsonFile):
     for taskInputFilePath in taskInputFilePaths:
         with open(taskInputFilePath) as jsonFile:
             serializedCrawlers = json.load(jsonFile)
-            crawlers += list(map(lambda x: Crawler.createFromJson(x), serializedCrawlers))
+            crawlers += Crawler.createFromBatch(serializedCrawlers)
 
     dispatcher = Dispatcher.createFromJson(data['dispatcher'])
     dispatchedIds = dispatcher.dispatch(
@@ -130,11 +130,10 @@ def __runExpanded(data, taskHolder, rangeStart, rangeEnd):
 
     # writing resulted crawlers
     with open(taskResultFilePath, 'w') as jsonFile:
-        data = list(map(lambda x: x.toJson(), outputCrawlers))
+        data = Crawler.serializeBatch(outputCrawlers)
         json.dump(
             data,
-            jsonFile,
-            indent=4
+            jsonFile
         )
 
 def __run(dataJsonFile, rangeStart=None, rangeEnd=None):
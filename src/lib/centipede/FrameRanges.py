@@ -0,0 +1,182 @@
+from array import array
+
+class FrameRanges(object):
+    """
+    Compact set of frames stored as run-length ranges.
+
+    The frames are kept as sorted (start, end) pairs (inclusive) in a flat
+    array of integers, therefore a contiguous image sequence takes the same
+    memory regardless of the number of frames (10k frames are stored as a
+    single range).
+
+    Example:
+        frameRanges = FrameRanges([1001, 1002, 1003, 1005])
+        frameRanges.ranges()
+        [(1001, 1003), (1005, 1005)]
+        frameRanges.toString()
+        '1001-1003,1005'
+
+    """
+
+    def __init__(self, frames=[]):
+        """
+        Create a frame ranges object.
+        """
+        self.__ranges = array('l')
+        self.__size = 0
+
+        for frame in frames:
+            self.add(frame)
+
+    def add(self, frame):
+        """
+        Add a frame (integer) to the set.
+        """
+        frame = int(frame)
+        ranges = self.__ranges
+
+        # fast path: frames added in ascending order
+        if not ranges or frame > ranges[-1] + 1:
+            ranges.append(frame)
+            ranges.append(frame)
+        elif frame == ranges[-1] + 1:
+            ranges[-1] = frame
+        else:
+            index = self.__rangeIndex(frame)
+
+            # frame already in the set
+            if index >= 0 and frame <= ranges[index * 2 + 1]:
+                return
+
+            hasPrevious = index >= 0 and ranges[index * 2 + 1] == frame - 1
+            hasNext = (index + 1) * 2 < len(ranges) and ranges[(index + 1) * 2] == frame + 1
+
+            if hasPrevious and hasNext:
+                ranges[index * 2 + 1] = ranges[(index + 1) * 2 + 1]
+                del ranges[(index + 1) * 2:(index + 1) * 2 + 2]
+            elif hasPrevious:
+                ranges[index * 2 + 1] = frame
+            elif hasNext:
+                ranges[(index + 1) * 2] = frame
+            else:
+                ranges.insert((index + 1) * 2, frame)
+                ranges.insert((index + 1) * 2, frame)
+
+        self.__size += 1
+
+    def first(self):
+        """
+        Return the first frame (None when empty).
+        """
+        return self.__ranges[0] if self.__ranges else None
+
+    def last(self):
+        """
+        Return the last frame (None when empty).
+        """
+        return self.__ranges[-1] if self.__ranges else None
+
+    def ranges(self):
+        """
+        Return a list of (start, end) tuples (inclusive).
+        """
+        ranges = self.__ranges
+        return [(ranges[index], ranges[index + 1]) for index in range(0, len(ranges), 2)]
+
+    def gaps(self):
+        """
+        Return a list of (start, end) tuples (inclusive) about the frames missing between the first and last frames.
+        """
+        ranges = self.__ranges
+        return [(ranges[index] + 1, ranges[index + 1] - 1) for index in range(1, len(ranges) - 1, 2)]
+
+    def toString(self):
+        """
+        Return the ranges as string (for instance "1001-1003,1005").
+        """
+        result = []
+        for start, end in self.ranges():
+            if start == end:
+                result.append(str(start))
+            else:
+                result.append('{}-{}'.format(start, end))
+
+        return ','.join(result)
+
+    @classmethod
+    def createFromString(cls, rangesString):
+        """
+        Create a frame ranges object from a string (serialized via toString).
+        """
+        result = cls()
+        for rangeString in filter(None, rangesString.split(',')):
+            start, _, end = rangeString.partition('-')
+            start = int(start)
+            end = int(end) if end else start
+
+            # ascending ranges are added directly (fast path)
+            if not result.__ranges or start > result.__ranges[-1] + 1:
+                result.__ranges.append(start)
+                result.__ranges.append(end)
+                result.__size += end - start + 1
+            else:
+                for frame in range(start, end + 1):
+                    result.add(frame)
+
+        return result
+
+    def __len__(self):
+        """
+        Return the number of frames.
+        """
+        return self.__size
+
+    def __iter__(self):
+        """
+        Yield the frames in ascending order.
+        """
+        ranges = self.__ranges
+        for index in range(0, len(ranges), 2):
+            for frame in range(ranges[index], ranges[index + 1] + 1):
+                yield frame
+
+    def __contains__(self, frame):
+        """
+        Return a boolean telling if the frame is part of the set.
+        """
+        index = self.__rangeIndex(frame)
+        return index >= 0 and frame <= self.__ranges[index * 2 + 1]
+
+    def __eq__(self, other):
+        """
+        Return a boolean telling if both objects contain the same frames.
+        """
+        return isinstance(other, FrameRanges) and self.__ranges == other.__ranges
+
+    def __ne__(self, other):
+        """
+        Return a boolean telling if the objects contain different frames.
+        """
+        return not self == other
+
+    def __repr__(self):
+        """
+        Return the representation of the object.
+        """
+        return "FrameRanges('{}')".format(self.toString())
+
+    def __rangeIndex(self, frame):
+        """
+        Return the index of the last range starting at or before the frame (-1 when none).
+        """
+        ranges = self.__ranges
+        low = 0
+        high = len(ranges) // 2
+        while low < high:
+            middle = (low + high) // 2
+            if ranges[middle * 2] <= frame:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low - 1
@@ -1,10 +1,21 @@
 import os
+import stat
 
 class PathHolder(object):
     """
     Provides quick access to query information about the path.
     """
 
+    __slots__ = (
+        '__path',
+        '__basename',
+        '__name',
+        '__pathExists',
+        '__isDirectory',
+        '__size',
+        '__ext'
+    )
+
     def __init__(self, path):
         """
         Create a path holder object.
@@ -90,6 +101,46 @@ class PathHolder(object):
         """
         return self.__path
 
+    @staticmethod
+    def createFromDirEntry(dirEntry):
+        """
+        Create a path holder from a directory entry (returned by os.scandir).
+
+        The information already provided by the directory listing is reused
+        by the path holder, avoiding to stat the path again. The directory
+        entry is not kept by the path holder.
+        """
+        pathHolder = PathHolder(dirEntry.path)
+        pathHolder.__isDirectory = dirEntry.is_dir()
+
+        # listed entries exist, except for symlinks that may be broken
+        # (checked on demand)
+        if not dirEntry.is_symlink():
+            pathHolder.__pathExists = True
+
+            # on windows the stat data is provided by the directory listing
+            if os.name == 'nt' and not pathHolder.__isDirectory:
+                pathHolder.__size = dirEntry.stat().st_size
+
+        return pathHolder
+
+    @staticmethod
+    def createFromStat(path, pathStat):
+        """
+        Create a path holder from the stat result about the path (returned by os.stat).
+
+        Useful when the stat data has been already collected, avoiding to stat
+        the path again.
+        """
+        pathHolder = PathHolder(path)
+        pathHolder.__pathExists = True
+        pathHolder.__isDirectory = stat.S_ISDIR(pathStat.st_mode)
+
+        if not pathHolder.__isDirectory:
+            pathHolder.__size = pathStat.st_size
+
+        return pathHolder
+
     def __setPath(self, path):
         """
         Set a path to the path holder.
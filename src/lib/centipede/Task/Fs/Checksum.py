@@ -1,5 +1,5 @@
-import hashlib
 from ..Task import Task
+from .FileHasher import FileHasher
 
 class ChecksumMatchError(Exception):
     """Checksum match error."""
@@ -9,6 +9,13 @@ class Checksum(Task):
     Make sure the filePath has the same checksum as the crawler file path.
 
     In case the checksum does not match an exception is raised.
+
+    The files are hashed through FileHasher: the source and target files are
+    hashed concurrently and the hashes of the source files are cached (the
+    target files are always hashed).
+
+    Options:
+        - Optional: "algorithm" (default driven by FileHasher)
     """
 
     def __init__(self, *args, **kwargs):
@@ -22,17 +29,21 @@ class Checksum(Task):
         """
         Perform the task.
         """
-        for crawler in self.crawlers():
-
-            # copying the file to the new target
-            sourceFilePath = crawler.var('filePath')
-            targetFilePath = self.target(crawler)
-
-            # TODO: change md5 for xxHash
-            with open(sourceFilePath, 'rb') as sourceFile:
-                sourceFileHash = hashlib.md5(sourceFile.read()).hexdigest()
-            with open(targetFilePath, 'rb') as targetFile:
-                targetFileHash = hashlib.md5(targetFile.read()).hexdigest()
+        algorithm = None
+        if 'algorithm' in self.optionNames():
+            algorithm = self.option('algorithm')
+
+        crawlers = self.crawlers()
+        filePaths = []
+        useCache = []
+        for crawler in crawlers:
+            filePaths += [crawler.var('filePath'), self.target(crawler)]
+            useCache += [True, False]
+
+        fileHashes = FileHasher(algorithm).hashMany(filePaths, useCache)
+        for index, crawler in enumerate(crawlers):
+            sourceFileHash = fileHashes[index * 2]
+            targetFileHash = fileHashes[index * 2 + 1]
 
             if sourceFileHash != targetFileHash:
                 raise ChecksumMatchError(
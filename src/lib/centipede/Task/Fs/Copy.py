@@ -1,6 +1,6 @@
 import os
-import shutil
 from ..Task import Task
+from .FileCopier import FileCopier
 
 
 class CopyTargetDirectoryError(Exception):
@@ -11,6 +11,10 @@ class CopyTargetDirectoryError(Exception):
 class Copy(Task):
     """
     Copies a file to the filePath.
+
+    The copy is done through the FileCopier (using the fastest copy method
+    supported by the file system), targets that already have the same size
+    and modification time as the source are skipped.
     """
 
     def __init__(self, *args, **kwargs):
@@ -25,32 +29,22 @@ class Copy(Task):
         """
         Perform the task.
         """
+        filePaths = []
         for crawler in self.crawlers():
-            filePath = self.target(crawler)
-
-            # trying to create the directory automatically in case it does not exist
-            try:
-                os.makedirs(os.path.dirname(filePath))
-            except OSError:
-                pass
-
-            # copying the file to the new target
-            sourceFilePath = crawler.var('filePath')
-            targetFilePath = filePath
-
-            # Check if the target path already exists, if it is file remove it else raise an exception
-            if os.path.isfile(targetFilePath):
-                os.remove(targetFilePath)
-            elif os.path.isdir(targetFilePath):
+            targetFilePath = self.target(crawler)
+
+            # the target file gets replaced, however a directory (or a symlink
+            # to a directory) raises an exception
+            if os.path.isdir(targetFilePath):
                 raise CopyTargetDirectoryError(
                     'Target directory already exists {}'.format(targetFilePath)
                 )
 
-            # doing the copy
-            shutil.copy2(
-                sourceFilePath,
-                targetFilePath
-            )
+            filePaths.append((crawler.var('filePath'), targetFilePath))
+
+        # doing the copy (target directories are created automatically and
+        # files that are already up to date are skipped)
+        FileCopier().copyFiles(filePaths)
 
         # default result based on the target filePath
         return super(Copy, self)._perform()
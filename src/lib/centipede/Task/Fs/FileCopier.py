@@ -0,0 +1,280 @@
+import os
+import errno
+import shutil
+import threading
+from multiprocessing.pool import ThreadPool
+
+# reflinks are done through an ioctl (only available on unix)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class FileCopierStrategyError(Exception):
+    """File Copier Strategy Error."""
+
+class FileCopierTargetDirectoryError(Exception):
+    """File Copier Target Directory Error."""
+
+class FileCopier(object):
+    """
+    Copies files using the fastest method supported by the file system.
+
+    The strategy defines the first method tried to transfer each file, the
+    methods are tried in this order: a hardlink, a reflink (copy-on-write
+    clone supported by file systems like btrfs and xfs), os.copy_file_range
+    (and os.sendfile) and finally a buffered copy. The methods that are not
+    supported (for instance a hardlink across devices) fall back automatically
+    to the next one. Like shutil.copy2 the permission bits and times of the
+    source file are copied to the target file.
+
+    Strategies:
+        - hardlink: the target shares the data with the source file
+        - reflink: default, the data is only duplicated when modified
+        - copyFileRange: the data is copied by the kernel
+        - copy: the data is copied through a buffer
+
+    When copying multiple files the target directories are created in a batch
+    and the files are copied through a bounded pool of workers. Files whose
+    target already exists with the same size and modification time are skipped.
+
+    Example:
+        FileCopier().copyFiles([(sourceFilePath, targetFilePath)])
+
+    """
+
+    strategies = ('hardlink', 'reflink', 'copyFileRange', 'copy')
+
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_FILECOPIER_WORKERS', 8))
+    __bufferSize = 1024 * 1024
+
+    # linux FICLONE ioctl request
+    __ficloneRequest = 0x40049409
+
+    # errors telling the copy method is not supported by the file systems
+    __unsupportedErrors = (
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.ENOTTY,
+        errno.EBADF,
+        errno.ETXTBSY
+    )
+
+    # errors telling a hardlink cannot be created
+    __unsupportedLinkErrors = (
+        errno.EXDEV,
+        errno.EPERM,
+        errno.EMLINK,
+        errno.ENOSYS,
+        errno.EOPNOTSUPP
+    )
+
+    def __init__(self, workers=None, skipUnchanged=True, strategy='reflink'):
+        """
+        Create a file copier object.
+
+        In case the number of workers is not specified it is driven by the
+        environment variable "CENTIPEDE_FILECOPIER_WORKERS" (default 8).
+        """
+        if strategy not in self.strategies:
+            raise FileCopierStrategyError(
+                'Invalid strategy "{}" (expecting: {})'.format(
+                    strategy,
+                    ', '.join(self.strategies)
+                )
+            )
+
+        if workers is None:
+            workers = self.__defaultWorkers
+
+        self.__workers = max(int(workers), 1)
+        self.__skipUnchanged = skipUnchanged
+        self.__strategy = strategy
+        self.__lock = threading.Lock()
+        self.__stats = {
+            'hardlink': 0,
+            'reflink': 0,
+            'copyFileRange': 0,
+            'sendfile': 0,
+            'buffered': 0,
+            'skipped': 0
+        }
+
+    def workers(self):
+        """
+        Return the number of workers used to copy multiple files.
+        """
+        return self.__workers
+
+    def strategy(self):
+        """
+        Return the name of the strategy used to transfer the files.
+        """
+        return self.__strategy
+
+    def stats(self):
+        """
+        Return a dict with the number of files copied by each method (and skipped).
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def copyFile(self, sourceFilePath, targetFilePath):
+        """
+        Copy the source file to the target file path (the target directory must exist).
+
+        Return a boolean telling if the file has been copied (False when skipped).
+        A target that is a directory (or a symlink to a directory) raises an
+        exception rather than being replaced.
+        """
+        if os.path.isdir(targetFilePath):
+            raise FileCopierTargetDirectoryError(
+                'Target directory already exists {}'.format(targetFilePath)
+            )
+
+        if self.__skipUnchanged and self.__isUnchanged(sourceFilePath, targetFilePath):
+            self.__updateStats('skipped')
+            return False
+
+        # removing the existing target rather than writing over it, since
+        # it may be sharing the data with other files (hardlinks or reflinks)
+        if os.path.lexists(targetFilePath):
+            os.remove(targetFilePath)
+
+        if self.__strategy == 'hardlink':
+            try:
+                os.link(sourceFilePath, targetFilePath)
+                self.__updateStats('hardlink')
+                return True
+            except OSError as err:
+                if err.errno not in self.__unsupportedLinkErrors:
+                    raise
+
+        with open(sourceFilePath, 'rb') as sourceFile:
+            with open(targetFilePath, 'wb') as targetFile:
+                method = self.__copyContents(sourceFile, targetFile)
+
+        shutil.copystat(sourceFilePath, targetFilePath)
+        self.__updateStats(method)
+
+        return True
+
+    def copyFiles(self, filePaths):
+        """
+        Copy a list of (source file path, target file path).
+
+        The target directories are created automatically. Return a list of
+        booleans telling if each file has been copied (False when skipped).
+        """
+        filePaths = list(filePaths)
+
+        # creating the target directories in a batch
+        targetDirectories = set(map(lambda x: os.path.dirname(x[1]), filePaths))
+        for targetDirectory in sorted(targetDirectories):
+            if targetDirectory and not os.path.isdir(targetDirectory):
+                try:
+                    os.makedirs(targetDirectory)
+                except OSError as err:
+                    if err.errno != errno.EEXIST:
+                        raise
+
+        workers = min(self.workers(), len(filePaths))
+        if workers <= 1:
+            return list(map(lambda x: self.copyFile(*x), filePaths))
+
+        pool = ThreadPool(workers)
+        try:
+            return pool.map(lambda x: self.copyFile(*x), filePaths)
+        finally:
+            pool.close()
+            pool.join()
+
+    def __copyContents(self, sourceFile, targetFile):
+        """
+        Copy the contents of the source file to the target file returning the name of the method used.
+        """
+        size = os.fstat(sourceFile.fileno()).st_size
+
+        # reflink
+        if self.__strategy in ('hardlink', 'reflink') and fcntl is not None and size:
+            try:
+                fcntl.ioctl(targetFile.fileno(), self.__ficloneRequest, sourceFile.fileno())
+                return 'reflink'
+            except (IOError, OSError) as err:
+                if err.errno not in self.__unsupportedErrors:
+                    raise
+
+        # kernel copies (the data does not go through user space)
+        for method, copyCallable in (('copyFileRange', getattr(os, 'copy_file_range', None)),
+                                     ('sendfile', self.__sendfile)):
+            if self.__strategy == 'copy' or copyCallable is None or not size:
+                continue
+
+            try:
+                self.__copyRange(copyCallable, sourceFile, targetFile, size)
+                return method
+            except OSError as err:
+                if err.errno not in self.__unsupportedErrors:
+                    raise
+
+                # restarting from scratch with the next method
+                sourceFile.seek(0)
+                targetFile.seek(0)
+                targetFile.truncate()
+
+        shutil.copyfileobj(sourceFile, targetFile, self.__bufferSize)
+        return 'buffered'
+
+    def __updateStats(self, name):
+        """
+        Increment the counter about the name.
+        """
+        with self.__lock:
+            self.__stats[name] += 1
+
+    @staticmethod
+    def __copyRange(copyCallable, sourceFile, targetFile, size):
+        """
+        Copy the contents through a kernel copy callable (copy_file_range or sendfile).
+        """
+        copied = 0
+        while copied < size:
+            copiedSize = copyCallable(sourceFile.fileno(), targetFile.fileno(), size - copied)
+            if not copiedSize:
+                break
+            copied += copiedSize
+
+        # the file may have been truncated during the copy
+        if copied != size:
+            raise IOError('Could not copy the entire file ({} of {} bytes)'.format(copied, size))
+
+    @staticmethod
+    def __sendfile(sourceFileDescriptor, targetFileDescriptor, count):
+        """
+        Copy the contents through os.sendfile (using the current position of the files).
+        """
+        if not hasattr(os, 'sendfile'):
+            raise OSError(errno.ENOSYS, 'sendfile is not available')
+
+        return os.sendfile(targetFileDescriptor, sourceFileDescriptor, None, count)
+
+    @staticmethod
+    def __isUnchanged(sourceFilePath, targetFilePath):
+        """
+        Return a boolean telling if the target file has the same size and modification time as the source file.
+        """
+        try:
+            targetStat = os.stat(targetFilePath)
+        except OSError:
+            return False
+
+        sourceStat = os.stat(sourceFilePath)
+
+        # target is a hardlink to the source
+        if (sourceStat.st_dev, sourceStat.st_ino) == (targetStat.st_dev, targetStat.st_ino):
+            return True
+
+        return sourceStat.st_size == targetStat.st_size and \
+            sourceStat.st_mtime == targetStat.st_mtime
@@ -0,0 +1,259 @@
+import os
+import sys
+import time
+import sqlite3
+import hashlib
+import threading
+from multiprocessing.pool import ThreadPool
+
+# xxhash is optional (much faster than the algorithms provided by hashlib)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+class FileHasherAlgorithmError(Exception):
+    """File hasher algorithm error."""
+
+class FileHasher(object):
+    """
+    Computes the hash of files by streaming their contents through a fixed size buffer.
+
+    The algorithm can be any algorithm provided by hashlib (for instance blake2b
+    or md5) or xxh64, xxh3_64 and xxh128 when the xxhash module is available. The
+    default algorithm is driven by the environment variable
+    "CENTIPEDE_FILEHASHER_ALGORITHM" (default: xxh64 when available, otherwise blake2b).
+
+    The hashes can be stored in a cache keyed by the path, size and modification
+    time of the file, so unchanged files are not hashed again. The cache is stored
+    in a sqlite database (rather than sidecar files, that would be picked up by the
+    crawlers), the location is driven by the environment variable
+    "CENTIPEDE_FILEHASHER_CACHE_PATH" (default: ~/.cache/centipede/fileHasher.sqlite).
+    In case the cache cannot be used (for instance a read-only home or a locked
+    database on a shared file system) the files are hashed without the cache.
+    The new hashes are committed to the cache in batches (at the end of hashMany).
+
+    Example:
+        fileHasher = FileHasher('blake2b')
+        sourceHash, targetHash = fileHasher.hashMany([sourceFilePath, targetFilePath])
+
+    """
+
+    __xxhashAlgorithms = ('xxh64', 'xxh3_64', 'xxh128')
+    __defaultAlgorithm = os.environ.get(
+        'CENTIPEDE_FILEHASHER_ALGORITHM',
+        'xxh64' if xxhash is not None else 'blake2b'
+    )
+    __defaultCachePath = os.environ.get(
+        'CENTIPEDE_FILEHASHER_CACHE_PATH',
+        os.path.join(os.path.expanduser('~'), '.cache', 'centipede', 'fileHasher.sqlite')
+    )
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_FILEHASHER_WORKERS', 4))
+    __bufferSize = 1024 * 1024
+
+    # files modified within this interval (in seconds) are not stored in
+    # the cache, since further modifications in the same interval may not
+    # be detected by the modification time (file systems with low resolution)
+    __racyInterval = 2.0
+
+    def __init__(self, algorithm=None, cachePath=None):
+        """
+        Create a file hasher object.
+        """
+        if algorithm is None:
+            algorithm = self.__defaultAlgorithm
+
+        if cachePath is None:
+            cachePath = self.__defaultCachePath
+
+        if algorithm not in self.availableAlgorithms():
+            raise FileHasherAlgorithmError(
+                'Algorithm is not available: "{0}"'.format(algorithm)
+            )
+
+        self.__algorithm = algorithm
+        self.__cachePath = cachePath
+        self.__lock = threading.RLock()
+        self.__connection = None
+        self.__cacheFailed = False
+        self.__pendingRows = []
+
+    def algorithm(self):
+        """
+        Return the name of the algorithm used by the hasher.
+        """
+        return self.__algorithm
+
+    def cachePath(self):
+        """
+        Return the path for the cache file.
+        """
+        return self.__cachePath
+
+    def hash(self, filePath, useCache=True):
+        """
+        Return the hex digest about the contents of the file.
+        """
+        result = self.__hash(filePath, useCache)
+        self.__commitCache()
+
+        return result
+
+    def hashMany(self, filePaths, useCache=True, workers=None):
+        """
+        Return a list containing the hashes of the files (hashed concurrently).
+
+        The cache usage can be defined per file by passing a list of booleans
+        as useCache. In case the number of workers is not specified it is driven by
+        the environment variable "CENTIPEDE_FILEHASHER_WORKERS" (default 4).
+        """
+        filePaths = list(filePaths)
+        if not isinstance(useCache, list):
+            useCache = [useCache] * len(filePaths)
+
+        if workers is None:
+            workers = self.__defaultWorkers
+
+        workers = min(int(workers), len(filePaths))
+        if workers <= 1:
+            result = list(map(self.__hash, filePaths, useCache))
+        else:
+            pool = ThreadPool(workers)
+            try:
+                result = pool.map(lambda x: self.__hash(*x), zip(filePaths, useCache))
+            finally:
+                pool.close()
+                pool.join()
+
+        self.__commitCache()
+
+        return result
+
+    @classmethod
+    def availableAlgorithms(cls):
+        """
+        Return a list of algorithms that can be used by the hasher.
+        """
+        # shake algorithms are not supported since they require the length of the digest
+        result = sorted(filter(lambda x: not x.startswith('shake'), hashlib.algorithms_available))
+        if xxhash is not None:
+            result += list(filter(lambda x: hasattr(xxhash, x), cls.__xxhashAlgorithms))
+
+        return result
+
+    def __hash(self, filePath, useCache):
+        """
+        Return the hash about the file (the new hashes are only committed to the cache by __commitCache).
+        """
+        if not useCache or self.__cacheFailed:
+            return self.__computeHash(filePath)
+
+        fileStat = os.stat(filePath)
+        cacheKey = (
+            os.path.abspath(filePath),
+            self.algorithm(),
+            fileStat.st_size,
+            fileStat.st_mtime
+        )
+
+        row = None
+        with self.__lock:
+            try:
+                row = self.__query().execute(
+                    'SELECT hash FROM hashes WHERE path = ? AND algorithm = ? AND size = ? AND mtime = ?',
+                    cacheKey
+                ).fetchone()
+            except (sqlite3.Error, OSError) as err:
+                self.__disableCache(err)
+
+        if row is not None:
+            return row[0]
+
+        result = self.__computeHash(filePath)
+        if time.time() - fileStat.st_mtime > self.__racyInterval:
+            with self.__lock:
+                self.__pendingRows.append(cacheKey + (result,))
+
+        return result
+
+    def __commitCache(self):
+        """
+        Store the pending hashes in the cache (committed at once).
+        """
+        with self.__lock:
+            pendingRows = self.__pendingRows
+            self.__pendingRows = []
+            if not pendingRows or self.__cacheFailed:
+                return
+
+            try:
+                self.__query().executemany(
+                    'INSERT OR REPLACE INTO hashes (path, algorithm, size, mtime, hash) VALUES (?, ?, ?, ?, ?)',
+                    pendingRows
+                )
+                self.__connection.commit()
+            except (sqlite3.Error, OSError) as err:
+                self.__disableCache(err)
+
+    def __disableCache(self, error):
+        """
+        Stop using the cache (the files get hashed without it).
+        """
+        if self.__cacheFailed:
+            return
+
+        self.__cacheFailed = True
+        sys.stderr.write(
+            'file hasher cache disabled: "{}" ({})\n'.format(
+                self.cachePath(),
+                str(error)
+            )
+        )
+
+    def __computeHash(self, filePath):
+        """
+        Return the hash about the contents of the file reading it through a fixed size buffer.
+        """
+        if self.algorithm() in self.__xxhashAlgorithms:
+            hasher = getattr(xxhash, self.algorithm())()
+        else:
+            hasher = hashlib.new(self.algorithm())
+
+        buffer = bytearray(self.__bufferSize)
+        bufferView = memoryview(buffer)
+        with open(filePath, 'rb', buffering=0) as inputFile:
+            while True:
+                readSize = inputFile.readinto(buffer)
+                if not readSize:
+                    break
+                hasher.update(bufferView[:readSize])
+
+        return hasher.hexdigest()
+
+    def __query(self):
+        """
+        Return the connection to the cache file (created on demand).
+        """
+        if self.__connection is None:
+            cacheDirectory = os.path.dirname(self.cachePath())
+            if cacheDirectory and not os.path.exists(cacheDirectory):
+                os.makedirs(cacheDirectory)
+
+            # the connection is shared by the workers, the access to it
+            # is serialized through the lock
+            self.__connection = sqlite3.connect(
+                self.cachePath(),
+                timeout=60.0,
+                check_same_thread=False
+            )
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS hashes ('
+                'path TEXT NOT NULL, '
+                'algorithm TEXT NOT NULL, '
+                'size INTEGER NOT NULL, '
+                'mtime REAL NOT NULL, '
+                'hash TEXT NOT NULL, '
+                'PRIMARY KEY (path, algorithm))'
+            )
+
+        return self.__connection
@@ -2,4 +2,6 @@ from .Copy import Copy
 from .Checksum import Checksum
 from .Remove import Remove
 from .Chmod import Chmod
+from .FileCopier import FileCopier, FileCopierStrategyError, FileCopierTargetDirectoryError
+from .FileHasher import FileHasher, FileHasherAlgorithmError
 from .Copy import CopyTargetDirectoryError
@@ -2,11 +2,16 @@ import os
 import subprocess
 from collections import OrderedDict
 from ..Task import Task
+from ...Crawler.Fs.Image import FrameSequence
 
 class FFmpeg(Task):
     """
     Abstracted ffmpeg task.
 
+    The input can be either the crawlers about the frames or a single
+    FrameSequence crawler about the whole sequence (it does not need to be
+    expanded to frames). The sequence is encoded starting from its first frame.
+
     Options:
         - optional: scale (float), videoCoded, pixelFormat and bitRate
         - required: sourceColorSpace, targetColorSpace and frameRate (float)
@@ -61,7 +66,9 @@ class FFmpeg(Task):
         Execute ffmpeg.
         """
         crawler = sequenceCrawlers[0]
-        startFrame = crawler.var('frame')
+
+        # the crawlers may mix sequences and frames (in any order)
+        frameRanges = FrameSequence.frameRangesFromCrawlers(sequenceCrawlers)
 
         # building an image sequence name that ffmpeg undertands that is a file
         # sequence (aka foo.%04d.ext)
@@ -95,7 +102,7 @@ class FFmpeg(Task):
             ),
             # start frame
             '-start_number {0}'.format(
-                startFrame
+                frameRanges.first()
             ),
             # input sequence
             '-i "{0}"'.format(
@@ -5,6 +5,7 @@ import subprocess
 from collections import OrderedDict
 from ..Task import Task
 from ...Template import Template
+from ...Crawler.Fs.Image import FrameSequence
 
 # compatibility with python 2/3
 try:
@@ -25,6 +26,12 @@ class NukeScript(Task):
 
     Reading options inside of nuke, the options are available as a global "options":
     myOption = options['myOption']
+
+    The input can be either the crawlers about the frames or a single
+    FrameSequence crawler about the whole sequence (it does not need to be
+    expanded to frames). The frames of the sequence are available through the
+    options: startFrame, endFrame and frameRanges (for instance "1001-1003,1005"),
+    which can be used by the script to skip the missing frames (gaps).
     """
 
     def __init__(self, *args, **kwargs):
@@ -52,8 +59,9 @@ class NukeScript(Task):
         # calling nuke script
         for targetSequenceFilePath, sequenceCrawlers in sequenceFiles.items():
             crawler = sequenceCrawlers[0]
-            startFrame = sequenceCrawlers[0].var('frame')
-            endFrame = sequenceCrawlers[-1].var('frame')
+
+            # the crawlers may mix sequences and frames (in any order)
+            frameRanges = FrameSequence.frameRangesFromCrawlers(sequenceCrawlers)
             targetSequenceFilePath = self.target(crawler)
 
             # nuke does not create folders at render time, creating them
@@ -85,8 +93,9 @@ class NukeScript(Task):
             options = {
                 'sourceSequence': sourceSequenceFilePath,
                 'targetSequence': targetSequenceFilePath,
-                'startFrame': startFrame,
-                'endFrame': endFrame
+                'startFrame': frameRanges.first(),
+                'endFrame': frameRanges.last(),
+                'frameRanges': frameRanges.toString()
             }
 
             for optionName in self.optionNames():
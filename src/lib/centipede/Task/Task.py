@@ -1,5 +1,8 @@
-import json
+import os
 import sys
+import copy
+import json
+from multiprocessing.pool import ThreadPool
 from ..Resource import Resource
 from ..Crawler.Fs import FsPath
 from ..Crawler import Crawler
@@ -35,9 +38,12 @@ class Task(object):
 
     Task Metadata:
         - output.verbose: boolean used to print out the output of the task (default False)
+        - dispatch.split: boolean telling the crawlers can be processed independently (default False)
+        - dispatch.splitSize: number of crawlers processed per chunk when the task is split
     """
 
     __registered = {}
+    __defaultOutputWorkers = int(os.environ.get('CENTIPEDE_TASK_OUTPUT_WORKERS', 1))
 
     def __init__(self, taskType):
         """
@@ -209,9 +215,17 @@ class Task(object):
         """
         self.__crawlers.clear()
 
-    def output(self):
+    def output(self, workers=None):
         """
         Perform and result a list of crawlers created by task.
+
+        Tasks marked with "dispatch.split" are performed in chunks of crawlers
+        (driven by "dispatch.splitSize" or evenly divided by the workers) through
+        a pool of threads when more than one worker is used. In case the number
+        of workers is not specified it is driven by the environment variable
+        "CENTIPEDE_TASK_OUTPUT_WORKERS" (default 1). The crawlers sharing the same
+        target are always performed by the same chunk, and the output crawlers are
+        returned in the same order as performing the task at once.
         """
         verbose = self.hasMetadata('output.verbose') and self.metadata('output.verbose')
         if verbose:
@@ -223,7 +237,7 @@ class Task(object):
                 if ctxVarName not in contextVars:
                     contextVars[ctxVarName] = crawler.var(ctxVarName)
 
-        outputCrawlers = self._perform()
+        outputCrawlers = self.__performChunks(workers)
 
         # Copy all context variables to output crawlers
         for outputCrawler in outputCrawlers:
@@ -247,21 +261,7 @@ class Task(object):
         """
         Clone the current task.
         """
-        clone = self.__class__(self.type())
-
-        # copying options
-        for optionName in self.optionNames():
-            clone.setOption(optionName, self.option(optionName))
-
-        # copying metadata
-        for metadataName in self.metadataNames():
-            clone.setMetadata(metadataName, self.metadata(metadataName))
-
-        # copying crawlers
-        for crawler in self.crawlers():
-            clone.add(crawler, self.target(crawler))
-
-        return clone
+        return self.__cloneTask(self.crawlers())
 
     def toJson(self):
         """
@@ -279,13 +279,15 @@ class Task(object):
         for optionName in self.optionNames():
             options[optionName] = self.option(optionName)
 
-        # crawler data
-        crawlerData = []
-        for crawler in self.crawlers():
-            crawlerData.append({
-                'filePath': self.target(crawler),
-                'serializedCrawler': crawler.toJson()
-            })
+        # crawler data (the crawlers are serialized as a batch, since
+        # it's much more compact than serializing them individually)
+        crawlers = self.crawlers()
+        crawlerData = {}
+        if crawlers:
+            crawlerData = {
+                'filePaths': list(map(self.target, crawlers)),
+                'batch': Crawler.serializeBatch(crawlers)
+            }
 
         # custom resources
         loadedResources = Resource.get().loaded(ignoreFromEnvironment=True)
@@ -306,8 +308,7 @@ class Task(object):
         return json.dumps(
             contents,
             sort_keys=True,
-            indent=4,
-            separators=(',', ': ')
+            separators=(',', ':')
         )
 
     @staticmethod
@@ -370,12 +371,19 @@ class Task(object):
             task.setMetadata(metadataName, metadataValue)
 
         # adding crawlers
-        for crawlerDataItem in crawlerData:
-            filePath = crawlerDataItem['filePath']
-            crawler = Crawler.createFromJson(
-                crawlerDataItem['serializedCrawler']
-            )
-            task.add(crawler, filePath)
+        if isinstance(crawlerData, list):
+            # backwards compatibility: crawlers serialized individually
+            for crawlerDataItem in crawlerData:
+                filePath = crawlerDataItem['filePath']
+                crawler = Crawler.createFromJson(
+                    crawlerDataItem['serializedCrawler']
+                )
+                task.add(crawler, filePath)
+
+        elif crawlerData:
+            crawlers = Crawler.createFromBatch(crawlerData['batch'])
+            for crawler, filePath in zip(crawlers, crawlerData['filePaths']):
+                task.add(crawler, filePath)
 
         return task
 
@@ -393,3 +401,69 @@ class Task(object):
                 filePaths.append(filePath)
 
         return list(map(FsPath.createFromPath, filePaths))
+
+    def __cloneTask(self, crawlers):
+        """
+        Return a clone of the current task only including the input crawlers.
+        """
+        clone = self.__class__(self.type())
+
+        # copying options
+        for optionName in self.optionNames():
+            clone.setOption(optionName, copy.deepcopy(self.option(optionName)))
+
+        # copying metadata (the metadata only holds json compatible data
+        # therefore it can be deep copied directly)
+        clone.__metadata = copy.deepcopy(self.__metadata)
+
+        # copying crawlers
+        for crawler in crawlers:
+            clone.add(crawler, self.target(crawler))
+
+        return clone
+
+    def __performChunks(self, workers):
+        """
+        Perform the task splitting the crawlers in chunks performed in parallel (when possible).
+        """
+        if workers is None:
+            workers = self.__defaultOutputWorkers
+
+        workers = int(workers)
+        crawlers = self.crawlers()
+        isSplit = self.hasMetadata('dispatch.split') and self.metadata('dispatch.split')
+        if workers <= 1 or not isSplit or len(crawlers) < 2:
+            return self._perform()
+
+        chunkSize = -(-len(crawlers) // workers)
+        if self.hasMetadata('dispatch.splitSize') and self.metadata('dispatch.splitSize') > 0:
+            chunkSize = self.metadata('dispatch.splitSize')
+
+        # grouping the crawlers by target, so crawlers sharing the same
+        # target end up in the same chunk
+        targetCrawlers = OrderedDict()
+        for crawler in crawlers:
+            targetCrawlers.setdefault(self.target(crawler), []).append(crawler)
+
+        chunks = [[]]
+        for groupCrawlers in targetCrawlers.values():
+            if chunks[-1] and len(chunks[-1]) + len(groupCrawlers) > chunkSize:
+                chunks.append([])
+            chunks[-1] += groupCrawlers
+
+        if len(chunks) == 1:
+            return self._perform()
+
+        chunkTasks = list(map(self.__cloneTask, chunks))
+        pool = ThreadPool(min(workers, len(chunkTasks)))
+        try:
+            chunkOutputs = pool.map(lambda x: x._perform(), chunkTasks)
+        finally:
+            pool.close()
+            pool.join()
+
+        result = []
+        for chunkOutput in chunkOutputs:
+            result += chunkOutput
+
+        return result
@@ -2,6 +2,12 @@ import os
 import json
 import shutil
 from ..Task import Task
+from ..Fs.FileCopier import FileCopier
+from .VersionManifest import VersionManifest
+from .DataJournal import DataJournal
+
+# backward compatibility: the error used to be defined by this module
+from .DataJournal import FailedToLockDataError  # noqa: F401
 
 class FileNotUnderDataDirectoryError(Exception):
     """File Not Under Data Directory Error."""
@@ -18,35 +24,59 @@ class MakeDirsError(Exception):
 class CopyFileError(Exception):
     """Copy File Error."""
 
-class FailedToLockDataError(Exception):
-    """Failed To Lock Data Error."""
-
 class InvalidInfoError(Exception):
     """Invalid Info Error."""
 
 class CreateData(Task):
     """
     ABC for creating data.
+
+    Options:
+        - transferStrategy: strategy used to transfer the files to the data
+        directory (hardlink, reflink, copyFileRange or copy). The strategies
+        fall back automatically when not supported (for instance hardlinks
+        across devices). Default driven by the environment variable
+        "CENTIPEDE_CREATEDATA_TRANSFER_STRATEGY" (default: reflink).
+        - compactJournal: "data.json" and "info.json" are written through
+        journals (DataJournal), each chunk of the task only appends to them.
+        The journals are compacted once when the output of the task is finished
+        (after all chunks have been performed) by default. Tasks publishing to
+        the same data from different processes (for instance split chunks on
+        the farm) can disable it and call compactJournals once all of them are
+        done.
     """
 
     __dataDirectoryName = "data"
+    __defaultTransferStrategy = os.environ.get('CENTIPEDE_CREATEDATA_TRANSFER_STRATEGY', 'reflink')
 
     def __init__(self, *args, **kwargs):
         """
         Create data.
         """
         super(CreateData, self).__init__(*args, **kwargs)
-        self.__files = {}
+        self.__manifest = VersionManifest()
         self.__info = {}
         self.__loadedStaticData = False
+        self.setOption('transferStrategy', self.__defaultTransferStrategy)
+        self.setOption('compactJournal', True)
 
     def copyFile(self, sourceFile, targetFile):
         """
         Auxiliary method used to copy a file by creating any necessary directories.
         """
-        self.makeDirs(os.path.dirname(targetFile))
+        self.copyFiles([(sourceFile, targetFile)])
 
-        shutil.copyfile(sourceFile, targetFile)
+    def copyFiles(self, filePaths):
+        """
+        Auxiliary method used to copy a list of (source file, target file) in parallel.
+
+        Any necessary directories are created automatically and the files are
+        transferred using the strategy defined by the option "transferStrategy".
+        """
+        FileCopier(
+            strategy=self.option('transferStrategy'),
+            skipUnchanged=False
+        ).copyFiles(filePaths)
 
     def makeDirs(self, targetPath):
         """
@@ -120,77 +150,89 @@ class CreateData(Task):
 
         assert isinstance(metadata, dict), "metadata needs to be a dict or None"
 
-        # making metadata immutable
-        metadata = dict(metadata)
-
-        # querying the stats about the file
-        fileStat = os.stat(filePath)
+        self.__manifest.addFile(filePath, metadata)
 
-        # getting file size
-        metadata['size'] = fileStat.st_size
-
-        # adding type based on the file ext when it's not defined
-        if 'type' not in metadata:
-            metadata['type'] = os.path.splitext(filePath)[-1][1:]
+    def addFiles(self, filePaths, metadata=None):
+        """
+        Add a list of published files that are under the 'data' directory.
 
-        self.__files[filePath] = metadata
+        The stats about the files are collected in parallel, each file is
+        added through addFile (using the same metadata).
+        """
+        self.__manifest.collectStats(filePaths)
+        for filePath in filePaths:
+            self.addFile(filePath, metadata)
 
     def files(self):
         """
         Return a list of published file names under data.
         """
-        return list(self.__files.keys())
+        return self.__manifest.files()
 
     def fileMetadata(self, filePath):
         """
         Return the metadata for the input file path.
         """
-        if filePath in self.__files:
-            # we don't want to share implicitly the metadata object.
-            return dict(self.__files[filePath])
+        if self.__manifest.hasFile(filePath):
+            return self.__manifest.fileMetadata(filePath)
 
         raise MetadataNotFoundError(
             'Could not find metadata for the file "{0}"'.format(filePath)
         )
 
-    def updateInfo(self):
+    def manifest(self):
         """
-        Update info.json file with new file data.
+        Return the VersionManifest about the published files.
         """
-        infoJsonFilePath = os.path.join(self.rootPath(), "info.json")
-        infoDict = {}
-        if os.path.exists(infoJsonFilePath):
-            with open(infoJsonFilePath, 'r') as jsonOutFile:
-                infoDict = json.load(jsonOutFile)
+        return self.__manifest
 
-        totalSize = 0
-        for fileName, metadata in self.__files.items():
-            totalSize += metadata['size']
+    def updateInfo(self):
+        """
+        Update info.json file with new file data.
 
-        self.addInfo('size', infoDict.get('size', 0) + totalSize)
+        The info is appended to the info journal, the size gets added to the
+        size of the files already published and the remaining info that is
+        already published takes precedence.
+        """
+        self.addInfo('size', self.__manifest.totalSize())
         self.addInfo('user', os.environ.get('USERNAME', ''))
 
-        self.__info.update(infoDict)
-        # writing info json file
-        with open(infoJsonFilePath, 'w') as jsonOutFile:
-            json.dump(self.__info, jsonOutFile, indent=4, sort_keys=True)
+        infoJournal = self.infoJournal(self.rootPath())
+        with infoJournal.lock():
+            infoJournal.append(self.__info)
+            self.__info.update(infoJournal.read())
 
     def updateData(self):
         """
         Update data.json file with new files.
         """
-        dataJsonFilePath = os.path.join(self.rootPath(), "data.json")
-        filesData = {}
-        if os.path.exists(dataJsonFilePath):
-            with open(dataJsonFilePath, 'r') as jsonOutFile:
-                filesData = json.load(jsonOutFile)
+        self.dataJournal(self.rootPath()).append(
+            self.__manifest.data(self.rootPath())
+        )
 
-        for filePath, metadata in self.__files.items():
-            relativePath = filePath[len(self.rootPath()) + 1:]
-            filesData[relativePath] = metadata
+    @classmethod
+    def compactJournals(cls, rootPath):
+        """
+        Compact the journals into "data.json" and "info.json" under the root path.
+        """
+        dataJournal = cls.dataJournal(rootPath)
+        with dataJournal.lock():
+            cls.infoJournal(rootPath).compact()
+            dataJournal.compact()
+
+    @staticmethod
+    def dataJournal(rootPath):
+        """
+        Return the journal (DataJournal) about "data.json" under the root path.
+        """
+        return DataJournal(os.path.join(rootPath, "data.json"))
 
-        with open(dataJsonFilePath, 'w') as jsonOutFile:
-            json.dump(filesData, jsonOutFile, indent=4, sort_keys=True)
+    @staticmethod
+    def infoJournal(rootPath):
+        """
+        Return the journal (DataJournal) about "info.json" under the root path.
+        """
+        return DataJournal(os.path.join(rootPath, "info.json"), CreateData.__mergeInfo)
 
     def add(self, *args, **kwargs):
         """
@@ -199,14 +241,27 @@ class CreateData(Task):
         super(CreateData, self).add(*args, **kwargs)
         self.__loadStaticData()
 
+    def output(self, workers=None):
+        """
+        Run the task finalizing the journals once all the chunks have been performed.
+        """
+        result = super(CreateData, self).output(workers)
+
+        if self.option('compactJournal') and self.crawlers():
+            self.compactJournals(self.rootPath())
+
+        return result
+
     def _perform(self):
         """
-        Perform the task.
+        Perform the task (only appending to the journals).
         """
-        self.__writeEnv()
-        self.__copyCentipedeConfig()
-        self.updateInfo()
-        self.updateData()
+        dataJournal = self.dataJournal(self.rootPath())
+        with dataJournal.lock():
+            self.__writeEnv()
+            self.__copyCentipedeConfig()
+            self.updateInfo()
+            self.updateData()
 
         return super(CreateData, self)._perform()
 
@@ -244,3 +299,16 @@ class CreateData(Task):
         crawler = self.crawlers()[0]
         self.__rootPath = self.target(crawler)
         self.__configPath = crawler.var('configPath')
+
+    @staticmethod
+    def __mergeInfo(contents, entry):
+        """
+        Merge an info entry (the size is added, otherwise the info already published takes precedence).
+        """
+        for key, value in entry.items():
+            if key == 'size':
+                contents['size'] = contents.get('size', 0) + value
+            elif key not in contents:
+                contents[key] = value
+
+        return contents
@@ -1,5 +1,4 @@
 import os
-import json
 from ..Task import Task
 from .CreateVersion import CreateVersion
 
@@ -56,13 +55,10 @@ class CreateIncrementalVersion(CreateVersion):
             'v{0}'.format(str(version).zfill(3))
         )
 
-        incrementalVersionData = os.path.join(
-            incrementalVersionPath,
-            "data.json"
-        )
+        incrementalVersionData = self.dataJournal(incrementalVersionPath)
 
         # making sure the incremental version exists
-        if not os.path.exists(incrementalVersionData):
+        if not incrementalVersionData.exists():
             return
 
         # getting all file paths from the current version
@@ -71,8 +67,8 @@ class CreateIncrementalVersion(CreateVersion):
             self.files()
         ))
 
-        with open(incrementalVersionData) as f:
-            incrementalVersionContents = json.load(f)
+        # the data of the incremental version may not be compacted yet
+        incrementalVersionContents = incrementalVersionData.read()
 
         for fileEntry, fileMetadata in incrementalVersionContents.items():
 
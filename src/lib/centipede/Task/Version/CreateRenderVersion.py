@@ -21,25 +21,33 @@ class CreateRenderVersion(CreateIncrementalVersion):
         Perform the task.
         """
         sourceScenes = set()
+        sourceDirectories = set()
+        filePaths = []
 
         for crawler in self.crawlers():
 
             targetFile = self._computeRenderTargetLocation(crawler)
-            # copying the render file
-            self.copyFile(crawler.var('filePath'), targetFile)
-            self.addFile(targetFile)
+            filePaths.append((crawler.var('filePath'), targetFile))
 
             # Crawl from source directory for scenes to save along with data
+            # (all the frames of a render usually share the same source directory)
+            if crawler.var('sourceDirectory') in sourceDirectories:
+                continue
+            sourceDirectories.add(crawler.var('sourceDirectory'))
+
             crawler = FsPath.createFromPath(crawler.var('sourceDirectory'))
             sceneCrawlers = crawler.glob([Scene])
             for sceneCrawler in sceneCrawlers:
                 sourceScenes.add(sceneCrawler.var('filePath'))
 
-        # Copy source scenes
-        for sourceScene in sourceScenes:
+        # source scenes
+        for sourceScene in sorted(sourceScenes):
             targetScene = os.path.join(self.dataPath(), os.path.basename(sourceScene))
-            self.copyFile(sourceScene, targetScene)
-            self.addFile(targetScene)
+            filePaths.append((sourceScene, targetScene))
+
+        # copying the render files and scenes in parallel
+        self.copyFiles(filePaths)
+        self.addFiles(list(map(lambda x: x[1], filePaths)))
 
         # Exclude all work scenes and movies from incremental versioning
         exclude = set()
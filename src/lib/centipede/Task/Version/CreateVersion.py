@@ -1,9 +1,14 @@
 import os
 import time
+import errno
 from ..Task import Task
+from ...VersionIndex import VersionIndex
 from ...Crawler.Fs import FsPath
 from .CreateData import CreateData
 
+# backward compatibility: the error used to be defined by this module
+from .DataJournal import FailedToLockDataError  # noqa: F401
+
 class FileNotUnderDataDirectoryError(Exception):
     """File Not Under Data Directory Error."""
 
@@ -19,9 +24,6 @@ class MakeDirsError(Exception):
 class CopyFileError(Exception):
     """Copy File Error."""
 
-class FailedToLockDataError(Exception):
-    """Failed To Lock Data Error."""
-
 class CreateVersion(CreateData):
     """
     ABC for creating a version.
@@ -36,6 +38,8 @@ class CreateVersion(CreateData):
         "variant"
     ]
 
+    __versionIndex = VersionIndex()
+
     def __init__(self, *args, **kwargs):
         """
         Create a version.
@@ -44,6 +48,7 @@ class CreateVersion(CreateData):
 
         self.__startTime = time.time()
         self.__loadedStaticData = False
+        self.__reservedVersionPath = None
 
     def version(self):
         """
@@ -57,6 +62,18 @@ class CreateVersion(CreateData):
         """
         return self.rootPath()
 
+    def rootPath(self):
+        """
+        Return the root path (version base folder) where the data directory and json files should exist.
+
+        In case the version has been taken by another publisher when the task
+        runs, it returns the path of the version reserved instead.
+        """
+        if self.__reservedVersionPath is not None:
+            return self.__reservedVersionPath
+
+        return super(CreateVersion, self).rootPath()
+
     def versionName(self):
         """
         Return the name of the version base folder.
@@ -73,16 +90,16 @@ class CreateVersion(CreateData):
         # the task is going to be executed right away (since tasks can be serialized).
         self.__loadStaticData()
 
-    def output(self):
+    def output(self, workers=None):
         """
         Run the task.
 
         We need to wrap this call to make sure the versionPath is created before
         any of the sub-classes try to write to it through _perform.
         """
-        os.makedirs(self.versionPath())
+        self.__reserveVersion()
 
-        return super(CreateVersion, self).output()
+        return super(CreateVersion, self).output(workers)
 
     def _perform(self):
         """
@@ -90,9 +107,15 @@ class CreateVersion(CreateData):
         """
         super(CreateVersion, self)._perform()
 
-        # Find all the crawlers for data that was created for this version
-        crawler = FsPath.createFromPath(self.dataPath())
-        dataCrawlers = crawler.glob()
+        # Find all the crawlers for data that was created for this version. The
+        # data directory is the source of truth: the crawlers are only built from
+        # the manifest (avoiding stat calls) when it describes all the files
+        # found there, otherwise files written without addFile would be missed
+        if self.manifest().describes(self.dataPath()):
+            dataCrawlers = self.manifest().crawlers(self.dataPath())
+        else:
+            crawler = FsPath.createFromPath(self.dataPath())
+            dataCrawlers = crawler.glob()
 
         # Add json files
         for jsonFile in ["info.json", "data.json", "env.json"]:
@@ -119,6 +142,37 @@ class CreateVersion(CreateData):
 
         super(CreateVersion, self).updateInfo()
 
+    def __reserveVersion(self):
+        """
+        Reserve the version by creating its directory.
+
+        The directory is created through a single mkdir, which works as an
+        atomic claim. When the version has been already taken by another
+        publisher (for instance both resolved the same version through newver),
+        the next free version is reserved through the VersionIndex instead and
+        the task publishes to it (versionPath and version are updated).
+        """
+        versionsPath = os.path.dirname(self.versionPath())
+        if not os.path.isdir(versionsPath):
+            try:
+                os.makedirs(versionsPath)
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+
+        try:
+            os.mkdir(self.versionPath())
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                raise
+
+            version = self.__versionIndex.reserve(versionsPath)
+            self.__reservedVersionPath = os.path.join(
+                versionsPath,
+                VersionIndex.versionName(version)
+            )
+            self.__version = version
+
     def __loadStaticData(self):
         """
         Load the static information about the publish.
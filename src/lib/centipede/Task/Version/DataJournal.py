@@ -0,0 +1,258 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+# file locking is only available on unix
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class FailedToLockDataError(Exception):
+    """Failed To Lock Data Error."""
+
+class DataJournal(object):
+    """
+    Append-only journal about the contents of a json file (for instance "data.json").
+
+    Rather than reading, merging and rewriting the whole json file each time
+    new contents are written, the contents are appended as a json line to a
+    journal file living alongside the json file ("data.json" -> "data.jsonl").
+    The journal gets compacted into the json file when the data is finalized.
+
+    The writers take an exclusive lock (fcntl) on a lock file ("data.json.lock"),
+    therefore multiple processes (for instance chunks of a task running on the
+    farm) can write to the same journal concurrently. The lock timeout is driven
+    by the environment variable "CENTIPEDE_DATAJOURNAL_LOCK_TIMEOUT" (default
+    60 seconds), FailedToLockDataError is raised when the lock cannot be acquired.
+    The lock file is removed by compact, so it does not remain in the published
+    data once the journal has been finalized.
+
+    The merge callable receives the current contents (dict) and a journal entry
+    (dict) and returns the merged contents, by default the entry updates the
+    current contents.
+
+    Example:
+        dataJournal = DataJournal('/jobs/RND/v001/data.json')
+        dataJournal.append({'data/file.exr': {'size': 1024}})
+        dataJournal.compact()
+
+    """
+
+    __lockTimeout = float(os.environ.get('CENTIPEDE_DATAJOURNAL_LOCK_TIMEOUT', 60.0))
+    __lockRetryInterval = 0.05
+
+    # the lock files held by the current process, since the fcntl locks are
+    # bound to the open file (two journal objects about the same json file
+    # would otherwise block each other)
+    __heldLocks = {}
+    __heldLocksLock = threading.Lock()
+
+    def __init__(self, jsonFilePath, mergeCallable=None):
+        """
+        Create a data journal object.
+        """
+        if mergeCallable is None:
+            mergeCallable = self.__updateContents
+
+        self.__jsonFilePath = jsonFilePath
+        self.__mergeCallable = mergeCallable
+
+    def jsonFilePath(self):
+        """
+        Return the path for the json file.
+        """
+        return self.__jsonFilePath
+
+    def journalFilePath(self):
+        """
+        Return the path for the journal file.
+        """
+        return os.path.splitext(self.jsonFilePath())[0] + '.jsonl'
+
+    def lockFilePath(self):
+        """
+        Return the path for the lock file.
+        """
+        return self.jsonFilePath() + '.lock'
+
+    def exists(self):
+        """
+        Return a boolean telling if either the json file or the journal file exist.
+        """
+        return os.path.exists(self.jsonFilePath()) or os.path.exists(self.journalFilePath())
+
+    @contextmanager
+    def lock(self):
+        """
+        Context manager that holds the exclusive lock about the journal (re-entrant).
+        """
+        lockFilePath = os.path.abspath(self.lockFilePath())
+        with DataJournal.__heldLocksLock:
+            if lockFilePath not in DataJournal.__heldLocks:
+                DataJournal.__heldLocks[lockFilePath] = {
+                    'threadLock': threading.RLock(),
+                    'depth': 0,
+                    'lockFile': None,
+                    'removeOnRelease': False
+                }
+            heldLock = DataJournal.__heldLocks[lockFilePath]
+
+        with heldLock['threadLock']:
+            if heldLock['depth'] == 0:
+                heldLock['lockFile'] = self.__acquireLock(lockFilePath)
+            heldLock['depth'] += 1
+
+            try:
+                yield
+            finally:
+                heldLock['depth'] -= 1
+                if heldLock['depth'] == 0:
+                    # the lock file is removed while still locked, the processes
+                    # waiting for it detect the removal and lock a new file
+                    if heldLock['removeOnRelease']:
+                        heldLock['removeOnRelease'] = False
+                        try:
+                            os.remove(lockFilePath)
+                        except OSError:
+                            pass
+
+                    self.__releaseLock(heldLock['lockFile'])
+                    heldLock['lockFile'] = None
+
+    def append(self, entry):
+        """
+        Append an entry (dict) to the journal.
+        """
+        assert isinstance(entry, dict), "entry needs to be a dict"
+
+        line = json.dumps(entry, sort_keys=True) + '\n'
+        with self.lock():
+            with open(self.journalFilePath(), 'a') as journalFile:
+                journalFile.write(line)
+                journalFile.flush()
+                os.fsync(journalFile.fileno())
+
+    def entries(self):
+        """
+        Return a list of the entries in the journal (not compacted yet).
+        """
+        if not os.path.exists(self.journalFilePath()):
+            return []
+
+        result = []
+        with open(self.journalFilePath(), 'r') as journalFile:
+            for line in journalFile:
+                # ignoring an incomplete line (from an interrupted writer)
+                if not line.endswith('\n'):
+                    break
+                result.append(json.loads(line))
+
+        return result
+
+    def read(self):
+        """
+        Return the contents of the json file merged with the entries of the journal.
+
+        The read does not require write access to the journal, therefore it
+        does not take the lock. Wrap the call with lock when the result must be
+        consistent with concurrent writers.
+        """
+        contents = {}
+        if os.path.exists(self.jsonFilePath()):
+            with open(self.jsonFilePath(), 'r') as jsonFile:
+                contents = json.load(jsonFile)
+
+        for entry in self.entries():
+            contents = self.__mergeCallable(contents, entry)
+
+        return contents
+
+    def compact(self):
+        """
+        Merge the journal into the json file removing the journal afterwards.
+
+        The lock file is removed as well once the lock is released.
+        """
+        with self.lock():
+            DataJournal.__heldLocks[os.path.abspath(self.lockFilePath())]['removeOnRelease'] = True
+
+            if not os.path.exists(self.journalFilePath()):
+                return
+
+            contents = self.read()
+
+            # writing to a temporary file first, so readers never see a partial json file
+            temporaryFilePath = '{}.{}.tmp'.format(self.jsonFilePath(), os.getpid())
+            with open(temporaryFilePath, 'w') as jsonFile:
+                json.dump(contents, jsonFile, indent=4, sort_keys=True)
+            getattr(os, 'replace', os.rename)(temporaryFilePath, self.jsonFilePath())
+
+            os.remove(self.journalFilePath())
+
+    @classmethod
+    def __acquireLock(cls, lockFilePath):
+        """
+        Return the lock file once it has been locked.
+        """
+        lockFile = open(lockFilePath, 'a')
+
+        # locking is not supported (for instance windows)
+        if fcntl is None:
+            return lockFile
+
+        startTime = time.time()
+        while True:
+            try:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except (IOError, OSError):
+                if time.time() - startTime > cls.__lockTimeout:
+                    lockFile.close()
+                    raise FailedToLockDataError(
+                        'Failed to lock "{}" after {} seconds'.format(
+                            lockFilePath,
+                            cls.__lockTimeout
+                        )
+                    )
+                time.sleep(cls.__lockRetryInterval)
+                continue
+
+            # making sure the lock file has not been removed (compact) while
+            # waiting for it, otherwise locking the new lock file
+            if cls.__isSameFile(lockFile, lockFilePath):
+                return lockFile
+
+            cls.__releaseLock(lockFile)
+            lockFile = open(lockFilePath, 'a')
+
+    @staticmethod
+    def __isSameFile(lockFile, lockFilePath):
+        """
+        Return a boolean telling if the open lock file is still the file found under the lock file path.
+        """
+        try:
+            pathStat = os.stat(lockFilePath)
+        except OSError:
+            return False
+
+        fileStat = os.fstat(lockFile.fileno())
+        return (fileStat.st_dev, fileStat.st_ino) == (pathStat.st_dev, pathStat.st_ino)
+
+    @staticmethod
+    def __releaseLock(lockFile):
+        """
+        Unlock and close the lock file.
+        """
+        if fcntl is not None:
+            fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+        lockFile.close()
+
+    @staticmethod
+    def __updateContents(contents, entry):
+        """
+        Merge the entry by updating the contents (default merge callable).
+        """
+        contents.update(entry)
+        return contents
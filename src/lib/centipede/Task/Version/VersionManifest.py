@@ -0,0 +1,232 @@
+import os
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+from ...Crawler.Fs import FsPath
+from ...PathHolder import PathHolder
+
+class VersionManifestFileNotFoundError(Exception):
+    """Version Manifest File Not Found Error."""
+
+class VersionManifest(object):
+    """
+    Keeps track of the files written to a version alongside their stat data.
+
+    The files are stat-ed once when they are added to the manifest (stats can
+    be collected in parallel for a batch of files through collectStats). The
+    contents of "data.json" and the total size of the files are built from the
+    manifest. The crawlers about the files can be built from the manifest as
+    well (without dispatching a stat per file), as long as the manifest
+    describes all the entries found in the data directory (take a look at
+    describes).
+
+    Example:
+        versionManifest = VersionManifest()
+        versionManifest.collectStats(filePaths)
+        for filePath in filePaths:
+            versionManifest.addFile(filePath)
+        versionManifest.crawlers(dataPath)
+
+    """
+
+    __defaultWorkers = int(os.environ.get('CENTIPEDE_VERSIONMANIFEST_WORKERS', 8))
+
+    def __init__(self):
+        """
+        Create a version manifest object.
+        """
+        self.__files = OrderedDict()
+        self.__fileStats = {}
+        self.__collectedStats = {}
+
+    def addFile(self, filePath, metadata=None):
+        """
+        Add a file to the manifest.
+
+        The metadata gets the "size" of the file and the "type" (based on the
+        file extension when not defined).
+        """
+        if metadata is None:
+            metadata = {}
+
+        # making metadata immutable
+        metadata = dict(metadata)
+
+        # using the stat data collected previously (when available)
+        fileStat = self.__collectedStats.pop(filePath, None)
+        if fileStat is None:
+            fileStat = os.stat(filePath)
+
+        # getting file size
+        metadata['size'] = fileStat.st_size
+
+        # adding type based on the file ext when it's not defined
+        if 'type' not in metadata:
+            metadata['type'] = os.path.splitext(filePath)[-1][1:]
+
+        self.__files[filePath] = metadata
+        self.__fileStats[filePath] = fileStat
+
+    def collectStats(self, filePaths, workers=None):
+        """
+        Stat a batch of files in parallel, the result is used when the files get added.
+
+        In case the number of workers is not specified it is driven by the
+        environment variable "CENTIPEDE_VERSIONMANIFEST_WORKERS" (default 8).
+        """
+        filePaths = list(filter(lambda x: x not in self.__collectedStats, filePaths))
+        if workers is None:
+            workers = self.__defaultWorkers
+        workers = min(max(int(workers), 1), len(filePaths))
+
+        if workers <= 1:
+            fileStats = list(map(os.stat, filePaths))
+        else:
+            pool = ThreadPool(workers)
+            try:
+                fileStats = pool.map(os.stat, filePaths)
+            finally:
+                pool.close()
+                pool.join()
+
+        self.__collectedStats.update(zip(filePaths, fileStats))
+
+    def files(self):
+        """
+        Return a list of the file paths in the manifest (in the order they were added).
+        """
+        return list(self.__files.keys())
+
+    def hasFile(self, filePath):
+        """
+        Return a boolean telling if the file is in the manifest.
+        """
+        return filePath in self.__files
+
+    def fileMetadata(self, filePath):
+        """
+        Return the metadata for the input file path.
+        """
+        self.__validateFile(filePath)
+
+        # we don't want to share implicitly the metadata object.
+        return dict(self.__files[filePath])
+
+    def fileStat(self, filePath):
+        """
+        Return the stat result about the input file path.
+        """
+        self.__validateFile(filePath)
+
+        return self.__fileStats[filePath]
+
+    def totalSize(self):
+        """
+        Return the total size of the files in the manifest.
+        """
+        return sum(map(lambda x: x['size'], self.__files.values()))
+
+    def data(self, rootPath):
+        """
+        Return a dict with the metadata about the files using paths relative to the root path.
+
+        This information is used to write "data.json".
+        """
+        result = {}
+        for filePath, metadata in self.__files.items():
+            relativePath = filePath[len(rootPath) + 1:]
+            result[relativePath] = dict(metadata)
+
+        return result
+
+    def describes(self, dataPath):
+        """
+        Return a boolean telling if the manifest describes exactly the files and directories found under the data path.
+
+        Files written to the data path without being added to the manifest (or
+        added files that no longer exist) make the result False. The data path
+        is only listed (the entries are not stat-ed).
+        """
+        dataPath = os.path.normpath(dataPath)
+        foundPaths = set()
+        for currentPath, directoryNames, fileNames in os.walk(dataPath):
+            for name in directoryNames + fileNames:
+                foundPaths.add(os.path.join(currentPath, name))
+
+        manifestPaths = set()
+        for filePath in self.__files.keys():
+            if not filePath.startswith(dataPath + os.sep):
+                continue
+
+            # including the directories holding the file
+            while filePath != dataPath and filePath not in manifestPaths:
+                manifestPaths.add(filePath)
+                filePath = os.path.dirname(filePath)
+
+        return foundPaths == manifestPaths
+
+    def crawlers(self, dataPath):
+        """
+        Return a list of crawlers about the data path, its sub-directories and the files under it.
+
+        The crawlers are listed in the same order as a glob on the data path would
+        return them (depth-first), however they are created from the manifest
+        rather than by listing the file system. Only files added to the manifest
+        are returned, use describes to make sure nothing else has been written
+        to the data path.
+        """
+        dataPath = os.path.normpath(dataPath)
+        directoryCrawlers = {
+            dataPath: FsPath.createFromPath(dataPath, 'directory')
+        }
+
+        fileCrawlers = {}
+        for filePath in self.__files.keys():
+            if not filePath.startswith(dataPath + os.sep):
+                continue
+
+            parentCrawler = self.__directoryCrawler(
+                os.path.dirname(filePath),
+                directoryCrawlers
+            )
+
+            fileCrawlers[filePath] = FsPath.create(
+                PathHolder.createFromStat(filePath, self.__fileStats[filePath]),
+                parentCrawler
+            )
+
+        crawlers = dict(directoryCrawlers)
+        crawlers.update(fileCrawlers)
+
+        # sorting by the path levels results in a depth-first order
+        return list(map(
+            lambda x: crawlers[x],
+            sorted(crawlers.keys(), key=lambda x: x.split(os.sep))
+        ))
+
+    def __validateFile(self, filePath):
+        """
+        Make sure the file is in the manifest.
+        """
+        if filePath not in self.__files:
+            raise VersionManifestFileNotFoundError(
+                'Could not find the file "{0}" in the manifest'.format(filePath)
+            )
+
+    @classmethod
+    def __directoryCrawler(cls, directoryPath, directoryCrawlers):
+        """
+        Return the crawler about the directory (creating the crawlers about the parent directories as necessary).
+        """
+        if directoryPath not in directoryCrawlers:
+            parentCrawler = cls.__directoryCrawler(
+                os.path.dirname(directoryPath),
+                directoryCrawlers
+            )
+
+            directoryCrawlers[directoryPath] = FsPath.createFromPath(
+                directoryPath,
+                'directory',
+                parentCrawler
+            )
+
+        return directoryCrawlers[directoryPath]
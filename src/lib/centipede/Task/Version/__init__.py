@@ -1,3 +1,5 @@
+from .VersionManifest import VersionManifest
+from .DataJournal import DataJournal, FailedToLockDataError
 from .CreateData import CreateData
 from .CreateVersion import CreateVersion
 from .CreateTextureVersion import CreateTextureVersion
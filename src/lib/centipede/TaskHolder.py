@@ -1,10 +1,19 @@
+import os
+import copy
 import json
+from multiprocessing.pool import ThreadPool
 from .Task import Task
 from .TaskWrapper import TaskWrapper
 from .Template import Template
 from .CrawlerMatcher import CrawlerMatcher
 from .CrawlerQuery import CrawlerQuery
 
+# compatibility with python 2/3
+try:
+    from queue import Queue
+except ImportError:
+    from Queue import Queue
+
 class TaskHolderInvalidVarNameError(Exception):
     """Task holder invalid var name error."""
 
@@ -25,6 +34,8 @@ class TaskHolder(object):
         'ignore'
     )
 
+    __defaultRunWorkers = int(os.environ.get('CENTIPEDE_TASKHOLDER_RUN_WORKERS', 1))
+
     def __init__(self, task, targetTemplate=None, filterTemplate=None):
         """
         Create a task holder object.
@@ -178,6 +189,7 @@ class TaskHolder(object):
         The crawlers are added to the task using "query" method to resolve
         the target template.
         """
+        contextVarNames = self.contextVarNames()
         for crawler, filePath in self.query(crawlers).items():
 
             if addTaskHolderVars:
@@ -188,7 +200,7 @@ class TaskHolder(object):
                     crawler.setVar(
                         varName,
                         self.var(varName),
-                        varName in self.contextVarNames()
+                        varName in contextVarNames
                     )
 
             self.__task.add(
@@ -245,18 +257,42 @@ class TaskHolder(object):
     def clone(self, includeSubTaskHolders=True):
         """
         Return a cloned instance of the current task holder.
+
+        The clone is done in memory rather than through json: the templates are
+        created again from their input strings, the vars are deep copied and the
+        crawlers associated with the task are cloned sharing their variables
+        copy-on-write (for more details take a look at Crawler.clone).
         """
-        return self.createFromJson(self.toJson(includeSubTaskHolders))
+        return self.__cloneTaskHolder(self, includeSubTaskHolders)
 
-    def run(self, crawlers=[]):
+    def run(self, crawlers=[], workers=None):
         """
         Perform the task.
 
         Return all the crawlers resulted by the execution of the task (and sub tasks).
-        """
-        return self.__recursiveTaskRunner(
+
+        In case the number of workers is not specified it is driven by the
+        environment variable "CENTIPEDE_TASKHOLDER_RUN_WORKERS" (default 1). Using
+        more than one worker executes the sibling sub task holders in parallel
+        through a pool of threads (the same way they are executed by the renderfarm
+        dispatcher): the sub task holders marked with "dispatch.await" only start
+        after all the previous siblings (including their sub task holders) are
+        done. Regardless of the number of workers the result is always in the
+        same order.
+        """
+        if workers is None:
+            workers = self.__defaultRunWorkers
+
+        if int(workers) <= 1:
+            return self.__recursiveTaskRunner(
+                self,
+                crawlers
+            )
+
+        return self.__parallelTaskRunner(
             self,
-            crawlers
+            crawlers,
+            int(workers)
         )
 
     @classmethod
@@ -335,6 +371,47 @@ class TaskHolder(object):
 
         return output
 
+    @classmethod
+    def __cloneTaskHolder(cls, taskHolder, includeSubTaskHolders=True):
+        """
+        Auxiliary method to clone the task holder recursively.
+        """
+        task = taskHolder.task()
+
+        # building the task holder instance (the task gets cloned by
+        # the task holder itself)
+        taskHolderClone = TaskHolder(
+            task,
+            Template(taskHolder.targetTemplate().inputString()),
+            Template(taskHolder.filterTemplate().inputString())
+        )
+
+        # the cloned task shares the crawlers with the original task,
+        # replacing them by clones
+        clonedTask = taskHolderClone.task()
+        clonedTask.clear()
+        for crawler in task.crawlers():
+            clonedTask.add(crawler.clone(), task.target(crawler))
+
+        # setting status
+        taskHolderClone.setStatus(taskHolder.status())
+
+        # adding vars
+        contextVarNames = taskHolder.contextVarNames()
+        for varName in taskHolder.varNames():
+            taskHolderClone.addVar(
+                varName,
+                copy.deepcopy(taskHolder.var(varName)),
+                varName in contextVarNames
+            )
+
+        # adding sub task holders
+        if includeSubTaskHolders:
+            for subTaskHolder in taskHolder.subTaskHolders():
+                taskHolderClone.addSubTaskHolder(cls.__cloneTaskHolder(subTaskHolder))
+
+        return taskHolderClone
+
     @classmethod
     def __loadTaskHolder(cls, taskHolderContents):
         """
@@ -377,11 +454,29 @@ class TaskHolder(object):
         """
         Perform the task runner recursively.
         """
+        taskCrawlers, result = cls.__runTask(taskHolder, crawlers)
+        if taskCrawlers is None:
+            return []
+
+        # calling subtask holders
+        for subTaskHolder in taskHolder.subTaskHolders():
+            result += cls.__recursiveTaskRunner(subTaskHolder, taskCrawlers)
+
+        return result
+
+    @classmethod
+    def __runTask(cls, taskHolder, crawlers):
+        """
+        Perform the task of the task holder (without the sub task holders).
+
+        Return a tuple containing the crawlers passed to the sub task holders (None when
+        the sub task holders should not be executed) and the crawlers resulted by the task.
+        """
         taskHolder.addCrawlers(crawlers)
 
         # ignoring the execution of the task
         if taskHolder.status() == 'ignore' or not taskHolder.task().crawlers():
-            return []
+            return (None, [])
 
         # bypassing task execution
         result = []
@@ -393,8 +488,143 @@ class TaskHolder(object):
             taskCrawlers = taskHolder.taskWrapper().run(taskHolder.task())
             result += taskCrawlers
 
-        # calling subtask holders
-        for subTaskHolder in taskHolder.subTaskHolders():
-            result += cls.__recursiveTaskRunner(subTaskHolder, taskCrawlers)
+        return (taskCrawlers, result)
+
+    @classmethod
+    def __parallelTaskRunner(cls, taskHolder, crawlers, workers):
+        """
+        Perform the task runner executing the sibling sub task holders in parallel.
+
+        The scheduling is done by the calling thread, while the tasks are executed
+        by the pool (a task never waits for other tasks inside of the pool). Each
+        task holder is represented by a node that holds its own result and the nodes
+        about the sub task holders, so the final result can be assembled in the same
+        order as the serial execution.
+        """
+        pool = ThreadPool(workers)
+        finishedQueue = Queue()
+        rootNode = cls.__createRunNode(taskHolder, None)
+        running = 0
+        error = None
+
+        def __submit(node, inputCrawlers):
+            pool.apply_async(
+                cls.__runNode,
+                (node, inputCrawlers),
+                callback=finishedQueue.put
+            )
+
+        try:
+            __submit(rootNode, crawlers)
+            running += 1
+
+            while running:
+                node, nodeError = finishedQueue.get()
+                running -= 1
+
+                # in case of errors the remaining nodes are not going to be
+                # scheduled (only waiting for the ones that are running)
+                if error is None and nodeError is not None:
+                    error = nodeError
+
+                if error is not None:
+                    continue
+
+                for readyNode in cls.__scheduleRunNode(node):
+                    __submit(readyNode, readyNode['parent']['taskCrawlers'])
+                    running += 1
+        finally:
+            pool.close()
+            pool.join()
+
+        if error is not None:
+            raise error
+
+        return cls.__runNodeResult(rootNode)
+
+    @staticmethod
+    def __createRunNode(taskHolder, parentNode):
+        """
+        Return a node used by the parallel task runner.
+        """
+        return {
+            'taskHolder': taskHolder,
+            'parent': parentNode,
+            'taskCrawlers': None,
+            'result': [],
+            'children': [],
+            'awaitChildren': [],
+            'pendingChildren': 0
+        }
+
+    @classmethod
+    def __runNode(cls, node, crawlers):
+        """
+        Perform the task about the node returning a tuple (node, error).
+        """
+        try:
+            node['taskCrawlers'], node['result'] = cls.__runTask(node['taskHolder'], crawlers)
+        except Exception as err:
+            return (node, err)
+
+        return (node, None)
+
+    @classmethod
+    def __scheduleRunNode(cls, node):
+        """
+        Return a list of nodes that are ready to be executed after the task of the node is done.
+        """
+        if node['taskCrawlers'] is not None:
+            for subTaskHolder in node['taskHolder'].subTaskHolders():
+                childNode = cls.__createRunNode(subTaskHolder, node)
+                node['children'].append(childNode)
+
+                subTask = subTaskHolder.task()
+                if subTask.hasMetadata('dispatch.await') and subTask.metadata('dispatch.await'):
+                    node['awaitChildren'].append(childNode)
+
+            # all the sub task holders that don't need to await can be
+            # executed right away
+            readyNodes = list(filter(
+                lambda x: x not in node['awaitChildren'],
+                node['children']
+            ))
+
+            if readyNodes:
+                node['pendingChildren'] = len(readyNodes)
+                return readyNodes
+
+        return cls.__completeRunNode(node)
+
+    @classmethod
+    def __completeRunNode(cls, node):
+        """
+        Return a list of nodes that are ready to be executed after the sub task holders of the node are done.
+
+        The awaiting sub task holders are executed one after another, each of them
+        only after the previous siblings are done.
+        """
+        if node['awaitChildren']:
+            node['pendingChildren'] = 1
+            return [node['awaitChildren'].pop(0)]
+
+        parentNode = node['parent']
+        if parentNode is None:
+            return []
+
+        parentNode['pendingChildren'] -= 1
+        if parentNode['pendingChildren']:
+            return []
+
+        return cls.__completeRunNode(parentNode)
+
+    @classmethod
+    def __runNodeResult(cls, node):
+        """
+        Return the crawlers resulted by the node and its children (in the same order as the serial execution).
+        """
+        result = list(node['result'])
+        for childNode in node['children']:
+            result += cls.__runNodeResult(childNode)
 
         return result
@@ -108,12 +108,8 @@ class Subprocess(TaskWrapper):
 
         # the task passes the result by serializing it as json, we need to load the json file
         # and re-create the crawlers.
-        result = []
         with open(serializedTaskFile) as jsonFile:
-            for serializedJsonCrawler in json.load(jsonFile):
-                result.append(
-                    Crawler.createFromJson(serializedJsonCrawler)
-                )
+            result = Crawler.createFromBatch(json.load(jsonFile))
 
         return result
 
@@ -131,9 +127,7 @@ class Subprocess(TaskWrapper):
         task = Task.createFromJson(serializedJsonTaskContent)
 
         # running task and serializing the output as json.
-        serializedCrawlers = []
-        for crawler in task.output():
-            serializedCrawlers.append(crawler.toJson())
+        serializedCrawlers = Crawler.serializeBatch(task.output())
 
         # we use the environment to tell where the result has been serialized
         # so it can be resulted back by the parent process.
@@ -1,5 +1,8 @@
 import os
+import re
 import uuid
+import threading
+from collections import OrderedDict
 from .TemplateProcedure import TemplateProcedure
 
 # compatibility with python 2/3
@@ -37,12 +40,25 @@ class Template(object):
 
     __safeTokenId = uuid.uuid4()
 
+    # node types used by the compiled templates
+    __literalNode = 0
+    __variableNode = 1
+    __procedureNode = 2
+    __parentNode = 3
+
+    # bounded LRU cache of compiled templates shared by all template objects
+    # (keyed by input string), the size is driven by the environment variable
+    # "CENTIPEDE_TEMPLATE_COMPILED_CACHE_SIZE" (default: 10000)
+    __compiledTemplates = OrderedDict()
+    __compiledTemplatesSize = int(os.environ.get('CENTIPEDE_TEMPLATE_COMPILED_CACHE_SIZE', 10000))
+    __compiledTemplatesLock = threading.Lock()
+    __variableRegex = re.compile(r'\{([^{}]*)\}')
+
     def __init__(self, inputString=""):
         """
         Create a template object.
         """
         self.setInputString(inputString)
-        self.__setVarNames()
         self.__procedureValueCache = {}
 
     def inputString(self):
@@ -59,25 +75,87 @@ class Template(object):
             "Invalid template string!"
 
         self.__inputString = inputString
+        self.__nodes, self.__varNames = self.__compile(inputString)
 
     def varNames(self):
         """
         Return a list of variable names found in the input string.
         """
-        return self.__varNames
+        return list(self.__varNames)
 
     def valueFromCrawler(self, crawler, vars={}):
         """
         Return the value of the template based on a crawler.
         """
-        contextVariableValues = {}
-        for varName in self.varNames():
-            if varName in vars:
-                contextVariableValues[varName] = str(vars[varName])
+        return self.__finalValue(
+            self.__nodeValues(self.__crawlerVars(crawler, vars))
+        )
+
+    def valuesFromCrawlers(self, crawlers, vars={}):
+        """
+        Return a list containing the value of the template for each crawler.
+
+        The nodes that resolve to the same value for all the crawlers (literals,
+        variables sharing the same value and procedures only depending on those)
+        are evaluated once, only the varying nodes are evaluated per crawler.
+        """
+        crawlersVars = list(map(lambda x: self.__crawlerVars(x, vars), crawlers))
+        if not crawlersVars:
+            return []
+
+        # finding the variables that have the same value for all crawlers
+        firstVars = crawlersVars[0]
+        constantVarNames = set(self.__varNames)
+        for crawlerVars in crawlersVars[1:]:
+            for varName in list(constantVarNames):
+                if crawlerVars[varName] != firstVars[varName]:
+                    constantVarNames.remove(varName)
+
+            if not constantVarNames:
+                break
+
+        firstValues = self.__nodeValues(firstVars)
+        constantValues = []
+        isPrefixConstant = True
+        for index, (nodeType, nodeValue) in enumerate(self.__nodes):
+            if nodeType == self.__literalNode:
+                isConstant = True
+            elif nodeType == self.__variableNode:
+                isConstant = nodeValue in constantVarNames
             else:
-                contextVariableValues[varName] = str(crawler.var(varName))
+                isConstant = True
+                for procedureNodeType, procedureNodeValue in nodeValue:
+                    if procedureNodeType == self.__variableNode:
+                        isConstant = procedureNodeValue in constantVarNames
+                    elif procedureNodeType == self.__parentNode:
+                        isConstant = isPrefixConstant
+
+                    if not isConstant:
+                        break
+
+                # volatile procedures are evaluated for each crawler
+                if isConstant:
+                    procedureName = TemplateProcedure.parse(
+                        self.__rawProcedure(nodeValue, firstValues[:index], firstVars)
+                    )[0]
+                    isConstant = TemplateProcedure.purity(procedureName) != 'volatile'
+
+            isPrefixConstant = isPrefixConstant and isConstant
+            constantValues.append(firstValues[index] if isConstant else None)
+
+        # the required path levels are shared by most of the values,
+        # checking each one of them only once
+        existingPaths = {}
+        result = [self.__finalValue(firstValues, existingPaths)]
+        for crawlerVars in crawlersVars[1:]:
+            result.append(
+                self.__finalValue(
+                    self.__nodeValues(crawlerVars, constantValues),
+                    existingPaths
+                )
+            )
 
-        return self.value(contextVariableValues)
+        return result
 
     def value(self, vars={}):
         """
@@ -85,79 +163,152 @@ class Template(object):
         """
         self.__validateTemplateVariables(vars)
 
-        # resolving variables values
-        resolvedTemplate = self.inputString()
-        for varName, varValue in vars.items():
-            resolvedTemplate = resolvedTemplate.replace(
-                ('{' + varName + '}'),
-                self.__escapeTemplateTokens(varValue)
-            )
+        return self.__finalValue(self.__nodeValues(vars))
 
-        # resolving function values
-        finalResolvedTemplate = ""
-        for templatePart in resolvedTemplate.split("("):
+    def __crawlerVars(self, crawler, vars):
+        """
+        Return a dict containing the values (as string) for the variables used by the template.
+        """
+        result = {}
+        for varName in self.__varNames:
+            if varName in vars:
+                result[varName] = str(vars[varName])
+            else:
+                result[varName] = str(crawler.var(varName))
 
-            endIndex = templatePart.find(')')
-            if endIndex != -1:
+        return result
 
-                # processing the procedure only when it has not been
-                # evaluated yet, otherwise return it from the cache.
-                # Potentially we could add support for "((procedure))" rather
-                # than "(procedure)" to tell to avoid this cache. However, the
-                # default behaviour should be to always cache it (never change it)
-                # otherwise it could side effect in template procedures that create
-                # new versions...
-                rawTemplateProcedure = templatePart[:endIndex]
+    def __nodeValues(self, vars, constantValues=None):
+        """
+        Return a list containing the value of each compiled node.
 
-                # this is a special token that allows to pass the parent path
-                # to a procedure, replacing it with the parent path at this point.
-                rawTemplateProcedure = rawTemplateProcedure.replace(
-                    "<parent>",
-                    self.__escapeTemplateTokens(finalResolvedTemplate.replace("/!", "/"), 0)
-                )
+        The nodes are evaluated in a single pass, when constant values are
+        provided they are used instead of evaluating the nodes again.
+        """
+        values = []
+        for index, (nodeType, nodeValue) in enumerate(self.__nodes):
+            if constantValues is not None and constantValues[index] is not None:
+                values.append(constantValues[index])
+            elif nodeType == self.__literalNode:
+                values.append(nodeValue)
+            elif nodeType == self.__variableNode:
+                values.append(str(vars[nodeValue]))
+            else:
+                values.append(self.__procedureValue(nodeValue, values, vars))
 
-                if rawTemplateProcedure not in self.__procedureValueCache:
-                    # replacing any reserved token from the result of the procedure
-                    self.__procedureValueCache[rawTemplateProcedure] = self.__escapeTemplateTokens(
-                        TemplateProcedure.parseRun(
-                            rawTemplateProcedure
+        return values
+
+    def __finalValue(self, values, existingPaths=None):
+        """
+        Return the final value of the template by joining the node values and resolving the required path levels.
+        """
+        result = ''.join(values)
+        if "/!" not in result:
+            return result
+
+        maskedValue = self.__maskedValue(values)
+        if "/!" not in maskedValue:
+            return result
+
+        # the levels are split from the masked value, so "/!" coming from
+        # variables and procedures is neither split nor treated as required
+        maskedLevelToken = self.__maskedLevelToken()
+        finalPath = []
+        for maskedPathLevel in maskedValue.split(os.sep):
+            pathLevel = maskedPathLevel.replace(maskedLevelToken, "/!")
+            if maskedPathLevel.startswith("!"):
+                finalPath.append(pathLevel[1:])
+                resolvedPath = os.sep.join(finalPath)
+
+                if existingPaths is None:
+                    pathExists = os.path.exists(resolvedPath)
+                elif resolvedPath in existingPaths:
+                    pathExists = existingPaths[resolvedPath]
+                else:
+                    pathExists = os.path.exists(resolvedPath)
+                    existingPaths[resolvedPath] = pathExists
+
+                if not pathExists:
+                    raise RequiredPathNotFoundError(
+                        'Template contains a path marked as required:\n"{0}"\n\nThis error is caused because the target path does not exist in the file system:\n{1}'.format(
+                            pathLevel,
+                            resolvedPath
                         )
                     )
 
-                procedureValue = self.__procedureValueCache[rawTemplateProcedure]
-                finalResolvedTemplate += procedureValue + templatePart[endIndex + 1:]
             else:
-                finalResolvedTemplate += templatePart
-
-        # resolving required path levels
-        if "/!" in finalResolvedTemplate:
-            finalPath = []
-            for pathLevel in self.__escapeTemplateTokens(finalResolvedTemplate, 0).split(os.sep):
-                if pathLevel.startswith("!"):
-                    finalPath.append(pathLevel[1:])
-                    resolvedPath = os.sep.join(finalPath)
-                    if not os.path.exists(resolvedPath):
-                        raise RequiredPathNotFoundError(
-                            'Template contains a path marked as required:\n"{0}"\n\nThis error is caused because the target path does not exist in the file system:\n{1}'.format(
-                                pathLevel,
-                                resolvedPath
-                            )
-                        )
+                finalPath.append(pathLevel)
 
-                else:
-                    finalPath.append(pathLevel)
-            finalResolvedTemplate = os.sep.join(finalPath)
+        return os.sep.join(finalPath)
+
+    def __procedureValue(self, procedureNodes, values, vars):
+        """
+        Return the value of a compiled procedure.
+        """
+        rawTemplateProcedure = self.__rawProcedure(procedureNodes, values, vars)
+
+        # stable procedures are processed only when they have not been
+        # evaluated yet by the template, otherwise return it from the cache.
+        # That is necessary for template procedures that create new
+        # versions, otherwise it could side effect in each evaluation... Pure
+        # procedures are cached by the template procedure itself (shared by
+        # all templates) and volatile procedures are never cached
+        if rawTemplateProcedure in self.__procedureValueCache:
+            return self.__procedureValueCache[rawTemplateProcedure]
 
-        # restoring all the espaped tokens to the original value
-        finalResolvedTemplate = self.__escapeTemplateTokens(finalResolvedTemplate, 0)
+        procedureName, procedureArgs = TemplateProcedure.parse(rawTemplateProcedure)
+        result = TemplateProcedure.run(procedureName, *procedureArgs)
+        if TemplateProcedure.purity(procedureName) == 'stable':
+            self.__procedureValueCache[rawTemplateProcedure] = result
 
-        return finalResolvedTemplate
+        return result
+
+    def __rawProcedure(self, procedureNodes, values, vars):
+        """
+        Return the procedure string (name and arguments) about the compiled procedure.
+        """
+        procedureParts = []
+        for nodeType, nodeValue in procedureNodes:
+            if nodeType == self.__literalNode:
+                procedureParts.append(nodeValue)
+            elif nodeType == self.__variableNode:
+                procedureParts.append(str(vars[nodeValue]))
+            else:
+                # this is a special token that allows to pass the parent path
+                # to a procedure, replacing it with the parent path at this point.
+                parentPath = ''.join(values)
+                if "/!" in parentPath:
+                    parentPath = self.__maskedValue(values).replace(
+                        "/!", "/"
+                    ).replace(
+                        self.__maskedLevelToken(), "/!"
+                    )
+                procedureParts.append(parentPath)
+
+        return ''.join(procedureParts)
+
+    def __maskedValue(self, values):
+        """
+        Return the joined values where the "/!" tokens coming from variables and procedures are masked.
+
+        Only the "/!" tokens written in the template (or formed between the
+        boundaries of the values) mark a required path level.
+        """
+        maskedLevelToken = self.__maskedLevelToken()
+        result = []
+        for (nodeType, _), value in zip(self.__nodes, values):
+            if nodeType == self.__literalNode:
+                result.append(value)
+            else:
+                result.append(value.replace("/!", maskedLevelToken))
+
+        return ''.join(result)
 
     def __validateTemplateVariables(self, vars):
         """
         Make sure the variables used by template are available, otherwise thown an exception (VariableNotFoundError).
         """
-        for requiredVarName in self.varNames():
+        for requiredVarName in self.__varNames:
             if requiredVarName not in vars:
                 raise VariableNotFoundError(
                     'Could not find a value for the variable {0}'.format(
@@ -165,49 +316,108 @@ class Template(object):
                     )
                 )
 
-    def __setVarNames(self):
+    @classmethod
+    def __maskedLevelToken(cls):
+        """
+        Return the token used to mask "/!" while resolving the required path levels.
+        """
+        return '[{}]'.format(cls.__safeTokenId)
+
+    @classmethod
+    def __compile(cls, inputString):
         """
-        Set the variable names found in the input template.
+        Return a tuple containing the compiled nodes and the variable names about the input string.
+
+        The template is parsed only once (per input string), the nodes are a
+        tuple of (nodeType, nodeValue) where procedures carry their own nodes
+        (literals, variables and parent).
         """
-        result = set()
+        with cls.__compiledTemplatesLock:
+            if inputString in cls.__compiledTemplates:
+                result = cls.__compiledTemplates.pop(inputString)
+                cls.__compiledTemplates[inputString] = result
+                return result
+
+        # splitting the variables from the literal text
+        varNames = []
+        tokens = []
+        currentIndex = 0
+        for match in cls.__variableRegex.finditer(inputString):
+            tokens.append((cls.__literalNode, inputString[currentIndex:match.start()]))
+            tokens.append((cls.__variableNode, match.group(1)))
+            if match.group(1) not in varNames:
+                varNames.append(match.group(1))
+            currentIndex = match.end()
+        tokens.append((cls.__literalNode, inputString[currentIndex:]))
+
+        # splitting the template parts where procedures may start ("(")
+        templateParts = [[]]
+        for tokenType, tokenValue in tokens:
+            if tokenType == cls.__variableNode:
+                templateParts[-1].append((tokenType, tokenValue))
+                continue
+
+            literalParts = tokenValue.split("(")
+            templateParts[-1].append((tokenType, literalParts[0]))
+            for literalPart in literalParts[1:]:
+                templateParts.append([(tokenType, literalPart)])
+
+        # a procedure goes until the first ")" found in the template part
+        nodes = []
+        for templatePart in templateParts:
+            for index, (tokenType, tokenValue) in enumerate(templatePart):
+                if tokenType == cls.__literalNode and ")" in tokenValue:
+                    endIndex = tokenValue.find(")")
+                    procedureTokens = templatePart[:index] + [(tokenType, tokenValue[:endIndex])]
+                    nodes.append((cls.__procedureNode, cls.__compileProcedure(procedureTokens)))
+                    nodes.append((tokenType, tokenValue[endIndex + 1:]))
+                    nodes.extend(templatePart[index + 1:])
+                    break
+            else:
+                nodes.extend(templatePart)
+
+        result = (cls.__mergeLiterals(nodes), tuple(varNames))
+        with cls.__compiledTemplatesLock:
+            cls.__compiledTemplates[inputString] = result
+            while len(cls.__compiledTemplates) > cls.__compiledTemplatesSize:
+                cls.__compiledTemplates.popitem(last=False)
 
-        # detecting variables
-        for templatePart in self.inputString().split("{"):
-            if templatePart is '' or "}" not in templatePart:
+        return result
+
+    @classmethod
+    def __compileProcedure(cls, tokens):
+        """
+        Return the nodes about a procedure where the parent token is split from the literals.
+        """
+        nodes = []
+        for tokenType, tokenValue in tokens:
+            if tokenType != cls.__literalNode:
+                nodes.append((tokenType, tokenValue))
                 continue
 
-            endIndex = templatePart.find('}')
-            result.add(templatePart[:endIndex])
+            literalParts = tokenValue.split("<parent>")
+            nodes.append((tokenType, literalParts[0]))
+            for literalPart in literalParts[1:]:
+                nodes.append((cls.__parentNode, None))
+                nodes.append((tokenType, literalPart))
 
-        self.__varNames = list(result)
+        return cls.__mergeLiterals(nodes)
 
     @classmethod
-    def __escapeTemplateTokens(cls, value, direction=1):
-        """
-        Escape special template tokens from the input string.
-        """
-        safeFunctionStart = '<{}>'.format(cls.__safeTokenId)
-        safeFunctionEnd = '</{}>'.format(cls.__safeTokenId)
-        safeLevelExist = '[{}]'.format(cls.__safeTokenId)
-        safeParentPath = '[[{}]]'.format(cls.__safeTokenId)
-
-        if direction:
-            return str(value).replace(
-                "(", safeFunctionStart
-            ).replace(
-                ")", safeFunctionEnd
-            ).replace(
-                "/!", safeLevelExist
-            ).replace(
-                "<parent>", safeParentPath
-            )
+    def __mergeLiterals(cls, nodes):
+        """
+        Return a tuple of nodes where consecutive literals are merged and empty literals are removed.
+        """
+        result = []
+        for nodeType, nodeValue in nodes:
+            if nodeType == cls.__literalNode:
+                if not nodeValue:
+                    continue
 
-        return str(value).replace(
-            safeFunctionStart, "("
-        ).replace(
-            safeFunctionEnd, ")"
-        ).replace(
-            safeLevelExist, "/!"
-        ).replace(
-            safeParentPath, "<parent>"
-        )
+                if result and result[-1][0] == cls.__literalNode:
+                    result[-1] = (nodeType, result[-1][1] + nodeValue)
+                    continue
+
+            result.append((nodeType, nodeValue))
+
+        return tuple(result)
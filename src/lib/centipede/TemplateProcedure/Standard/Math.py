@@ -83,35 +83,41 @@ class _Math(object):
 # sum
 TemplateProcedure.register(
     'sum',
-    _Math.sumInt
+    _Math.sumInt,
+    'pure'
 )
 
 # subtraction
 TemplateProcedure.register(
     'sub',
-    _Math.subtractInt
+    _Math.subtractInt,
+    'pure'
 )
 
 # multiply
 TemplateProcedure.register(
     'mult',
-    _Math.multiplyInt
+    _Math.multiplyInt,
+    'pure'
 )
 
 # divide
 TemplateProcedure.register(
     'div',
-    _Math.divideInt
+    _Math.divideInt,
+    'pure'
 )
 
 # minimum
 TemplateProcedure.register(
     'min',
-    _Math.minimumInt
+    _Math.minimumInt,
+    'pure'
 )
 
 # maximum
 TemplateProcedure.register(
     'max',
-    _Math.maximumInt
+    _Math.maximumInt,
+    'pure'
 )
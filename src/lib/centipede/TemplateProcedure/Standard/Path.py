@@ -88,17 +88,20 @@ class _Path(object):
 # registering template procedures
 TemplateProcedure.register(
     'dirname',
-    _Path.dirname
+    _Path.dirname,
+    'pure'
 )
 
 TemplateProcedure.register(
     'parentdirname',
-    _Path.parentdirname
+    _Path.parentdirname,
+    'pure'
 )
 
 TemplateProcedure.register(
     'basename',
-    _Path.basename
+    _Path.basename,
+    'pure'
 )
 
 TemplateProcedure.register(
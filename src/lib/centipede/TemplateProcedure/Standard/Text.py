@@ -37,23 +37,27 @@ class _Text(object):
 # upper case
 TemplateProcedure.register(
     'upper',
-    _Text.upper
+    _Text.upper,
+    'pure'
 )
 
 # lower case
 TemplateProcedure.register(
     'lower',
-    _Text.lower
+    _Text.lower,
+    'pure'
 )
 
 # replace
 TemplateProcedure.register(
     'replace',
-    _Text.replace
+    _Text.replace,
+    'pure'
 )
 
 # remove
 TemplateProcedure.register(
     'remove',
-    _Text.remove
+    _Text.remove,
+    'pure'
 )
@@ -1,49 +1,33 @@
-import os
-import re
 from ..TemplateProcedure import TemplateProcedure
+from ...VersionIndex import VersionIndex
 
 class _Version(object):
     """
     Basic version template procedures.
 
-    The versionsPath is usually specified using <parent> token.
+    The versionsPath is usually specified using <parent> token. The lookups
+    are done through a VersionIndex shared by the procedures.
     """
 
+    __versionIndex = VersionIndex()
+
     @staticmethod
     def new(versionsPath):
         """
         Return a new version.
         """
-        version = _Version.__queryLatest(versionsPath)
+        version = _Version.__versionIndex.latest(versionsPath)
 
-        return 'v' + str(version + 1).zfill(3)
+        return VersionIndex.versionName(version + 1)
 
     @staticmethod
     def latest(versionsPath):
         """
         Return a new version, in case none version is found it returns v000.
         """
-        version = _Version.__queryLatest(versionsPath)
-
-        return 'v' + str(version).zfill(3)
-
-    @staticmethod
-    def __queryLatest(versionsPath):
-        """
-        Return the latest version found under the versions path.
-
-        In case none version is found, it returns 0 by default.
-        """
-        version = 0
-        versionRegEx = "^v[0-9]{3}$"
-
-        # finding the latest version
-        if os.path.exists(versionsPath):
-            for directory in os.listdir(versionsPath):
-                if re.match(versionRegEx, directory):
-                    version = max(int(directory[1:]), version)
+        version = _Version.__versionIndex.latest(versionsPath)
 
-        return version
+        return VersionIndex.versionName(version)
 
 
 # new version procedure
@@ -1,3 +1,7 @@
+import os
+import threading
+from collections import OrderedDict
+
 # compatibility with python 2/3
 try:
     basestring
@@ -10,19 +14,57 @@ class TemplateProcedureNotFoundError(Exception):
 class TemplateProcedure(object):
     """
     Template procedures are used to provide functions to the template engine.
+
+    Procedures are registered with a purity that tells how their results can
+    be cached:
+        - stable: the result is cached per template during its life time, so
+        the same value is returned for the same arguments (default). Procedures
+        that create new data (for instance newver) must be stable, otherwise
+        each call could return a different value for the same template.
+        - pure: the result only depends on the arguments, it's cached in a
+        bounded LRU cache shared by all templates. The size of the cache is
+        driven by the environment variable
+        "CENTIPEDE_TEMPLATEPROCEDURE_CACHE_SIZE" (default: 10000).
+        - volatile: the result is never cached.
     """
 
+    purityTypes = (
+        'stable',
+        'pure',
+        'volatile'
+    )
+
     __registered = {}
+    __purities = {}
+
+    # bounded cache shared for the pure procedures
+    __pureCache = OrderedDict()
+    __pureCacheSize = int(os.environ.get('CENTIPEDE_TEMPLATEPROCEDURE_CACHE_SIZE', 10000))
+    __pureCacheLock = threading.Lock()
+    __pureCacheStats = {
+        'hits': 0,
+        'misses': 0
+    }
 
     @staticmethod
-    def register(name, procedureCallable):
+    def register(name, procedureCallable, purity='stable'):
         """
         Register a procedureCallable as procedure.
         """
         assert hasattr(procedureCallable, '__call__'), \
             "Invalid callable!"
 
+        assert purity in TemplateProcedure.purityTypes, \
+            "Invalid purity {}!".format(purity)
+
         TemplateProcedure.__registered[name] = procedureCallable
+        TemplateProcedure.__purities[name] = purity
+
+        # the cached results may belong to the procedure being replaced
+        with TemplateProcedure.__pureCacheLock:
+            for cacheKey in list(TemplateProcedure.__pureCache.keys()):
+                if cacheKey[0] == name:
+                    del TemplateProcedure.__pureCache[cacheKey]
 
     @staticmethod
     def registeredNames():
@@ -32,19 +74,90 @@ class TemplateProcedure(object):
         return TemplateProcedure.__registered.keys()
 
     @staticmethod
-    def run(procedureName, *args):
+    def purity(procedureName):
         """
-        Run the procedure and return a value base on the args.
+        Return the purity of the procedure (stable, pure or volatile).
         """
-        if procedureName not in TemplateProcedure.__registered:
+        if procedureName not in TemplateProcedure.__purities:
             raise TemplateProcedureNotFoundError(
                 'Could not find procedure name: "{0}"'.format(
                     procedureName
                 )
             )
 
-        # executing procedure
-        return str(TemplateProcedure.__registered[procedureName](*args))
+        return TemplateProcedure.__purities[procedureName]
+
+    @staticmethod
+    def cacheStats():
+        """
+        Return a dict with the hits, misses and size of the cache used by the pure procedures.
+        """
+        with TemplateProcedure.__pureCacheLock:
+            result = dict(TemplateProcedure.__pureCacheStats)
+            result['size'] = len(TemplateProcedure.__pureCache)
+
+        return result
+
+    @staticmethod
+    def clearCache():
+        """
+        Remove all the results from the cache used by the pure procedures (also resetting the stats).
+        """
+        with TemplateProcedure.__pureCacheLock:
+            TemplateProcedure.__pureCache.clear()
+            TemplateProcedure.__pureCacheStats['hits'] = 0
+            TemplateProcedure.__pureCacheStats['misses'] = 0
+
+    @staticmethod
+    def run(procedureName, *args):
+        """
+        Run the procedure and return a value base on the args.
+
+        The results of the pure procedures are returned from the shared cache
+        when available.
+        """
+        if TemplateProcedure.purity(procedureName) != 'pure':
+            return TemplateProcedure.__execute(procedureName, args)
+
+        cacheKey = (procedureName,) + args
+        try:
+            hash(cacheKey)
+        except TypeError:
+            return TemplateProcedure.__execute(procedureName, args)
+
+        with TemplateProcedure.__pureCacheLock:
+            if cacheKey in TemplateProcedure.__pureCache:
+                TemplateProcedure.__pureCacheStats['hits'] += 1
+
+                # moving the result to the end (most recently used)
+                result = TemplateProcedure.__pureCache.pop(cacheKey)
+                TemplateProcedure.__pureCache[cacheKey] = result
+                return result
+            TemplateProcedure.__pureCacheStats['misses'] += 1
+
+        result = TemplateProcedure.__execute(procedureName, args)
+        with TemplateProcedure.__pureCacheLock:
+            TemplateProcedure.__pureCache[cacheKey] = result
+            while len(TemplateProcedure.__pureCache) > TemplateProcedure.__pureCacheSize:
+                TemplateProcedure.__pureCache.popitem(last=False)
+
+        return result
+
+    @staticmethod
+    def parse(procedure):
+        """
+        Parse a procedure returning a tuple containing the procedure name and a list of arguments.
+
+        For more details about the syntax take a look at parseRun.
+        """
+        assert isinstance(procedure, basestring), \
+            "Invalid procedure type!"
+
+        cleanedTemplateProcedure = list(filter(
+            lambda x: x != '', procedure.strip(" ").split(" ")
+        ))
+
+        return (cleanedTemplateProcedure[0], cleanedTemplateProcedure[1:])
 
     @staticmethod
     def parseRun(procedure):
@@ -60,14 +173,13 @@ class TemplateProcedure(object):
         The arguments are always parsed as string, and they should be
         handled per procedure callable bases.
         """
-        assert isinstance(procedure, basestring), \
-            "Invalid procedure type!"
-
-        cleanedTemplateProcedure = list(filter(
-            lambda x: x != '', procedure.strip(" ").split(" ")
-        ))
-
-        procedureName = cleanedTemplateProcedure[0]
-        procedureArgs = cleanedTemplateProcedure[1:]
+        procedureName, procedureArgs = TemplateProcedure.parse(procedure)
 
         return TemplateProcedure.run(procedureName, *procedureArgs)
+
+    @staticmethod
+    def __execute(procedureName, args):
+        """
+        Execute the procedure callable returning the result as string.
+        """
+        return str(TemplateProcedure.__registered[procedureName](*args))
@@ -0,0 +1,132 @@
+import os
+import re
+import time
+import errno
+import threading
+
+class VersionIndex(object):
+    """
+    Cached index about the latest version found under versions directories.
+
+    Versions are directories following the convention "v001" directly under
+    a versions directory. The latest version of each versions directory is
+    cached alongside the modification time of the directory, therefore the
+    directory is only listed again when entries get added, removed or renamed.
+
+    New versions can be reserved atomically through os.mkdir (the version
+    directory gets created as a claim), so concurrent publishers never end
+    up with the same version.
+
+    Example:
+        versionIndex = VersionIndex()
+        versionIndex.latest('/jobs/RND/shots/SHT0010/plate')
+        versionIndex.reserve('/jobs/RND/shots/SHT0010/plate')
+
+    """
+
+    __versionRegex = re.compile(r'^v[0-9]{3}$')
+
+    # directories modified within this interval (in seconds) are not cached,
+    # since further modifications in the same interval may not be detected
+    # by the modification time (file systems with low resolution)
+    __racyInterval = 2.0
+
+    def __init__(self):
+        """
+        Create a version index object.
+        """
+        self.__lock = threading.Lock()
+        self.__cache = {}
+        self.__stats = {
+            'hits': 0,
+            'listed': 0
+        }
+
+    def latest(self, versionsPath):
+        """
+        Return the latest version (integer) found under the versions path.
+
+        In case none version is found, it returns 0 by default.
+        """
+        try:
+            mtime = os.stat(versionsPath).st_mtime
+        except OSError:
+            return 0
+
+        with self.__lock:
+            cached = self.__cache.get(versionsPath)
+            if cached is not None and cached[0] == mtime:
+                self.__stats['hits'] += 1
+                return cached[1]
+
+        version = self.__queryLatest(versionsPath)
+
+        with self.__lock:
+            self.__stats['listed'] += 1
+            if time.time() - mtime > self.__racyInterval:
+                self.__cache[versionsPath] = (mtime, version)
+
+        return version
+
+    def reserve(self, versionsPath):
+        """
+        Reserve a new version (integer) under the versions path by creating its directory.
+
+        The versions path is created automatically in case it does not exist.
+        """
+        if not os.path.isdir(versionsPath):
+            try:
+                os.makedirs(versionsPath)
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+
+        version = self.latest(versionsPath) + 1
+        while True:
+            try:
+                os.mkdir(os.path.join(versionsPath, self.versionName(version)))
+                return version
+
+            # version claimed by another publisher in the meantime
+            except OSError as err:
+                if err.errno != errno.EEXIST:
+                    raise
+                version += 1
+
+    def stats(self):
+        """
+        Return a dict with the number of lookups served from the cache and listed from the file system.
+        """
+        with self.__lock:
+            return dict(self.__stats)
+
+    def clear(self):
+        """
+        Remove all the entries from the cache.
+        """
+        with self.__lock:
+            self.__cache.clear()
+
+    @staticmethod
+    def versionName(version):
+        """
+        Return the name of the version directory (for instance v001).
+        """
+        return 'v' + str(version).zfill(3)
+
+    @classmethod
+    def __queryLatest(cls, versionsPath):
+        """
+        Return the latest version found by listing the versions path.
+        """
+        version = 0
+        try:
+            directories = os.listdir(versionsPath)
+        except OSError:
+            return version
+
+        for directory in directories:
+            if cls.__versionRegex.match(directory):
+                version = max(int(directory[1:]), version)
+
+        return version
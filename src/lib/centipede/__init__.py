@@ -1,9 +1,12 @@
 from .PathHolder import PathHolder
+from .FrameRanges import FrameRanges
 from . import Crawler
 from .Template import Template, RequiredPathNotFoundError, VariableNotFoundError
 from .CrawlerQuery import CrawlerQuery
 from . import TemplateProcedure
 from .CrawlerMatcher import CrawlerMatcher
+from .CrawlerQueryPlanner import CrawlerQueryPlanner
+from .VersionIndex import VersionIndex
 from . import Task
 from . import TaskWrapper
 from .TaskHolder import TaskHolder, TaskHolderInvalidVarNameError
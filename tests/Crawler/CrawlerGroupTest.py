@@ -0,0 +1,75 @@
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede import FrameRanges
+from centipede.Crawler import Crawler
+from centipede.Crawler import CrawlerGroup
+
+class CrawlerGroupTest(BaseTestCase):
+    """Test CrawlerGroup."""
+
+    def testGroupByFrame(self):
+        """
+        Test that the groups are sorted by frame (regardless of the padding).
+        """
+        crawlers = []
+        for name, frame in [("seq.10000.exr", 10000), ("other.exr", None), ("seq.9998.exr", 9998), ("seq.9999.exr", 9999)]:
+            crawler = Crawler(name)
+            if frame is not None:
+                crawler.setVar('frame', frame)
+                crawler.setTag('group', 'seq')
+            crawlers.append(crawler)
+
+        groups = Crawler.group(crawlers)
+        self.assertEqual(len(groups), 2)
+        self.assertIsInstance(groups[0], CrawlerGroup)
+        self.assertEqual(
+            list(map(lambda x: x.var('name'), groups[0])),
+            ["seq.9998.exr", "seq.9999.exr", "seq.10000.exr"]
+        )
+        self.assertEqual(groups[1], [crawlers[1]])
+        self.assertEqual(groups[0].frameRanges(), FrameRanges([9998, 9999, 10000]))
+        self.assertEqual(groups[0].gaps(), [])
+        self.assertEqual(groups[1].gaps(), [])
+
+    def testGroupByPath(self):
+        """
+        Test that the crawlers without frames are sorted by path.
+        """
+        crawlers = []
+        for name in ["c", "a", "b"]:
+            crawler = Crawler(name)
+            crawler.setVar('fullPath', '/' + name)
+            crawler.setTag('group', 'letters')
+            crawlers.append(crawler)
+
+        groups = Crawler.group(crawlers)
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(list(map(lambda x: x.var('name'), groups[0])), ["a", "b", "c"])
+
+    def testView(self):
+        """
+        Test the list operations supported by the group.
+        """
+        crawlers = []
+        for frame in [1, 2, 3, 6, 7, 10]:
+            crawler = Crawler('seq.{}.exr'.format(frame))
+            crawler.setVar('frame', frame)
+            crawler.setTag('group', 'seq')
+            crawlers.append(crawler)
+
+        group = Crawler.group(reversed(crawlers))[0]
+        self.assertEqual(len(group), 6)
+        self.assertIs(group[0], crawlers[0])
+        self.assertIs(group[-1], crawlers[-1])
+        self.assertEqual(group[1:3], crawlers[1:3])
+        self.assertIn(crawlers[2], group)
+        self.assertEqual(list(group), crawlers)
+        self.assertRaises(IndexError, lambda: group[6])
+        self.assertEqual(group.gaps(), [(4, 5), (8, 9)])
+
+        # frames computed on demand
+        self.assertEqual(CrawlerGroup(crawlers).gaps(), [(4, 5), (8, 9)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import json
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import Exr
+from centipede.PathHolder import PathHolder
+
+class CrawlerTest(BaseTestCase):
+    """Test Crawler."""
+
+    __dir = os.path.join(BaseTestCase.dataDirectory(), "glob")
+
+    def testInheritedVars(self):
+        """
+        Test that the children inherit the variables from the parent crawler.
+        """
+        parentCrawler = Crawler('parent')
+        parentCrawler.setVar('shot', 'SHT0010', True)
+        parentCrawler.setVar('seq', 'SHT')
+
+        childCrawler = Crawler('child', parentCrawler)
+        self.assertEqual(childCrawler.var('shot'), 'SHT0010')
+        self.assertEqual(childCrawler.var('seq'), 'SHT')
+        self.assertEqual(childCrawler.var('fullPath'), '/child')
+        self.assertEqual(childCrawler.varNames(), ['fullPath', 'name', 'shot', 'seq'])
+        self.assertEqual(childCrawler.contextVarNames(), ['shot'])
+
+    def testCopyOnWriteVars(self):
+        """
+        Test that changes in the variables are not shared between parent and children.
+        """
+        parentCrawler = Crawler('parent')
+        parentCrawler.setVar('shot', 'SHT0010', True)
+        childCrawler = Crawler('child', parentCrawler)
+        otherChildCrawler = Crawler('otherChild', parentCrawler)
+
+        childCrawler.setVar('shot', 'SHT0020')
+        self.assertEqual(childCrawler.var('shot'), 'SHT0020')
+        self.assertEqual(childCrawler.contextVarNames(), [])
+        self.assertEqual(otherChildCrawler.var('shot'), 'SHT0010')
+        self.assertEqual(otherChildCrawler.contextVarNames(), ['shot'])
+        self.assertEqual(parentCrawler.var('shot'), 'SHT0010')
+        self.assertEqual(parentCrawler.contextVarNames(), ['shot'])
+
+        parentCrawler.setVar('shot', 'SHT0030', False)
+        parentCrawler.setVar('seq', 'SHT')
+        self.assertEqual(otherChildCrawler.var('shot'), 'SHT0010')
+        self.assertEqual(otherChildCrawler.contextVarNames(), ['shot'])
+        self.assertNotIn('seq', otherChildCrawler.varNames())
+
+        grandChildCrawler = Crawler('grandChild', otherChildCrawler)
+        self.assertEqual(grandChildCrawler.var('fullPath'), '/otherChild/grandChild')
+        self.assertEqual(grandChildCrawler.var('shot'), 'SHT0010')
+
+    def testTags(self):
+        """
+        Test that the tags are not inherited from the parent crawler.
+        """
+        parentCrawler = Crawler('parent')
+        parentCrawler.setTag('group', 'a')
+        childCrawler = Crawler('child', parentCrawler)
+        self.assertEqual(list(childCrawler.tagNames()), [])
+        self.assertEqual(list(parentCrawler.tagNames()), ['group'])
+
+    def testCompactStorage(self):
+        """
+        Test that the crawlers do not carry a per instance dict.
+        """
+        for crawler in FsPath.createFromPath(self.__dir).glob():
+            self.assertFalse(hasattr(crawler, '__dict__'))
+            self.assertFalse(hasattr(crawler.pathHolder(), '__dict__'))
+
+    def testDispatch(self):
+        """
+        Test that only the candidate crawlers are tested.
+        """
+        Crawler.resetDispatchStats()
+        crawler = Crawler.create(PathHolder(os.path.join(BaseTestCase.dataDirectory(), "test.exr")))
+        self.assertEqual(crawler.var('type'), 'exr')
+
+        dispatchStats = Crawler.dispatchStats()
+        self.assertEqual(dispatchStats['exr'], {'tests': 1, 'matches': 1})
+        self.assertNotIn('png', dispatchStats)
+        self.assertNotIn('directory', dispatchStats)
+
+    def testDispatchOverriddenTest(self):
+        """
+        Test that a crawler overriding the test without declaring dispatch keys is always tested.
+        """
+        class DispatchTestCrawler(Exr):
+            @classmethod
+            def test(cls, pathHolder, parentCrawler):
+                return isinstance(pathHolder, PathHolder) and pathHolder.ext() == 'dispatchtest'
+
+        Crawler.register('dispatchTestCrawler', DispatchTestCrawler)
+        crawler = Crawler.create(PathHolder('/tmp/crawler.dispatchtest'))
+        self.assertEqual(crawler.var('type'), 'dispatchTestCrawler')
+
+        crawler = Crawler.create(PathHolder(os.path.join(BaseTestCase.dataDirectory(), "test.exr")))
+        self.assertEqual(crawler.var('type'), 'exr')
+
+    def testSerializeBatch(self):
+        """
+        Test that a list of crawlers can be serialized as a batch.
+        """
+        crawlers = FsPath.createFromPath(self.__dir).glob()
+        crawlers[0].setVar('job', 'RND', True)
+        crawlers[0].setVar('frames', [1, 2, 3])
+
+        batch = json.loads(json.dumps(Crawler.serializeBatch(crawlers)))
+        self.assertLess(len(json.dumps(batch)), len(json.dumps(list(map(lambda x: x.toJson(), crawlers)))))
+
+        result = Crawler.createFromBatch(batch)
+        self.assertEqual(len(result), len(crawlers))
+        for crawler, resultCrawler in zip(crawlers, result):
+            self.assertIs(type(resultCrawler), type(crawler))
+            self.assertEqual(json.loads(resultCrawler.toJson()), json.loads(crawler.toJson()))
+
+        # backwards compatibility
+        result = Crawler.createFromBatch(list(map(lambda x: x.toJson(), crawlers)))
+        self.assertEqual(
+            list(map(lambda x: x.var('filePath'), result)),
+            list(map(lambda x: x.var('filePath'), crawlers))
+        )
+
+    def testClone(self):
+        """
+        Test that the clone can be modified without affecting the original crawler.
+        """
+        crawler = FsPath.createFromPath(os.path.join(BaseTestCase.dataDirectory(), "test.exr"))
+        crawler.setVar('job', 'RND', True)
+        crawler.setVar('frames', [1, 2, 3])
+        crawler.setTag('group', 'test')
+
+        clone = crawler.clone()
+        self.assertIs(type(clone), type(crawler))
+        self.assertEqual(json.loads(clone.toJson()), json.loads(crawler.toJson()))
+
+        clone.setVar('job', 'SKY')
+        clone.var('frames').append(4)
+        clone.setTag('group', 'other')
+        self.assertEqual(crawler.var('job'), 'RND')
+        self.assertEqual(crawler.contextVarNames(), ['job'])
+        self.assertEqual(crawler.var('frames'), [1, 2, 3])
+        self.assertEqual(crawler.tag('group'), 'test')
+
+        hashmap = Crawler.create({'a': 1})
+        hashmapClone = hashmap.clone()
+        hashmapClone['b'] = 2
+        self.assertNotIn('b', hashmap)
+
+
+if __name__ == "__main__":
+    unittest.main()
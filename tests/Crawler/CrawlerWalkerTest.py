@@ -0,0 +1,138 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler import CrawlerWalker
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs import Directory
+
+class CrawlerWalkerTest(BaseTestCase):
+    """Test CrawlerWalker."""
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create a temporary directory hierarchy used by the tests.
+        """
+        cls.__dir = tempfile.mkdtemp()
+        for shot in ["shotA", "shotB", "shotC"]:
+            for element in ["plate", "render"]:
+                elementPath = os.path.join(cls.__dir, shot, element)
+                os.makedirs(elementPath)
+                for frame in range(1, 11):
+                    open(os.path.join(elementPath, "{}_{}.{:04d}.png".format(shot, element, frame)), 'a').close()
+            open(os.path.join(cls.__dir, shot, "notes.txt"), 'a').close()
+
+    def testWalkOrder(self):
+        """
+        Test that the walker returns the crawlers in depth-first order.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawlerPaths = list(map(lambda x: x.var('filePath'), CrawlerWalker(1).walk(crawler)))
+
+        expected = [self.__dir]
+        for shot in ["shotA", "shotB", "shotC"]:
+            shotPath = os.path.join(self.__dir, shot)
+            expected.append(shotPath)
+            expected.append(os.path.join(shotPath, "notes.txt"))
+            for element in ["plate", "render"]:
+                elementPath = os.path.join(shotPath, element)
+                expected.append(elementPath)
+                expected += sorted(map(lambda x: os.path.join(elementPath, x), os.listdir(elementPath)))
+
+        self.assertEqual(crawlerPaths, expected)
+
+    def testParallelWalk(self):
+        """
+        Test that the parallel walk returns the same crawlers as the serial one.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        serialPaths = list(map(lambda x: x.var('filePath'), CrawlerWalker(1).walk(crawler)))
+
+        for workers in [2, 4, 16]:
+            with self.subTest(workers=workers):
+                parallelCrawlers = list(CrawlerWalker(workers).walk(crawler))
+                self.assertEqual(
+                    list(map(lambda x: x.var('filePath'), parallelCrawlers)),
+                    serialPaths
+                )
+                self.assertEqual(
+                    len(list(filter(lambda x: isinstance(x, Directory), parallelCrawlers))),
+                    10
+                )
+
+    def testGlob(self):
+        """
+        Test that glob uses a deterministic order.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawlerPaths = list(map(lambda x: x.var('filePath'), crawler.glob(['png'])))
+        self.assertEqual(len(crawlerPaths), 60)
+        self.assertEqual(crawlerPaths, sorted(crawlerPaths))
+        self.assertEqual(crawler.glob(['png']), crawler.glob(['png']))
+
+    def testIglob(self):
+        """
+        Test that iglob yields the same crawlers as glob.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        for filterTypes in [[], ['png'], [Directory], ['txt', 'png']]:
+            with self.subTest(filterTypes=filterTypes):
+                self.assertEqual(
+                    list(map(lambda x: x.var('filePath'), crawler.iglob(filterTypes))),
+                    list(map(lambda x: x.var('filePath'), crawler.glob(filterTypes)))
+                )
+
+    def testIglobEarlyTermination(self):
+        """
+        Test that iglob can be interrupted before walking the whole hierarchy.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        iterator = crawler.iglob(['png'])
+        firstCrawler = next(iterator)
+        iterator.close()
+
+        self.assertEqual(
+            firstCrawler.var('filePath'),
+            os.path.join(self.__dir, "shotA", "plate", "shotA_plate.0001.png")
+        )
+
+    def testDirEntryPathHolder(self):
+        """
+        Test that the children reuse the information provided by the directory listing.
+        """
+        crawler = Crawler.create(FsPath.createFromPath(self.__dir).pathHolder())
+        for childCrawler in crawler.children():
+            self.assertTrue(childCrawler.pathHolder().exists())
+            self.assertEqual(childCrawler.pathHolder().isDirectory(), os.path.isdir(childCrawler.var('filePath')))
+
+    def testDirEntryBrokenSymlink(self):
+        """
+        Test that a broken symlink found by the directory listing does not exist.
+        """
+        tempDirectory = tempfile.mkdtemp()
+        try:
+            os.symlink(os.path.join(tempDirectory, "missing"), os.path.join(tempDirectory, "broken"))
+            os.symlink(self.__dir, os.path.join(tempDirectory, "link"))
+
+            crawler = Crawler.create(FsPath.createFromPath(tempDirectory).pathHolder())
+            pathHolders = dict(map(lambda x: (x.var('baseName'), x.pathHolder()), crawler.children()))
+            self.assertFalse(pathHolders['broken'].exists())
+            self.assertFalse(pathHolders['broken'].isDirectory())
+            self.assertTrue(pathHolders['link'].exists())
+            self.assertTrue(pathHolders['link'].isDirectory())
+        finally:
+            shutil.rmtree(tempDirectory)
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Remove the temporary directory hierarchy.
+        """
+        shutil.rmtree(cls.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs import CrawlIndex
+
+class CrawlIndexTest(BaseTestCase):
+    """Test CrawlIndex."""
+
+    def setUp(self):
+        """
+        Create a temporary directory hierarchy used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__indexPath = os.path.join(tempfile.mkdtemp(), 'index', 'crawlIndex.sqlite')
+
+        for shot in ["shotA", "shotB"]:
+            elementPath = os.path.join(self.__dir, shot, "plate")
+            os.makedirs(elementPath)
+            for frame in range(1, 6):
+                open(os.path.join(elementPath, "{}_plate.{:04d}.png".format(shot, frame)), 'a').close()
+
+        self.__touchDirectories()
+
+    def testRestoreFromIndex(self):
+        """
+        Test that the unmodified directories are restored from the index.
+        """
+        expected = self.__paths(FsPath.createFromPath(self.__dir).glob())
+
+        crawlIndex = CrawlIndex(self.__indexPath)
+        self.assertEqual(self.__paths(crawlIndex.glob(FsPath.createFromPath(self.__dir))), expected)
+        self.assertEqual(crawlIndex.stats(), {'restored': 0, 'listed': 5})
+
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlers = crawlIndex.glob(FsPath.createFromPath(self.__dir))
+        self.assertEqual(self.__paths(crawlers), expected)
+        self.assertEqual(crawlIndex.stats(), {'restored': 5, 'listed': 0})
+
+        # restored crawlers should be the same as the ones listed from disk
+        expectedCrawlers = FsPath.createFromPath(self.__dir).glob()
+        for crawler, expectedCrawler in zip(crawlers, expectedCrawlers):
+            self.assertIs(type(crawler), type(expectedCrawler))
+            self.assertEqual(json.loads(crawler.toJson()), json.loads(expectedCrawler.toJson()))
+
+    def testFrameSequences(self):
+        """
+        Test that the frame sequences setting is taken into account by the index.
+        """
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setFrameSequences(True)
+        expected = self.__paths(crawler.glob())
+
+        for index in range(2):
+            crawlIndex = CrawlIndex(self.__indexPath)
+            crawler = FsPath.createFromPath(self.__dir)
+            crawler.setFrameSequences(True)
+            crawlers = crawlIndex.glob(crawler)
+            self.assertEqual(self.__paths(crawlers), expected)
+            self.assertEqual(len(crawlIndex.glob(crawler, ['frameSequence'])), 2)
+            self.assertTrue(all(map(lambda x: x.frameSequences(), crawlIndex.glob(crawler, ['directory']))))
+
+        # restored from the index during the second glob
+        self.assertEqual(crawlIndex.stats()['listed'], 0)
+
+        # the entries stored with frame sequences are not restored without them
+        crawlIndex = CrawlIndex(self.__indexPath)
+        self.assertEqual(len(crawlIndex.glob(FsPath.createFromPath(self.__dir), ['png'])), 10)
+        self.assertEqual(crawlIndex.stats(), {'restored': 0, 'listed': 5})
+
+    def testIncrementalRefresh(self):
+        """
+        Test that only the modified directories are listed again.
+        """
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+
+        newFilePath = os.path.join(self.__dir, "shotB", "plate", "shotB_plate.0006.png")
+        open(newFilePath, 'a').close()
+        os.utime(os.path.dirname(newFilePath), (time.time() - 30, time.time() - 30))
+
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlerPaths = self.__paths(crawlIndex.glob(FsPath.createFromPath(self.__dir), ['png']))
+        self.assertEqual(crawlIndex.stats(), {'restored': 4, 'listed': 1})
+        self.assertEqual(len(crawlerPaths), 11)
+        self.assertIn(newFilePath, crawlerPaths)
+
+    def testRecentlyModified(self):
+        """
+        Test that directories modified recently are not stored in the index.
+        """
+        os.utime(self.__dir, None)
+
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+        self.assertEqual(crawlIndex.stats(), {'restored': 4, 'listed': 6})
+
+    def testClear(self):
+        """
+        Test that clear removes all the entries from the index.
+        """
+        crawlIndex = CrawlIndex(self.__indexPath)
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+        crawlIndex.clear()
+        crawlIndex.glob(FsPath.createFromPath(self.__dir))
+        self.assertEqual(crawlIndex.stats(), {'restored': 0, 'listed': 10})
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+        shutil.rmtree(os.path.dirname(os.path.dirname(self.__indexPath)))
+
+    def __touchDirectories(self):
+        """
+        Set the modification time of the directories to the past.
+        """
+        past = time.time() - 60
+        for currentDir, _, _ in os.walk(self.__dir):
+            os.utime(currentDir, (past, past))
+
+    @staticmethod
+    def __paths(crawlers):
+        """
+        Return the file paths about the crawlers.
+        """
+        return list(map(lambda x: x.var('filePath'), crawlers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede import FrameRanges
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import FrameSequence
+
+class FrameSequenceTest(BaseTestCase):
+    """Test FrameSequence."""
+
+    def setUp(self):
+        """
+        Create a temporary directory containing image sequences used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.__dir, "subDirectory"))
+        fileNames = [
+            "plate.1001.png",
+            "plate.1002.png",
+            "plate.1003.png",
+            "plate.1005.png",
+            "subDirectory/render_0001.png",
+            "subDirectory/render_0002.png",
+            "single.png",
+            "notes.0001.txt",
+            "notes.0002.txt"
+        ]
+        for fileName in fileNames:
+            shutil.copy(
+                os.path.join(BaseTestCase.dataDirectory(), "test.png"),
+                os.path.join(self.__dir, fileName)
+            )
+
+    def testDefault(self):
+        """
+        Test that by default each frame is a crawler.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        self.assertFalse(crawler.frameSequences())
+        self.assertEqual(len(crawler.glob(['png'])), 7)
+        self.assertEqual(len(crawler.glob(['frameSequence'])), 0)
+
+    def testDirectory(self):
+        """
+        Test that the directory crawling emits a crawler per sequence.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setFrameSequences(True)
+
+        sequences = crawler.glob(['frameSequence'])
+        self.assertEqual(len(sequences), 2)
+        self.assertEqual(len(crawler.glob(['png'])), 1)
+        self.assertEqual(len(crawler.glob(['generic'])), 5)
+
+        plate = sequences[0]
+        self.assertIsInstance(plate, FrameSequence)
+        self.assertEqual(plate.var('type'), 'frameSequence')
+        self.assertEqual(plate.var('frameType'), 'png')
+        self.assertEqual(plate.var('filePath'), os.path.join(self.__dir, "plate.####.png"))
+        self.assertEqual(plate.var('name'), 'plate')
+        self.assertEqual(plate.var('padding'), 4)
+        self.assertEqual(plate.var('ext'), 'png')
+        self.assertEqual(plate.var('imageType'), 'sequence')
+        self.assertEqual(plate.var('firstFrame'), 1001)
+        self.assertEqual(plate.var('lastFrame'), 1005)
+        self.assertEqual(plate.var('frameRanges'), '1001-1003,1005')
+        self.assertEqual(plate.tag('group'), 'plate.####.png')
+        self.assertEqual(plate.frameRanges().gaps(), [(1004, 1004)])
+
+        render = sequences[1]
+        self.assertEqual(render.var('filePath'), os.path.join(self.__dir, "subDirectory", "render_####.png"))
+        self.assertEqual(render.var('frameRanges'), '1-2')
+
+    def testFrameCrawlers(self):
+        """
+        Test expanding the sequence to the crawlers about the frames.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setFrameSequences(True)
+        plate = crawler.glob(['frameSequence'])[0]
+        plate.setVar('job', 'RND', True)
+
+        frameCrawlers = list(plate.frameCrawlers())
+        self.assertEqual(len(frameCrawlers), 4)
+        self.assertEqual(
+            [x.var('frame') for x in frameCrawlers],
+            [1001, 1002, 1003, 1005]
+        )
+        self.assertEqual(frameCrawlers[0].var('type'), 'png')
+        self.assertEqual(frameCrawlers[0].var('filePath'), os.path.join(self.__dir, "plate.1001.png"))
+        self.assertEqual(frameCrawlers[0].var('job'), 'RND')
+        self.assertEqual(frameCrawlers[0].tag('group'), plate.tag('group'))
+
+    def testFrameRangesFromCrawlers(self):
+        """
+        Test the frames about a list mixing sequences and frame crawlers.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setFrameSequences(True)
+        plate = crawler.glob(['frameSequence'])[0]
+        frameCrawler = FsPath.createFromPath(os.path.join(self.__dir, "plate.1007.png"))
+        singleCrawler = FsPath.createFromPath(os.path.join(self.__dir, "single.png"))
+
+        frameRanges = FrameSequence.frameRangesFromCrawlers([frameCrawler, plate, singleCrawler])
+        self.assertEqual(frameRanges.toString(), '1001-1003,1005,1007')
+        self.assertEqual(frameRanges.first(), 1001)
+        self.assertEqual(frameRanges.last(), 1007)
+        self.assertEqual(frameRanges.gaps(), [(1004, 1004), (1006, 1006)])
+
+    def testSerialization(self):
+        """
+        Test that the sequence can be serialized.
+        """
+        crawler = FsPath.createFromPath(self.__dir)
+        crawler.setFrameSequences(True)
+        plate = crawler.glob(['frameSequence'])[0]
+
+        result = Crawler.createFromJson(plate.toJson())
+        self.assertIsInstance(result, FrameSequence)
+        self.assertEqual(result.frameRanges(), FrameRanges([1001, 1002, 1003, 1005]))
+        self.assertEqual(
+            [x.var('filePath') for x in result.frameCrawlers()],
+            [x.var('filePath') for x in plate.frameCrawlers()]
+        )
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        shutil.rmtree(self.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import struct
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs.Image import ImageHeader
+
+class ImageHeaderTest(BaseTestCase):
+    """Test ImageHeader."""
+
+    def setUp(self):
+        """
+        Create a temporary directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+
+    def testRead(self):
+        """
+        Test that the resolution is read from the header of the supported formats.
+        """
+        for fileName, width, height in [
+                ("test.exr", 1828, 1556),
+                ("test_DIFF_u1_v1.exr", 512, 512),
+                ("test.jpg", 512, 512),
+                ("thumbnailImage.jpg", 640, 337),
+                ("test.png", 640, 480)]:
+            self.assertEqual(
+                ImageHeader.read(os.path.join(BaseTestCase.dataDirectory(), fileName)),
+                {'width': width, 'height': height}
+            )
+
+        # dpx files (big and little endian)
+        for magic, endian in [(b'SDPX', '>'), (b'XPDS', '<')]:
+            dpxFilePath = os.path.join(self.__dir, "test_{}.dpx".format(magic.decode('ascii')))
+            with open(dpxFilePath, 'wb') as dpxFile:
+                dpxFile.write(magic + b'\x00' * 768 + struct.pack(endian + '2I', 2048, 1080) + b'\x00' * 1024)
+
+            self.assertEqual(ImageHeader.read(dpxFilePath), {'width': 2048, 'height': 1080})
+
+        # unsupported files
+        self.assertIsNone(ImageHeader.read(os.path.join(BaseTestCase.dataDirectory(), "test.txt")))
+        self.assertIsNone(ImageHeader.read(os.path.join(self.__dir, "nonExisting.exr")))
+
+    def testCache(self):
+        """
+        Test that the header is cached until the file gets modified.
+        """
+        pngFilePath = os.path.join(self.__dir, "test.png")
+        shutil.copy2(os.path.join(BaseTestCase.dataDirectory(), "test.png"), pngFilePath)
+
+        ImageHeader.clearCache()
+        ImageHeader.read(pngFilePath)
+        result = ImageHeader.read(pngFilePath)
+        self.assertEqual(result, {'width': 640, 'height': 480})
+        self.assertEqual(ImageHeader.cacheStats(), {'hits': 1, 'misses': 1, 'size': 1})
+
+        # the result is not shared implicitly
+        result['width'] = 0
+        self.assertEqual(ImageHeader.read(pngFilePath)['width'], 640)
+
+        os.utime(pngFilePath, (0, 0))
+        ImageHeader.read(pngFilePath)
+        self.assertEqual(ImageHeader.cacheStats()['misses'], 2)
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import ImageSequenceMetadata
+from centipede.Crawler.Fs.Image import ImageSequenceMetadataMismatchError
+
+class ImageSequenceMetadataTest(BaseTestCase):
+    """Test ImageSequenceMetadata."""
+
+    def setUp(self):
+        """
+        Create a temporary image sequence used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for frame in range(1, 5):
+            shutil.copy(
+                os.path.join(BaseTestCase.dataDirectory(), "test.png"),
+                os.path.join(self.__dir, "sequence.{:04d}.png".format(frame))
+            )
+
+        ImageSequenceMetadata.clearCache()
+
+    def testSharedMetadata(self):
+        """
+        Test that only one frame per sequence reads the metadata from the file.
+        """
+        crawlers = FsPath.createFromPath(self.__dir).glob(['png'])
+        self.assertEqual(len(crawlers), 4)
+        for crawler in crawlers:
+            self.assertEqual(crawler.var('width'), 640)
+            self.assertEqual(crawler.var('height'), 480)
+
+        self.assertEqual(ImageSequenceMetadata.cacheStats(), {'hits': 3, 'misses': 1, 'size': 1})
+
+        # single images are not shared
+        crawler = FsPath.createFromPath(os.path.join(BaseTestCase.dataDirectory(), "test.png"))
+        self.assertEqual(crawler.var('width'), 640)
+        self.assertEqual(ImageSequenceMetadata.cacheStats()['size'], 1)
+
+    def testVerify(self):
+        """
+        Test that frames with a different metadata are detected by verify.
+        """
+        crawlers = FsPath.createFromPath(self.__dir).glob(['png'])
+        ImageSequenceMetadata.verify(crawlers, workers=2)
+
+        # replacing a frame by an image with a different resolution
+        shutil.copy(
+            os.path.join(BaseTestCase.dataDirectory(), "test.jpg"),
+            os.path.join(self.__dir, "sequence.0003.png")
+        )
+        self.assertRaises(ImageSequenceMetadataMismatchError, ImageSequenceMetadata.verify, crawlers)
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
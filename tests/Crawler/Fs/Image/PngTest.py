@@ -25,10 +25,8 @@ class PngTest(BaseTestCase):
         self.assertEqual(crawler.var("type"), "png")
         self.assertEqual(crawler.var("category"), "image")
         self.assertEqual(crawler.var("imageType"), "single")
-        # Current version of Oiio doesn't work with png.
-        # Skipping this test for now.
-        # self.assertEqual(crawler.var("width"), 640)
-        # self.assertEqual(crawler.var("height"), 480)
+        self.assertEqual(crawler.var("width"), 640)
+        self.assertEqual(crawler.var("height"), 480)
 
 
 if __name__ == "__main__":
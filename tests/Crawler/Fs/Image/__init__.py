@@ -1,4 +1,7 @@
 from .DpxTest import DpxTest
 from .ExrTest import ExrTest
+from .FrameSequenceTest import FrameSequenceTest
+from .ImageHeaderTest import ImageHeaderTest
+from .ImageSequenceMetadataTest import ImageSequenceMetadataTest
 from .JpgTest import JpgTest
 from .PngTest import PngTest
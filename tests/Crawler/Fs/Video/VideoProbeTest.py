@@ -0,0 +1,108 @@
+import os
+import sys
+import stat
+import time
+import shutil
+import tempfile
+import unittest
+from ....BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs.Video import VideoProbe
+
+class VideoProbeTest(BaseTestCase):
+    """Test VideoProbe."""
+
+    def setUp(self):
+        """
+        Create a temporary directory containing videos and an ffprobe replacement counting its calls.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__cachePath = os.path.join(self.__dir, 'cache', 'videoProbe.sqlite')
+        self.__callsPath = os.path.join(self.__dir, 'calls.txt')
+
+        binPath = os.path.join(self.__dir, 'bin')
+        os.mkdir(binPath)
+        ffprobePath = os.path.join(binPath, 'ffprobe')
+        with open(ffprobePath, 'w') as ffprobeFile:
+            ffprobeFile.write(
+                '#!{}\n'
+                'import sys, json\n'
+                'open({}, "a").write(sys.argv[-1] + "\\n")\n'
+                'sys.stdout.write(json.dumps({{"streams": [{{"width": 1920, "height": 1080}}]}}))\n'.format(
+                    sys.executable,
+                    repr(self.__callsPath)
+                )
+            )
+        os.chmod(ffprobePath, os.stat(ffprobePath).st_mode | stat.S_IEXEC)
+
+        self.__path = os.environ.get('PATH', '')
+        os.environ['PATH'] = binPath + os.pathsep + self.__path
+
+        self.__videoPaths = []
+        for index in range(4):
+            videoPath = os.path.join(self.__dir, 'video{}.mov'.format(index))
+            open(videoPath, 'a').close()
+            os.utime(videoPath, (time.time() - 60, time.time() - 60))
+            self.__videoPaths.append(videoPath)
+
+    def testQueue(self):
+        """
+        Test that the queued videos are probed in the background only once.
+        """
+        videoProbe = VideoProbe(self.__cachePath, workers=2)
+        videoProbe.queue(self.__videoPaths)
+        videoProbe.queue(self.__videoPaths)
+
+        for videoPath in self.__videoPaths:
+            self.assertEqual(videoProbe.probe(videoPath)['streams'][0]['width'], 1920)
+        videoProbe.close()
+
+        self.assertEqual(sorted(self.__calls()), sorted(self.__videoPaths))
+        self.assertEqual(videoProbe.probe(os.path.join(self.__dir, 'nonExisting.mov')), {})
+
+    def testCache(self):
+        """
+        Test that the results are restored from the cache until the video gets modified.
+        """
+        VideoProbe(self.__cachePath).probe(self.__videoPaths[0])
+        VideoProbe(self.__cachePath).probe(self.__videoPaths[0])
+        self.assertEqual(len(self.__calls()), 1)
+
+        os.utime(self.__videoPaths[0], (time.time() - 30, time.time() - 30))
+        VideoProbe(self.__cachePath).probe(self.__videoPaths[0])
+        self.assertEqual(len(self.__calls()), 2)
+
+    def testUnavailableCache(self):
+        """
+        Test that the videos are probed without the cache when it cannot be created.
+        """
+        blockingFilePath = os.path.join(self.__dir, 'blocking')
+        open(blockingFilePath, 'a').close()
+
+        videoProbe = VideoProbe(os.path.join(blockingFilePath, 'cache', 'videoProbe.sqlite'), workers=2)
+        videoProbe.queue(self.__videoPaths)
+        for videoPath in self.__videoPaths:
+            self.assertEqual(videoProbe.probe(videoPath)['streams'][0]['width'], 1920)
+        videoProbe.close()
+
+        self.assertEqual(sorted(self.__calls()), sorted(self.__videoPaths))
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        os.environ['PATH'] = self.__path
+        shutil.rmtree(self.__dir)
+
+    def __calls(self):
+        """
+        Return the list of files passed to ffprobe.
+        """
+        if not os.path.exists(self.__callsPath):
+            return []
+
+        with open(self.__callsPath) as callsFile:
+            return callsFile.read().splitlines()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1,2 @@
 from .MovTest import MovTest
+from .VideoProbeTest import VideoProbeTest
@@ -1,2 +1,5 @@
 from . import Fs
 from . import Generic
+from .CrawlerTest import CrawlerTest
+from .CrawlerWalkerTest import CrawlerWalkerTest
+from .CrawlerGroupTest import CrawlerGroupTest
@@ -0,0 +1,77 @@
+import os
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.Crawler import Crawler
+from centipede.Crawler.Fs import FsPath
+from centipede.Crawler.Fs.Image import Exr
+from centipede.CrawlerMatcher import CrawlerMatcher
+
+class CrawlerMatcherTest(BaseTestCase):
+    """Test CrawlerMatcher."""
+
+    __exrFile = os.path.join(BaseTestCase.dataDirectory(), 'test.exr')
+    __jpgFile = os.path.join(BaseTestCase.dataDirectory(), 'test.jpg')
+
+    def testMatchTypes(self):
+        """
+        Test that the crawlers are matched by type (including derived types).
+        """
+        exrCrawler = FsPath.createFromPath(self.__exrFile)
+        jpgCrawler = FsPath.createFromPath(self.__jpgFile)
+
+        self.assertTrue(CrawlerMatcher(['exr']).match(exrCrawler))
+        self.assertFalse(CrawlerMatcher(['exr']).match(jpgCrawler))
+        self.assertTrue(CrawlerMatcher(['generic']).match(jpgCrawler))
+        self.assertTrue(CrawlerMatcher().match(jpgCrawler))
+
+    def testMatchVars(self):
+        """
+        Test that the crawlers are matched by exact values and glob patterns.
+        """
+        crawler = FsPath.createFromPath(self.__exrFile)
+        crawler.setVar('shot', 'SHT0010')
+        crawler.setVar('frame', 1001)
+
+        self.assertTrue(CrawlerMatcher([], {'shot': 'SHT0010'}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'shot': 'SHT*'}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'shot': ['ABC', 'SHT00?0']}).match(crawler))
+        self.assertTrue(CrawlerMatcher([], {'frame': 1001}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'shot': ['ABC', 'SHT1*']}).match(crawler))
+        self.assertFalse(CrawlerMatcher([], {'seq': '*'}).match(crawler))
+
+    def testMissingVars(self):
+        """
+        Test that vars missing in the crawler are not lazy loaded by the match.
+        """
+        crawler = FsPath.createFromPath(self.__exrFile)
+        self.assertNotIn('width', crawler.varNames())
+        self.assertFalse(CrawlerMatcher([], {'width': '*'}).match(crawler))
+        self.assertNotIn('width', crawler.varNames())
+
+    def testMatchMany(self):
+        """
+        Test that matchMany returns the crawlers that match.
+        """
+        crawlers = list(map(FsPath.createFromPath, [self.__exrFile, self.__jpgFile, self.__exrFile]))
+        crawlerMatcher = CrawlerMatcher(['exr'], {'ext': 'e*'})
+        self.assertEqual(crawlerMatcher.matchMany(crawlers), [crawlers[0], crawlers[2]])
+        self.assertEqual(crawlerMatcher.matchMany(crawlers), list(filter(crawlerMatcher.match, crawlers)))
+
+    def testRegisteredAfterCreation(self):
+        """
+        Test that crawler types registered after the matcher creation are taken into account.
+        """
+        crawlerMatcher = CrawlerMatcher(['exr'])
+        self.assertNotIn('crawlerMatcherTestExr', crawlerMatcher.registeredMatchTypes())
+
+        class CrawlerMatcherTestExr(Exr):
+            @classmethod
+            def test(cls, data, parentCrawler=None):
+                return False
+
+        Crawler.register('crawlerMatcherTestExr', CrawlerMatcherTestExr)
+        self.assertIn('crawlerMatcherTestExr', crawlerMatcher.registeredMatchTypes())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.CrawlerMatcher import CrawlerMatcher
+from centipede.CrawlerQueryPlanner import CrawlerQueryPlanner
+
+class CrawlerQueryPlannerTest(BaseTestCase):
+    """Test CrawlerQueryPlanner."""
+
+    def testPlan(self):
+        """
+        Test that the planner returns the same crawlers matched by each matcher.
+        """
+        crawlers = []
+        for fileName in ['test.exr', 'test.jpg', 'test.png', 'test.exr']:
+            crawler = FsPath.createFromPath(os.path.join(BaseTestCase.dataDirectory(), fileName))
+            crawler.setVar('shot', 'SHT{}'.format(len(crawlers)))
+            crawlers.append(crawler)
+
+        crawlerMatchers = [
+            CrawlerMatcher(['exr']),
+            CrawlerMatcher(['exr', 'jpg'], {'shot': 'SHT0'}),
+            CrawlerMatcher(['jpg'], {'shot': 'SHT0'}),
+            CrawlerMatcher([], {'shot': ['SHT1', 'SHT3']}),
+            CrawlerMatcher(['png'], {'seq': '*'}),
+            CrawlerMatcher()
+        ]
+
+        result = CrawlerQueryPlanner(crawlerMatchers).plan(crawlers)
+        self.assertEqual(len(result), len(crawlerMatchers))
+        for crawlerMatcher, matchedCrawlers in zip(crawlerMatchers, result):
+            self.assertEqual(matchedCrawlers, crawlerMatcher.matchMany(crawlers))
+
+        self.assertEqual(result[1], [crawlers[0]])
+        self.assertEqual(result[2], [])
+        self.assertEqual(result[5], crawlers)
+
+
+if __name__ == "__main__":
+    unittest.main()
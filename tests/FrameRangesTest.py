@@ -0,0 +1,57 @@
+import unittest
+from .BaseTestCase import BaseTestCase
+from centipede import FrameRanges
+
+class FrameRangesTest(BaseTestCase):
+    """Test FrameRanges."""
+
+    def testRanges(self):
+        """
+        Test that the frames are stored as ranges.
+        """
+        frameRanges = FrameRanges(range(1001, 11001))
+        self.assertEqual(len(frameRanges), 10000)
+        self.assertEqual(frameRanges.ranges(), [(1001, 11000)])
+        self.assertEqual(frameRanges.first(), 1001)
+        self.assertEqual(frameRanges.last(), 11000)
+        self.assertIn(5000, frameRanges)
+        self.assertNotIn(11001, frameRanges)
+
+    def testUnsortedFrames(self):
+        """
+        Test that frames added in any order are merged into ranges.
+        """
+        frameRanges = FrameRanges([10, 1, 3, 2, 2, 8, 6, 7, 12])
+        self.assertEqual(len(frameRanges), 8)
+        self.assertEqual(frameRanges.ranges(), [(1, 3), (6, 8), (10, 10), (12, 12)])
+        self.assertEqual(list(frameRanges), [1, 2, 3, 6, 7, 8, 10, 12])
+
+        frameRanges.add(11)
+        frameRanges.add(4)
+        frameRanges.add(5)
+        self.assertEqual(frameRanges.ranges(), [(1, 8), (10, 12)])
+        self.assertEqual(len(frameRanges), 11)
+
+    def testGaps(self):
+        """
+        Test the frames missing between the first and last frames.
+        """
+        frameRanges = FrameRanges([1, 2, 3, 6, 7, 10])
+        self.assertEqual(frameRanges.gaps(), [(4, 5), (8, 9)])
+        self.assertEqual(FrameRanges([1, 2]).gaps(), [])
+        self.assertEqual(FrameRanges().gaps(), [])
+
+    def testString(self):
+        """
+        Test serializing the frames to string.
+        """
+        frameRanges = FrameRanges([1, 2, 3, 6, 10, 11])
+        self.assertEqual(frameRanges.toString(), "1-3,6,10-11")
+        self.assertEqual(FrameRanges.createFromString("1-3,6,10-11"), frameRanges)
+        self.assertEqual(len(FrameRanges.createFromString("1-3,6,10-11")), 6)
+        self.assertEqual(len(FrameRanges.createFromString("")), 0)
+        self.assertIsNone(FrameRanges().first())
+
+
+if __name__ == "__main__":
+    unittest.main()
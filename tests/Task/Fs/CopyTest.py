@@ -1,7 +1,10 @@
 import unittest
 import os
+import shutil
+import tempfile
 from ...BaseTestCase import BaseTestCase
 from centipede.Task import Task
+from centipede.Task.Fs import CopyTargetDirectoryError
 from centipede.Crawler.Fs import FsPath
 from centipede.Crawler.Fs.Image import Exr
 
@@ -27,6 +30,26 @@ class CopyTest(BaseTestCase):
         self.assertEqual(crawler.var("width"), crawler.var("width"))
         self.assertEqual(crawler.var("height"), crawler.var("height"))
 
+    def testCopyTargetDirectory(self):
+        """
+        Test that a target directory (or a symlink to a directory) raises an exception.
+        """
+        tempDirectory = tempfile.mkdtemp()
+        try:
+            targetDirectory = os.path.join(tempDirectory, "directory")
+            os.mkdir(targetDirectory)
+            targetLink = os.path.join(tempDirectory, "link")
+            os.symlink(targetDirectory, targetLink)
+
+            for targetFilePath in (targetDirectory, targetLink):
+                copyTask = Task.create('copy')
+                copyTask.add(FsPath.createFromPath(self.__sourcePath), targetFilePath)
+                self.assertRaises(CopyTargetDirectoryError, copyTask.output)
+
+            self.assertTrue(os.path.islink(targetLink))
+        finally:
+            shutil.rmtree(tempDirectory)
+
     @classmethod
     def tearDownClass(cls):
         """
@@ -0,0 +1,151 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Task.Fs import FileCopier
+from centipede.Task.Fs import FileCopierStrategyError
+from centipede.Task.Fs import FileCopierTargetDirectoryError
+
+class FileCopierTest(BaseTestCase):
+    """Test FileCopier."""
+
+    __sourcePath = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+
+    def setUp(self):
+        """
+        Create a temporary directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+
+    def testCopyFile(self):
+        """
+        Test that the copy has the same contents, permissions and times as the source.
+        """
+        targetFilePath = os.path.join(self.__dir, "test.exr")
+        fileCopier = FileCopier()
+        self.assertTrue(fileCopier.copyFile(self.__sourcePath, targetFilePath))
+        self.__assertCopy(self.__sourcePath, targetFilePath)
+
+        stats = fileCopier.stats()
+        self.assertEqual(stats['skipped'], 0)
+        self.assertEqual(sum(stats.values()), 1)
+
+    def testCopyFiles(self):
+        """
+        Test that multiple files are copied creating the target directories.
+        """
+        sourceFilePaths = []
+        for index in range(10):
+            sourceFilePath = os.path.join(self.__dir, "source", "file{}.txt".format(index))
+            sourceFilePaths.append(sourceFilePath)
+            if not os.path.exists(os.path.dirname(sourceFilePath)):
+                os.makedirs(os.path.dirname(sourceFilePath))
+
+            with open(sourceFilePath, 'w') as sourceFile:
+                sourceFile.write("contents {}".format(index) * index)
+
+        filePaths = list(map(
+            lambda x: (x, os.path.join(self.__dir, "target", x[-5], os.path.basename(x))),
+            sourceFilePaths
+        ))
+
+        fileCopier = FileCopier(workers=4)
+        self.assertEqual(fileCopier.workers(), 4)
+        self.assertEqual(fileCopier.copyFiles(filePaths), [True] * 10)
+        for sourceFilePath, targetFilePath in filePaths:
+            self.__assertCopy(sourceFilePath, targetFilePath)
+
+    def testSkipUnchanged(self):
+        """
+        Test that targets with the same size and modification time are skipped.
+        """
+        sourceFilePath = os.path.join(self.__dir, "source.txt")
+        targetFilePath = os.path.join(self.__dir, "target.txt")
+        with open(sourceFilePath, 'w') as sourceFile:
+            sourceFile.write("source")
+
+        fileCopier = FileCopier()
+        self.assertEqual(fileCopier.copyFiles([(sourceFilePath, targetFilePath)]), [True])
+        self.assertEqual(fileCopier.copyFiles([(sourceFilePath, targetFilePath)]), [False])
+        self.assertEqual(fileCopier.stats()['skipped'], 1)
+
+        # modified source
+        with open(sourceFilePath, 'w') as sourceFile:
+            sourceFile.write("modified")
+        os.utime(sourceFilePath, (time.time() - 60, time.time() - 60))
+        self.assertEqual(fileCopier.copyFiles([(sourceFilePath, targetFilePath)]), [True])
+        self.__assertCopy(sourceFilePath, targetFilePath)
+
+        # disabled skip
+        fileCopier = FileCopier(skipUnchanged=False)
+        self.assertEqual(fileCopier.copyFiles([(sourceFilePath, targetFilePath)]), [True])
+
+    def testStrategies(self):
+        """
+        Test the strategies used to transfer the files.
+        """
+        hardlinkFilePath = os.path.join(self.__dir, "hardlink", "test.exr")
+        fileCopier = FileCopier(strategy='hardlink')
+        self.assertEqual(fileCopier.strategy(), 'hardlink')
+        self.assertEqual(fileCopier.copyFiles([(self.__sourcePath, hardlinkFilePath)]), [True])
+        self.__assertCopy(self.__sourcePath, hardlinkFilePath)
+
+        # hardlinks fall back to a copy when not supported (for instance across devices)
+        if fileCopier.stats()['hardlink']:
+            self.assertTrue(os.path.samefile(self.__sourcePath, hardlinkFilePath))
+            self.assertEqual(fileCopier.copyFiles([(self.__sourcePath, hardlinkFilePath)]), [False])
+
+        copyFilePath = os.path.join(self.__dir, "copy", "test.exr")
+        fileCopier = FileCopier(strategy='copy')
+        fileCopier.copyFiles([(self.__sourcePath, copyFilePath)])
+        self.__assertCopy(self.__sourcePath, copyFilePath)
+        self.assertFalse(os.path.samefile(self.__sourcePath, copyFilePath))
+        self.assertEqual(fileCopier.stats()['buffered'], 1)
+
+        self.assertRaises(FileCopierStrategyError, FileCopier, strategy='badStrategy')
+
+    def testTargetDirectory(self):
+        """
+        Test that a target directory (or a symlink to a directory) is not replaced.
+        """
+        targetDirectory = os.path.join(self.__dir, "directory")
+        os.mkdir(targetDirectory)
+        targetLink = os.path.join(self.__dir, "link")
+        os.symlink(targetDirectory, targetLink)
+
+        fileCopier = FileCopier()
+        for targetFilePath in (targetDirectory, targetLink):
+            self.assertRaises(
+                FileCopierTargetDirectoryError,
+                fileCopier.copyFile,
+                self.__sourcePath,
+                targetFilePath
+            )
+
+        self.assertTrue(os.path.islink(targetLink))
+        self.assertTrue(os.path.isdir(targetDirectory))
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+    def __assertCopy(self, sourceFilePath, targetFilePath):
+        """
+        Assert the target file is a copy of the source file.
+        """
+        with open(sourceFilePath, 'rb') as sourceFile:
+            with open(targetFilePath, 'rb') as targetFile:
+                self.assertEqual(sourceFile.read(), targetFile.read())
+
+        sourceStat = os.stat(sourceFilePath)
+        targetStat = os.stat(targetFilePath)
+        self.assertEqual(sourceStat.st_mode, targetStat.st_mode)
+        self.assertEqual(sourceStat.st_mtime, targetStat.st_mtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Task.Fs import FileHasher
+from centipede.Task.Fs import FileHasherAlgorithmError
+
+class FileHasherTest(BaseTestCase):
+    """Test FileHasher."""
+
+    __sourcePath = os.path.join(BaseTestCase.dataDirectory(), "test.exr")
+
+    def setUp(self):
+        """
+        Create a temporary directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__cachePath = os.path.join(self.__dir, 'cache', 'fileHasher.sqlite')
+
+    def testHash(self):
+        """
+        Test that the hash matches the hash computed over the whole contents.
+        """
+        with open(self.__sourcePath, 'rb') as sourceFile:
+            contents = sourceFile.read()
+
+        for algorithm in ['md5', 'blake2b']:
+            fileHasher = FileHasher(algorithm, self.__cachePath)
+            self.assertEqual(fileHasher.algorithm(), algorithm)
+            self.assertEqual(
+                fileHasher.hash(self.__sourcePath),
+                hashlib.new(algorithm, contents).hexdigest()
+            )
+
+        self.assertRaises(FileHasherAlgorithmError, FileHasher, 'badAlgorithm')
+
+    def testHashMany(self):
+        """
+        Test that hashing multiple files concurrently returns the hashes in the same order.
+        """
+        filePaths = list(map(
+            lambda x: os.path.join(BaseTestCase.dataDirectory(), x),
+            ['test.exr', 'test.jpg', 'test.png', 'test.exr']
+        ))
+
+        fileHasher = FileHasher('md5', self.__cachePath)
+        self.assertEqual(
+            fileHasher.hashMany(filePaths, workers=3),
+            list(map(lambda x: fileHasher.hash(x, useCache=False), filePaths))
+        )
+
+    def testCache(self):
+        """
+        Test that unchanged files are not hashed again.
+        """
+        filePath = os.path.join(self.__dir, 'test.txt')
+        with open(filePath, 'w') as testFile:
+            testFile.write('a')
+        past = time.time() - 60
+        os.utime(filePath, (past, past))
+
+        fileHasher = FileHasher('md5', self.__cachePath)
+        hashA = fileHasher.hash(filePath)
+
+        # same size and modification time
+        with open(filePath, 'w') as testFile:
+            testFile.write('b')
+        os.utime(filePath, (past, past))
+        self.assertEqual(FileHasher('md5', self.__cachePath).hash(filePath), hashA)
+        self.assertNotEqual(fileHasher.hash(filePath, useCache=False), hashA)
+
+        # different modification time
+        os.utime(filePath, (past + 1, past + 1))
+        self.assertNotEqual(fileHasher.hash(filePath), hashA)
+
+    def testUnavailableCache(self):
+        """
+        Test that the files are hashed without the cache when it cannot be created.
+        """
+        blockingFilePath = os.path.join(self.__dir, 'blocking')
+        with open(blockingFilePath, 'w') as blockingFile:
+            blockingFile.write('a')
+
+        filePath = os.path.join(BaseTestCase.dataDirectory(), 'test.png')
+        fileHasher = FileHasher('md5', os.path.join(blockingFilePath, 'cache', 'fileHasher.sqlite'))
+        self.assertEqual(
+            fileHasher.hashMany([filePath, filePath], workers=2),
+            [fileHasher.hash(filePath, useCache=False)] * 2
+        )
+        self.assertEqual(fileHasher.hash(filePath), fileHasher.hash(filePath, useCache=False))
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
 from .ChecksumTest import ChecksumTest
 from .ChmodTest import ChmodTest
 from .CopyTest import CopyTest
+from .FileCopierTest import FileCopierTest
+from .FileHasherTest import FileHasherTest
 from .RemoveTest import RemoveTest
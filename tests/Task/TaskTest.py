@@ -1,4 +1,5 @@
 import os
+import threading
 import unittest
 from ..BaseTestCase import BaseTestCase
 from centipede.Crawler.Fs import FsPath
@@ -106,6 +107,56 @@ class TaskTest(BaseTestCase):
         taskHolder2.setStatus("ignore")
         self.assertEqual(len(taskHolder.run(crawlers)), len(crawlers))
 
+    def testParallelRun(self):
+        """
+        Test that the sibling sub task holders are executed in parallel honoring dispatch.await.
+        """
+        events = []
+        barrier = threading.Barrier(2, timeout=10)
+
+        class ParallelRunTask(Task):
+            def _perform(self):
+                name = self.option('name')
+                if name in ['a', 'b']:
+                    barrier.wait()
+                events.append(name)
+
+                result = list(map(lambda x: x.clone(), self.crawlers()))
+                for crawler in result:
+                    crawler.setVar('taskName', name)
+                return result
+
+        Task.register('parallelRunTest', ParallelRunTask)
+
+        def createTaskHolder(name, awaitSiblings=False):
+            task = Task.create('parallelRunTest')
+            task.setOption('name', name)
+            if awaitSiblings:
+                task.setMetadata('dispatch.await', True)
+            return TaskHolder(task, Template("{filePath}"))
+
+        taskHolder = createTaskHolder('root')
+        subTaskHolderA = createTaskHolder('a')
+        subTaskHolderA.addSubTaskHolder(createTaskHolder('a1'))
+        taskHolder.addSubTaskHolder(subTaskHolderA)
+        taskHolder.addSubTaskHolder(createTaskHolder('c', True))
+        taskHolder.addSubTaskHolder(createTaskHolder('b'))
+        taskHolder.addSubTaskHolder(createTaskHolder('d', True))
+
+        crawlers = [FsPath.createFromPath(self.__jsonConfig)]
+        result = taskHolder.clone().run(crawlers, workers=4)
+        self.assertEqual(list(map(lambda x: x.var('taskName'), result)), ['root', 'a', 'a1', 'c', 'b', 'd'])
+        self.assertEqual(events[0], 'root')
+        self.assertEqual(events[-2:], ['c', 'd'])
+        self.assertLess(events.index('a'), events.index('a1'))
+
+        # serial execution
+        del events[:]
+        barrier = threading.Barrier(1)
+        serialResult = taskHolder.clone().run(crawlers, workers=1)
+        self.assertEqual(list(map(lambda x: x.var('taskName'), serialResult)), ['root', 'a', 'a1', 'c', 'b', 'd'])
+        self.assertEqual(events, ['root', 'a', 'a1', 'c', 'b', 'd'])
+
     def testTaskClone(self):
         """
         Test that cloning tasks works properly.
@@ -127,6 +178,49 @@ class TaskTest(BaseTestCase):
             map(lambda x: x.var('filePath'), clone.crawlers())
         )
 
+    def testTaskHolderClone(self):
+        """
+        Test that cloning task holders works properly.
+        """
+        dummyTask = Task.create('checksum')
+        dummyTask.setMetadata('match.types', ['exr', 'jpg'])
+        taskHolder = TaskHolder(dummyTask, Template("{filePath}"), Template("1"))
+        taskHolder.addVar('job', 'RND', True)
+        taskHolder.addVar('frames', [1, 2])
+        taskHolder.setStatus('bypass')
+        taskHolder.addSubTaskHolder(TaskHolder(Task.create('checksum'), Template("{filePath}")))
+        crawlers = list(map(
+            lambda x: FsPath.createFromPath(os.path.join(BaseTestCase.dataDirectory(), x)),
+            ['test.exr', 'test.jpg', 'test.png']
+        ))
+        taskHolder.addCrawlers(crawlers)
+
+        clone = taskHolder.clone()
+        self.assertEqual(clone.status(), 'bypass')
+        self.assertEqual(clone.targetTemplate().inputString(), "{filePath}")
+        self.assertEqual(clone.filterTemplate().inputString(), "1")
+        self.assertEqual(clone.crawlerMatcher().matchTypes(), ['exr', 'jpg'])
+        self.assertCountEqual(clone.varNames(), taskHolder.varNames())
+        self.assertEqual(clone.contextVarNames(), ['job'])
+        self.assertEqual(len(clone.subTaskHolders()), 1)
+        self.assertEqual(len(taskHolder.clone(includeSubTaskHolders=False).subTaskHolders()), 0)
+        self.assertEqual(
+            list(map(lambda x: x.var('filePath'), clone.task().crawlers())),
+            list(map(lambda x: x.var('filePath'), taskHolder.task().crawlers()))
+        )
+        self.assertEqual(
+            list(map(clone.task().target, clone.task().crawlers())),
+            list(map(taskHolder.task().target, taskHolder.task().crawlers()))
+        )
+
+        # changes in the clone should not affect the original task holder
+        clone.var('frames').append(3)
+        clone.task().crawlers()[0].setVar('job', 'SKY')
+        clone.task().clear()
+        self.assertEqual(taskHolder.var('frames'), [1, 2])
+        self.assertEqual(taskHolder.task().crawlers()[0].var('job'), 'RND')
+        self.assertEqual(len(taskHolder.task().crawlers()), 2)
+
     def testTaskOptions(self):
         """
         Test that task options are working properly.
@@ -189,6 +283,45 @@ class TaskTest(BaseTestCase):
         for crawler in result:
             self.assertIn('contextVarTest', crawler.contextVarNames())
 
+    def testTaskOutputSplit(self):
+        """
+        Test that tasks marked with dispatch.split are performed in chunks.
+        """
+        performedChunks = []
+
+        class SplitDummyTask(Task):
+            def __init__(self, *args, **kwargs):
+                super(SplitDummyTask, self).__init__(*args, **kwargs)
+                self.setMetadata('dispatch.split', True)
+
+            def _perform(self):
+                performedChunks.append(len(self.crawlers()))
+                return super(SplitDummyTask, self)._perform()
+
+        Task.register("splitDummy", SplitDummyTask)
+
+        dummyTask = Task.create('splitDummy')
+        for fileName in ['test.exr', 'test.jpg', 'test.png', 'test.exr', 'test.jpg']:
+            filePath = os.path.join(BaseTestCase.dataDirectory(), fileName)
+            crawler = FsPath.createFromPath(filePath)
+            crawler.setVar('contextVarTest', 1, True)
+            dummyTask.add(crawler, filePath)
+
+        expected = list(map(lambda x: x.var('filePath'), dummyTask.output(workers=1)))
+        self.assertEqual(performedChunks, [5])
+
+        del performedChunks[:]
+        result = dummyTask.output(workers=2)
+        self.assertEqual(list(map(lambda x: x.var('filePath'), result)), expected)
+        self.assertEqual(sorted(performedChunks), [2, 3])
+        for crawler in result:
+            self.assertIn('contextVarTest', crawler.contextVarNames())
+
+        del performedChunks[:]
+        dummyTask.setMetadata('dispatch.splitSize', 1)
+        self.assertEqual(list(map(lambda x: x.var('filePath'), dummyTask.output(workers=2))), expected)
+        self.assertEqual(sorted(performedChunks), [1, 2, 2])
+
     def testTaskJson(self):
         """
         Test that you can convert a Task to json and back.
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Task import Task
+from centipede.Crawler.Fs import FsPath
+
+class CreateVersionTest(BaseTestCase):
+    """Test CreateVersion."""
+
+    def setUp(self):
+        """
+        Create a temporary versions directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__versionsPath = os.path.join(self.__dir, "versions")
+        self.__configPath = os.path.join(self.__dir, "config")
+        self.__sourceFilePath = os.path.join(self.__dir, "source.txt")
+
+        os.makedirs(os.path.join(self.__versionsPath, "v001"))
+        os.makedirs(self.__configPath)
+        with open(self.__sourceFilePath, 'w') as sourceFile:
+            sourceFile.write("source")
+
+    def testVersion(self):
+        """
+        Test that the version is created under the target path.
+        """
+        createVersion = self.__createVersion("v002")
+        createVersion.output()
+        self.assertEqual(createVersion.version(), 2)
+        self.assertEqual(createVersion.versionPath(), os.path.join(self.__versionsPath, "v002"))
+        self.assertTrue(os.path.isfile(os.path.join(self.__versionsPath, "v002", "info.json")))
+
+    def testVersionTaken(self):
+        """
+        Test that the next free version is reserved when the target version has been taken.
+        """
+        createVersion = self.__createVersion("v001")
+        self.assertEqual(createVersion.version(), 1)
+
+        result = createVersion.output()
+        self.assertEqual(createVersion.version(), 2)
+        self.assertEqual(createVersion.versionName(), "v002")
+        self.assertEqual(createVersion.dataPath(), os.path.join(self.__versionsPath, "v002", "data"))
+        self.assertTrue(os.path.isfile(os.path.join(self.__versionsPath, "v002", "info.json")))
+        self.assertEqual(os.listdir(os.path.join(self.__versionsPath, "v001")), [])
+
+        for crawler in result:
+            self.assertEqual(crawler.var('version'), 2)
+            self.assertEqual(crawler.var('versionPath'), createVersion.versionPath())
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+    def __createVersion(self, versionName):
+        """
+        Return a createVersion task targeting the version name.
+        """
+        crawler = FsPath.createFromPath(self.__sourceFilePath)
+        crawler.setVar('configPath', self.__configPath)
+
+        createVersion = Task.create('createVersion')
+        createVersion.add(crawler, os.path.join(self.__versionsPath, versionName))
+
+        return createVersion
+
+
+if __name__ == "__main__":
+    unittest.main()
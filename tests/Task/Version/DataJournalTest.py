@@ -0,0 +1,128 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import threading
+from ...BaseTestCase import BaseTestCase
+from centipede.Task.Version import DataJournal
+from centipede.Task.Version import CreateData
+
+class DataJournalTest(BaseTestCase):
+    """Test DataJournal."""
+
+    def setUp(self):
+        """
+        Create a temporary directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        self.__jsonFilePath = os.path.join(self.__dir, "data.json")
+
+    def testAppendAndCompact(self):
+        """
+        Test that the journal entries are merged into the json file.
+        """
+        with open(self.__jsonFilePath, 'w') as jsonFile:
+            json.dump({'a': 1, 'b': 1}, jsonFile)
+
+        dataJournal = DataJournal(self.__jsonFilePath)
+        self.assertEqual(dataJournal.journalFilePath(), os.path.join(self.__dir, "data.jsonl"))
+
+        dataJournal.append({'b': 2})
+        dataJournal.append({'c': 3})
+        self.assertEqual(len(dataJournal.entries()), 2)
+        self.assertEqual(dataJournal.read(), {'a': 1, 'b': 2, 'c': 3})
+
+        # incomplete lines (interrupted writers) are ignored
+        with open(dataJournal.journalFilePath(), 'a') as journalFile:
+            journalFile.write('{"d": ')
+        self.assertEqual(dataJournal.read(), {'a': 1, 'b': 2, 'c': 3})
+
+        dataJournal.compact()
+        self.assertFalse(os.path.exists(dataJournal.journalFilePath()))
+        with open(self.__jsonFilePath) as jsonFile:
+            self.assertEqual(json.load(jsonFile), {'a': 1, 'b': 2, 'c': 3})
+
+    def testLockFile(self):
+        """
+        Test that the lock file does not remain once the journal is compacted.
+        """
+        dataJournal = DataJournal(self.__jsonFilePath)
+        dataJournal.append({'a': 1})
+        self.assertTrue(os.path.exists(dataJournal.lockFilePath()))
+
+        with dataJournal.lock():
+            dataJournal.compact()
+            self.assertTrue(os.path.exists(dataJournal.lockFilePath()))
+        self.assertFalse(os.path.exists(dataJournal.lockFilePath()))
+
+        # the lock can be taken again afterwards
+        dataJournal.append({'b': 2})
+        dataJournal.compact()
+        self.assertFalse(os.path.exists(dataJournal.lockFilePath()))
+        self.assertEqual(os.listdir(self.__dir), ["data.json"])
+        self.assertEqual(dataJournal.read(), {'a': 1, 'b': 2})
+
+    def testConcurrentWriters(self):
+        """
+        Test that concurrent writers do not lose entries.
+        """
+        def writer(index):
+            dataJournal = DataJournal(self.__jsonFilePath)
+            for entryIndex in range(20):
+                with dataJournal.lock():
+                    dataJournal.append({'{}_{}'.format(index, entryIndex): index})
+
+        threads = list(map(lambda x: threading.Thread(target=writer, args=(x,)), range(8)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        dataJournal = DataJournal(self.__jsonFilePath)
+        dataJournal.compact()
+        self.assertEqual(len(dataJournal.read()), 8 * 20)
+
+    def testConcurrentCompact(self):
+        """
+        Test that removing the lock file on compact does not lose entries.
+        """
+        def writer(index):
+            dataJournal = DataJournal(self.__jsonFilePath)
+            for entryIndex in range(20):
+                dataJournal.append({'{}_{}'.format(index, entryIndex): index})
+                dataJournal.compact()
+
+        threads = list(map(lambda x: threading.Thread(target=writer, args=(x,)), range(4)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        dataJournal = DataJournal(self.__jsonFilePath)
+        self.assertEqual(len(dataJournal.read()), 4 * 20)
+        self.assertFalse(os.path.exists(dataJournal.lockFilePath()))
+
+    def testInfoJournal(self):
+        """
+        Test that the size is accumulated while the info already published takes precedence.
+        """
+        infoJournal = CreateData.infoJournal(self.__dir)
+        infoJournal.append({'size': 10, 'user': 'a'})
+        infoJournal.append({'size': 5, 'user': 'b', 'version': 1})
+        self.assertEqual(infoJournal.read(), {'size': 15, 'user': 'a', 'version': 1})
+
+        CreateData.compactJournals(self.__dir)
+        with open(os.path.join(self.__dir, "info.json")) as jsonFile:
+            self.assertEqual(json.load(jsonFile), {'size': 15, 'user': 'a', 'version': 1})
+        self.assertEqual(os.listdir(self.__dir), ["info.json"])
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from ...BaseTestCase import BaseTestCase
+from centipede.Crawler.Fs import FsPath
+from centipede.Task.Version.VersionManifest import VersionManifest
+from centipede.Task.Version.VersionManifest import VersionManifestFileNotFoundError
+
+class VersionManifestTest(BaseTestCase):
+    """Test VersionManifest."""
+
+    def setUp(self):
+        """
+        Create a temporary data directory used by the tests.
+        """
+        self.__rootPath = tempfile.mkdtemp()
+        self.__dataPath = os.path.join(self.__rootPath, "data")
+        self.__filePaths = []
+
+        for directory in ["renders", os.path.join("renders", "beauty"), "scenes"]:
+            os.makedirs(os.path.join(self.__dataPath, directory))
+            for index in range(3):
+                filePath = os.path.join(self.__dataPath, directory, "file{}.exr".format(index))
+                with open(filePath, 'w') as dataFile:
+                    dataFile.write("data" * index)
+                self.__filePaths.append(filePath)
+
+    def testData(self):
+        """
+        Test the data and total size built from the manifest.
+        """
+        versionManifest = VersionManifest()
+        versionManifest.collectStats(self.__filePaths, workers=4)
+        for filePath in self.__filePaths:
+            versionManifest.addFile(filePath, {'sourceVersion': 1})
+
+        self.assertEqual(versionManifest.files(), self.__filePaths)
+        self.assertEqual(versionManifest.totalSize(), sum(map(lambda x: os.stat(x).st_size, self.__filePaths)))
+        self.assertEqual(versionManifest.fileStat(self.__filePaths[1]).st_size, 4)
+
+        data = versionManifest.data(self.__rootPath)
+        self.assertEqual(
+            data[os.path.join("data", "scenes", "file2.exr")],
+            {'sourceVersion': 1, 'size': 8, 'type': 'exr'}
+        )
+
+        # the metadata is not shared implicitly
+        versionManifest.fileMetadata(self.__filePaths[0])['type'] = 'other'
+        self.assertEqual(versionManifest.fileMetadata(self.__filePaths[0])['type'], 'exr')
+        self.assertRaises(VersionManifestFileNotFoundError, versionManifest.fileMetadata, '/badFile.exr')
+
+    def testCrawlers(self):
+        """
+        Test that the crawlers built from the manifest match the ones returned by a glob.
+        """
+        versionManifest = VersionManifest()
+        for filePath in self.__filePaths:
+            versionManifest.addFile(filePath)
+
+        crawlers = versionManifest.crawlers(self.__dataPath)
+        expectedCrawlers = FsPath.createFromPath(self.__dataPath).glob()
+        self.assertEqual(
+            list(map(lambda x: x.var('filePath'), crawlers)),
+            sorted(map(lambda x: x.var('filePath'), expectedCrawlers), key=lambda x: x.split(os.sep))
+        )
+
+        expectedCrawlers = dict(map(lambda x: (x.var('filePath'), x), expectedCrawlers))
+        for crawler in crawlers:
+            expectedCrawler = expectedCrawlers[crawler.var('filePath')]
+            self.assertIs(type(crawler), type(expectedCrawler))
+            self.assertEqual(json.loads(crawler.toJson()), json.loads(expectedCrawler.toJson()))
+
+    def testDescribes(self):
+        """
+        Test that entries written to the data directory without the manifest are detected.
+        """
+        versionManifest = VersionManifest()
+        for filePath in self.__filePaths:
+            versionManifest.addFile(filePath)
+        self.assertTrue(versionManifest.describes(self.__dataPath))
+
+        # file not added to the manifest
+        extraFilePath = os.path.join(self.__dataPath, "renders", "extra.exr")
+        open(extraFilePath, 'w').close()
+        self.assertFalse(versionManifest.describes(self.__dataPath))
+        versionManifest.addFile(extraFilePath)
+        self.assertTrue(versionManifest.describes(self.__dataPath))
+
+        # empty directory
+        os.mkdir(os.path.join(self.__dataPath, "empty"))
+        self.assertFalse(versionManifest.describes(self.__dataPath))
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__rootPath)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,3 @@
+from .DataJournalTest import DataJournalTest
+from .VersionManifestTest import VersionManifestTest
+from .CreateVersionTest import CreateVersionTest
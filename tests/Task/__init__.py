@@ -2,4 +2,5 @@ from . import Fs
 from . import Image
 from . import ImageSequence
 from . import Video
+from . import Version
 from .TaskTest import TaskTest
@@ -0,0 +1,77 @@
+import unittest
+from ..BaseTestCase import BaseTestCase
+from centipede.Template import Template
+from centipede.TemplateProcedure import TemplateProcedure
+
+class TemplateProcedureTest(BaseTestCase):
+    """Test TemplateProcedure."""
+
+    def testPurity(self):
+        """
+        Test that the procedures are registered with the expected purity.
+        """
+        self.assertEqual(TemplateProcedure.purity('pad'), 'pure')
+        self.assertEqual(TemplateProcedure.purity('newver'), 'stable')
+
+        TemplateProcedure.register('templateProcedureTestStable', lambda: 'a')
+        self.assertEqual(TemplateProcedure.purity('templateProcedureTestStable'), 'stable')
+
+    def testPureCache(self):
+        """
+        Test that the results of pure procedures are shared between templates.
+        """
+        calls = []
+
+        def procedure(value):
+            calls.append(value)
+            return value.upper()
+
+        TemplateProcedure.register('templateProcedureTestPure', procedure, 'pure')
+        initialCacheStats = TemplateProcedure.cacheStats()
+        firstTemplate = Template('(templateProcedureTestPure {value})')
+        secondTemplate = Template('/tmp/(templateProcedureTestPure {value})')
+
+        self.assertEqual(firstTemplate.value({'value': 'a'}), 'A')
+        self.assertEqual(secondTemplate.value({'value': 'a'}), '/tmp/A')
+        self.assertEqual(secondTemplate.value({'value': 'b'}), '/tmp/B')
+        self.assertEqual(calls, ['a', 'b'])
+
+        cacheStats = TemplateProcedure.cacheStats()
+        self.assertEqual(cacheStats['hits'] - initialCacheStats['hits'], 1)
+        self.assertEqual(cacheStats['misses'] - initialCacheStats['misses'], 2)
+
+        # registering the procedure again only drops its own results (keeping the stats)
+        TemplateProcedure.run('pad', '1', '4')
+        cacheStats = TemplateProcedure.cacheStats()
+        TemplateProcedure.register('templateProcedureTestPure', procedure, 'pure')
+        self.assertEqual(TemplateProcedure.cacheStats()['hits'], cacheStats['hits'])
+        self.assertEqual(TemplateProcedure.cacheStats()['size'], cacheStats['size'] - 2)
+        self.assertEqual(secondTemplate.value({'value': 'a'}), '/tmp/A')
+        self.assertEqual(calls, ['a', 'b', 'a'])
+
+        TemplateProcedure.clearCache()
+        self.assertEqual(TemplateProcedure.cacheStats(), {'hits': 0, 'misses': 0, 'size': 0})
+
+    def testVolatile(self):
+        """
+        Test that volatile procedures are evaluated every time.
+        """
+        calls = []
+
+        def procedure():
+            calls.append(None)
+            return len(calls)
+
+        TemplateProcedure.register('templateProcedureTestVolatile', procedure, 'volatile')
+        template = Template('(templateProcedureTestVolatile)')
+        self.assertEqual(template.value(), '1')
+        self.assertEqual(template.value(), '2')
+
+        TemplateProcedure.register('templateProcedureTestVolatile', procedure)
+        template = Template('(templateProcedureTestVolatile)')
+        self.assertEqual(template.value(), '3')
+        self.assertEqual(template.value(), '3')
+
+
+if __name__ == "__main__":
+    unittest.main()
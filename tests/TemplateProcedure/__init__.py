@@ -3,5 +3,6 @@ from .ImageSequenceTest import ImageSequenceTest
 from .MathTest import MathTest
 from .PathTest import PathTest
 from .SystemTest import SystemTest
+from .TemplateProcedureTest import TemplateProcedureTest
 from .TextTest import TextTest
 from .VersionTest import VersionTest
@@ -5,6 +5,7 @@ from centipede.Template import Template
 from centipede.Template import RequiredPathNotFoundError
 from centipede.Template import VariableNotFoundError
 from centipede.Crawler.Fs import FsPath
+from centipede.TemplateProcedure import TemplateProcedure
 
 class TemplateTest(BaseTestCase):
     """Test Template crawler."""
@@ -43,6 +44,71 @@ class TemplateTest(BaseTestCase):
         variables['var'] = 'test'
         self.assertEqual(Template('{var}').value(variables), 'test')
 
+    def testTemplateVarNames(self):
+        """
+        Test that the variable names are detected once per name.
+        """
+        template = Template('{prefix}/{name}/{name}.(pad {frame} 4).{ext}')
+        self.assertEqual(sorted(template.varNames()), ['ext', 'frame', 'name', 'prefix'])
+
+        template.setInputString('/tmp/{shot}')
+        self.assertEqual(template.varNames(), ['shot'])
+
+    def testTemplateTokensFromVariables(self):
+        """
+        Test that the special tokens coming from variables are not evaluated.
+        """
+        variables = {'a': '(pad 1 4)', 'b': '/!badPath', 'c': '<parent>'}
+        self.assertEqual(Template('/tmp/{a}{b}/{c}').value(variables), '/tmp/(pad 1 4)/!badPath/<parent>')
+        self.assertEqual(Template('(pad {a} 4)').value({'a': 5}), '0005')
+
+        # mixed with a required path level written in the template
+        self.assertEqual(
+            Template('{prefix}/!glob/{b}/c{b}').value({'prefix': BaseTestCase.dataDirectory(), 'b': 'x/!y'}),
+            '{}/glob/x/!y/cx/!y'.format(BaseTestCase.dataDirectory())
+        )
+
+    def testTemplateParent(self):
+        """
+        Test that the parent token passes the value computed before the procedure.
+        """
+        TemplateProcedure.register('templateTestUpper', lambda *args: ' '.join(args).upper())
+
+        value = '{}/!glob/(templateTestUpper <parent>)'.format(BaseTestCase.dataDirectory())
+        result = Template(value).value()
+        parentPath = os.path.join(BaseTestCase.dataDirectory(), 'glob') + '/'
+        self.assertEqual(result, parentPath + parentPath.upper())
+
+    def testTemplateCompiledOnce(self):
+        """
+        Test that templates with the same input string produce the same values.
+        """
+        value = '/tmp/{shot}/(pad {frame} 4)'
+        first = Template(value)
+        second = Template(value)
+        for frame in range(3):
+            variables = {'shot': 'SHT0010', 'frame': frame}
+            self.assertEqual(first.value(variables), '/tmp/SHT0010/000{}'.format(frame))
+            self.assertEqual(second.value(variables), first.value(variables))
+
+    def testTemplateValuesFromCrawlers(self):
+        """
+        Test that the values computed for a list of crawlers match the values computed per crawler.
+        """
+        parentCrawler = FsPath.createFromPath(BaseTestCase.dataDirectory())
+        crawlers = []
+        for frame in range(1001, 1006):
+            filePath = os.path.join(BaseTestCase.dataDirectory(), 'RND_plate.{}.exr'.format(frame))
+            crawlers.append(FsPath.createFromPath(filePath, 'exr', parentCrawler))
+
+        template = Template('{prefix}/!glob/(dirname {filePath})/{name}.(pad {frame} 6).{ext}')
+        variables = {'prefix': BaseTestCase.dataDirectory()}
+        self.assertEqual(
+            template.valuesFromCrawlers(crawlers, variables),
+            list(map(lambda x: template.valueFromCrawler(x, variables), crawlers))
+        )
+        self.assertEqual(template.valuesFromCrawlers([], variables), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+import threading
+from .BaseTestCase import BaseTestCase
+from centipede import VersionIndex
+from centipede.TemplateProcedure import TemplateProcedure
+
+class VersionIndexTest(BaseTestCase):
+    """Test VersionIndex."""
+
+    def setUp(self):
+        """
+        Create a temporary versions directory used by the tests.
+        """
+        self.__dir = tempfile.mkdtemp()
+        for version in ["v001", "v002", "v010", "v1000", "other"]:
+            os.mkdir(os.path.join(self.__dir, version))
+        self.__touch()
+
+    def testLatest(self):
+        """
+        Test that the latest version is cached until the directory gets modified.
+        """
+        versionIndex = VersionIndex()
+        self.assertEqual(versionIndex.latest(self.__dir), 10)
+        self.assertEqual(versionIndex.latest(self.__dir), 10)
+        self.assertEqual(versionIndex.stats(), {'hits': 1, 'listed': 1})
+
+        os.mkdir(os.path.join(self.__dir, "v011"))
+        self.__touch(30)
+        self.assertEqual(versionIndex.latest(self.__dir), 11)
+        self.assertEqual(versionIndex.stats(), {'hits': 1, 'listed': 2})
+
+        self.assertEqual(versionIndex.latest(os.path.join(self.__dir, "nonExisting")), 0)
+
+    def testReserve(self):
+        """
+        Test that concurrent reservations never get the same version.
+        """
+        versionIndex = VersionIndex()
+        result = []
+
+        def reserve():
+            for _ in range(5):
+                result.append(versionIndex.reserve(self.__dir))
+
+        threads = list(map(lambda x: threading.Thread(target=reserve), range(4)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(result), list(range(11, 31)))
+        self.assertTrue(os.path.isdir(os.path.join(self.__dir, "v030")))
+
+        newVersionsPath = os.path.join(self.__dir, "new", "versions")
+        self.assertEqual(versionIndex.reserve(newVersionsPath), 1)
+        self.assertEqual(
+            TemplateProcedure.run("newver", newVersionsPath),
+            "v002"
+        )
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+        shutil.rmtree(self.__dir)
+
+    def __touch(self, seconds=60):
+        """
+        Set the modification time of the versions directory to the past.
+        """
+        past = time.time() - seconds
+        os.utime(self.__dir, (past, past))
+
+
+if __name__ == "__main__":
+    unittest.main()
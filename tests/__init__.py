@@ -1,5 +1,9 @@
 from .BaseTestCase import BaseTestCase
 from .TemplateTest import TemplateTest
+from .CrawlerMatcherTest import CrawlerMatcherTest
+from .CrawlerQueryPlannerTest import CrawlerQueryPlannerTest
+from .VersionIndexTest import VersionIndexTest
+from .FrameRangesTest import FrameRangesTest
 from . import Crawler
 from . import TemplateProcedure
 from . import Task